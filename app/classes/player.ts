@@ -62,6 +62,7 @@ const TEAM_VS_PITCHER_SPLITS_PERCENTILES_TABLE = 'team_vs_pitcher_splits_percent
 const TEAM_VS_BATTER_SPLITS_PERCENTILES_TABLE = 'team_vs_batter_splits_percentiles';
 const PLAYER_VALUE_SNAPSHOTS_TABLE = 'player_value_snapshots';
 const PLAYER_VALUE_SNAPSHOT_COMPONENTS_TABLE = 'player_value_snapshot_components';
+const PLAYER_VALUE_SNAPSHOT_CHECKPOINTS_TABLE = 'player_value_snapshot_checkpoints';
 const TEAM_VALUE_SNAPSHOT_CATEGORY_TOTALS_TABLE = 'team_value_snapshot_category_totals';
 const TEAM_VALUE_SNAPSHOT_POSITION_TOTALS_TABLE = 'team_value_snapshot_position_totals';
 const PLAYER_GAME_LOGS_TABLE = 'player_game_logs';
@@ -1064,13 +1065,22 @@ class Player {
                 AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.span_days = ?
                 AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.split_type = 'overall'
                 AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.position = 'P'
+                AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.is_removed = 0
+                -- Snapshots are stored as deltas: each player's latest row since the slice's last checkpoint
                 AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.as_of_date = (
-                    SELECT MAX(as_of_date)
-                    FROM ${PLAYER_VALUE_SNAPSHOTS_TABLE}
-                    WHERE model_id = ?
-                    AND span_days = ?
-                    AND split_type = 'overall'
-                    AND position = 'P'
+                    SELECT MAX(latest.as_of_date)
+                    FROM ${PLAYER_VALUE_SNAPSHOTS_TABLE} latest
+                    WHERE latest.model_id = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.model_id
+                    AND latest.player_pk = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.player_pk
+                    AND latest.span_days = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.span_days
+                    AND latest.split_type = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.split_type
+                )
+                AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.as_of_date >= (
+                    SELECT MAX(ck.as_of_date)
+                    FROM ${PLAYER_VALUE_SNAPSHOT_CHECKPOINTS_TABLE} ck
+                    WHERE ck.model_id = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.model_id
+                    AND ck.span_days = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.span_days
+                    AND ck.split_type = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.split_type
                 )
             LEFT JOIN ${PLAYER_VALUE_SNAPSHOT_COMPONENTS_TABLE} ${PLAYER_VALUE_SNAPSHOT_COMPONENTS_TABLE_ALIAS}
                 ON ${PLAYER_VALUE_SNAPSHOT_COMPONENTS_TABLE_ALIAS}.player_pk = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.player_pk
@@ -1080,7 +1090,7 @@ class Player {
                 AND ${PLAYER_VALUE_SNAPSHOT_COMPONENTS_TABLE_ALIAS}.as_of_date = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.as_of_date
             WHERE ${PLAYERS_TABLE_ALIAS}.team_id = ?
             ORDER BY ${PLAYERS_TABLE_ALIAS}.id, ${PLAYER_VALUE_SNAPSHOT_COMPONENTS_TABLE_ALIAS}.category_code;
-            `, [modelId, spanDays, modelId, spanDays, teamId]);
+            `, [modelId, spanDays, teamId]);
 
         const pitcherScoringCategoryStats = this.flattenScoringCategoryStatsForPlayers(pitcherScoringCategoryValues) as unknown as PitcherScoringCategoryStats[];
 
@@ -1118,13 +1128,22 @@ class Player {
                 AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.span_days = ?
                 AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.split_type = 'overall'
                 AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.position = 'B'
+                AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.is_removed = 0
+                -- Snapshots are stored as deltas: each player's latest row since the slice's last checkpoint
                 AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.as_of_date = (
-                    SELECT MAX(as_of_date)
-                    FROM ${PLAYER_VALUE_SNAPSHOTS_TABLE}
-                    WHERE model_id = ?
-                    AND span_days = ?
-                    AND split_type = 'overall'
-                    AND position = 'B'
+                    SELECT MAX(latest.as_of_date)
+                    FROM ${PLAYER_VALUE_SNAPSHOTS_TABLE} latest
+                    WHERE latest.model_id = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.model_id
+                    AND latest.player_pk = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.player_pk
+                    AND latest.span_days = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.span_days
+                    AND latest.split_type = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.split_type
+                )
+                AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.as_of_date >= (
+                    SELECT MAX(ck.as_of_date)
+                    FROM ${PLAYER_VALUE_SNAPSHOT_CHECKPOINTS_TABLE} ck
+                    WHERE ck.model_id = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.model_id
+                    AND ck.span_days = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.span_days
+                    AND ck.split_type = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.split_type
                 )
             LEFT JOIN ${PLAYER_VALUE_SNAPSHOT_COMPONENTS_TABLE} ${PLAYER_VALUE_SNAPSHOT_COMPONENTS_TABLE_ALIAS}
                 ON ${PLAYER_VALUE_SNAPSHOT_COMPONENTS_TABLE_ALIAS}.player_pk = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.player_pk
@@ -1134,7 +1153,7 @@ class Player {
                 AND ${PLAYER_VALUE_SNAPSHOT_COMPONENTS_TABLE_ALIAS}.as_of_date = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.as_of_date
             WHERE ${PLAYERS_TABLE_ALIAS}.team_id = ?
             ORDER BY ${PLAYERS_TABLE_ALIAS}.id, ${PLAYER_VALUE_SNAPSHOT_COMPONENTS_TABLE_ALIAS}.category_code;
-            `, [modelId, spanDays, modelId, spanDays, teamId]);
+            `, [modelId, spanDays, teamId]);
 
         const hitterScoringCategoryStats = this.flattenScoringCategoryStatsForPlayers(hitterScoringCategoryValues) as unknown as HitterScoringCategoryStats[];
 
@@ -1174,12 +1193,22 @@ class Player {
                 AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.model_id = ?
                 AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.span_days = ?
                 AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.split_type = 'overall'
+                AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.is_removed = 0
+                -- Snapshots are stored as deltas: each player's latest row since the slice's last checkpoint
                 AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.as_of_date = (
-                    SELECT MAX(as_of_date)
-                    FROM ${PLAYER_VALUE_SNAPSHOTS_TABLE}
-                    WHERE model_id = ?
-                    AND span_days = ?
-                    AND split_type = 'overall'
+                    SELECT MAX(latest.as_of_date)
+                    FROM ${PLAYER_VALUE_SNAPSHOTS_TABLE} latest
+                    WHERE latest.model_id = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.model_id
+                    AND latest.player_pk = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.player_pk
+                    AND latest.span_days = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.span_days
+                    AND latest.split_type = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.split_type
+                )
+                AND ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.as_of_date >= (
+                    SELECT MAX(ck.as_of_date)
+                    FROM ${PLAYER_VALUE_SNAPSHOT_CHECKPOINTS_TABLE} ck
+                    WHERE ck.model_id = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.model_id
+                    AND ck.span_days = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.span_days
+                    AND ck.split_type = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.split_type
                 )
             LEFT JOIN ${PLAYER_VALUE_SNAPSHOT_COMPONENTS_TABLE} ${PLAYER_VALUE_SNAPSHOT_COMPONENTS_TABLE_ALIAS}
                 ON ${PLAYER_VALUE_SNAPSHOT_COMPONENTS_TABLE_ALIAS}.player_pk = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.player_pk
@@ -1189,7 +1218,7 @@ class Player {
                 AND ${PLAYER_VALUE_SNAPSHOT_COMPONENTS_TABLE_ALIAS}.as_of_date = ${PLAYER_VALUE_SNAPSHOTS_TABLE_ALIAS}.as_of_date
             WHERE ${PLAYERS_TABLE_ALIAS}.id IN (?)
             ORDER BY ${PLAYERS_TABLE_ALIAS}.id, ${PLAYER_VALUE_SNAPSHOT_COMPONENTS_TABLE_ALIAS}.category_code;
-            `, [modelId, spanDays, modelId, spanDays, playerIds]);
+            `, [modelId, spanDays, playerIds]);
 
         const playerScoringCategoryStats = this.flattenScoringCategoryStatsForPlayers(playerScoringCategoryValues) as unknown as PlayerScoringCategoryStats[];
 
@@ -0,0 +1 @@
+ALTER TABLE player_advanced_rolling_stats ADD COLUMN pa INT DEFAULT 0 AFTER ip;
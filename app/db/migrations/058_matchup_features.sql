@@ -0,0 +1,33 @@
+CREATE TABLE IF NOT EXISTS pitcher_matchup_features (
+  player_id INT NOT NULL,
+  season_year SMALLINT NOT NULL,
+  split_type VARCHAR(10) NOT NULL,
+  span_days INT NOT NULL,
+  games INT,
+  ip DECIMAL(5,2),
+  qs INT,
+  nrfi INT,
+  fip_minus_pct DECIMAL(5,2),
+  k_pct_pct DECIMAL(5,2),
+  bb_pct_pct DECIMAL(5,2),
+  hr_per_9_pct DECIMAL(5,2),
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (player_id, season_year, split_type, span_days),
+  INDEX idx_pmf_season_span_split (season_year, span_days, split_type)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS team_matchup_features (
+  team VARCHAR(10) NOT NULL,
+  season_year SMALLINT NOT NULL,
+  split_type VARCHAR(10) NOT NULL,
+  span_days INT NOT NULL,
+  avg_runs_scored_pct DECIMAL(5,2),
+  nrfi_pct DECIMAL(5,2),
+  -- Offense against pitchers of the split's hand (vs_lhp / vs_rhp rows only)
+  vs_hand_ops_pct DECIMAL(5,2),
+  vs_hand_so_rate_pct DECIMAL(5,2),
+  vs_hand_nrfi_pct DECIMAL(5,2),
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+  PRIMARY KEY (team, season_year, split_type, span_days),
+  INDEX idx_tmf_season_span_split (season_year, span_days, split_type)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
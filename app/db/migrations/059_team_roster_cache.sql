@@ -0,0 +1,7 @@
+CREATE TABLE IF NOT EXISTS team_roster_cache (
+  team VARCHAR(10) PRIMARY KEY,
+  etag VARCHAR(255),
+  payload MEDIUMTEXT NOT NULL,
+  fetched_at DATETIME NOT NULL,
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
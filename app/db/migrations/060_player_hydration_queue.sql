@@ -0,0 +1,19 @@
+CREATE TABLE IF NOT EXISTS player_hydration_queue (
+  player_id INT PRIMARY KEY,
+  reason VARCHAR(20) NOT NULL,
+  enqueued_at DATETIME NOT NULL
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+-- Seed with everything the old full-table stale checks would have picked up
+INSERT IGNORE INTO player_hydration_queue (player_id, reason, enqueued_at)
+SELECT DISTINCT pl.player_id, 'incomplete', NOW()
+FROM player_lookup pl
+WHERE pl.status IS NULL OR pl.status IN ('', 'unknown', 'N/A', 'Unk')
+   OR pl.bats IS NULL OR pl.bats IN ('', 'unknown', 'N/A', 'Unk')
+   OR pl.throws IS NULL OR pl.throws IN ('', 'unknown', 'N/A', 'Unk');
+
+INSERT IGNORE INTO player_hydration_queue (player_id, reason, enqueued_at)
+SELECT DISTINCT pgl.player_id, 'unknown', NOW()
+FROM player_game_logs pgl
+LEFT JOIN player_lookup pl ON pgl.player_id = pl.player_id AND (pgl.position <=> pl.position)
+WHERE pl.id IS NULL;
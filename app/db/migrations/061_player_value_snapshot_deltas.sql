@@ -0,0 +1,18 @@
+-- Player value snapshots are stored as deltas: a player's totals + components rows are only written on the
+-- as_of_date their values change, and a tombstone (is_removed = 1) is written when they drop out of a slice.
+-- A snapshot for any date is each player's latest row on or before it, starting from the latest checkpoint.
+ALTER TABLE player_value_snapshots ADD COLUMN is_removed TINYINT(1) NOT NULL DEFAULT 0 AFTER risk_score;
+
+CREATE TABLE IF NOT EXISTS player_value_snapshot_checkpoints (
+  model_id INT NOT NULL,
+  span_days INT NOT NULL,
+  split_type VARCHAR(10) NOT NULL,
+  as_of_date DATE NOT NULL,               -- every live player has a row on this date
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  PRIMARY KEY (model_id, span_days, split_type, as_of_date)
+);
+
+-- Every snapshot written before this migration was a full one
+INSERT IGNORE INTO player_value_snapshot_checkpoints (model_id, span_days, split_type, as_of_date)
+SELECT DISTINCT model_id, span_days, split_type, as_of_date
+FROM player_value_snapshots;
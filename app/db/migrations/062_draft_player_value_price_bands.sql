@@ -0,0 +1,5 @@
+-- Simulated auction price bands (10th/50th/90th percentile); NULL when values were computed without simulation
+ALTER TABLE draft_player_values
+  ADD COLUMN price_p10 DECIMAL(10,2) NULL AFTER est_max_auction_value,
+  ADD COLUMN price_p50 DECIMAL(10,2) NULL AFTER price_p10,
+  ADD COLUMN price_p90 DECIMAL(10,2) NULL AFTER price_p50;
@@ -0,0 +1,5 @@
+-- Season-scoped archive for `sync_game_logs.py --season-backfill`. Same shape as the live game-log tables, but
+-- outside the MAX_AGE_DAYS retention, so a rebuilt season survives the next regular sync.
+CREATE TABLE IF NOT EXISTS player_game_logs_archive LIKE player_game_logs;
+CREATE TABLE IF NOT EXISTS team_game_logs_archive LIKE team_game_logs;
+CREATE TABLE IF NOT EXISTS game_pitchers_archive LIKE game_pitchers;
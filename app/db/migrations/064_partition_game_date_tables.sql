@@ -0,0 +1,11 @@
+-- Range-partition the game_date keyed tables whose unique keys already include game_date, so retention can
+-- DROP PARTITION instead of deleting row by row. GameLogPartitions splits p_future into dated partitions at sync time.
+-- player_game_logs and game_pitchers stay unpartitioned: their upsert keys are per game_id, and MySQL would
+-- require adding game_date to them, turning a resumed or rescheduled game into a second row.
+ALTER TABLE team_game_logs
+  PARTITION BY RANGE COLUMNS(game_date) (PARTITION p_future VALUES LESS THAN (MAXVALUE));
+
+-- id stays unique on its own (AUTO_INCREMENT); upserts key on unique_game_team, which already includes game_date
+ALTER TABLE probable_pitchers DROP PRIMARY KEY, ADD PRIMARY KEY (id, game_date);
+ALTER TABLE probable_pitchers
+  PARTITION BY RANGE COLUMNS(game_date) (PARTITION p_future VALUES LESS THAN (MAXVALUE));
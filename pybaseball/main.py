@@ -9,13 +9,16 @@ scripts = {
     "yahoo_player_data": "services/sync_yahoo_player_data.py",
     "compute_auction_valuations": "services/compute_player_values_for_drafts.py",
     "compute_player_value_snapshots": "services/compute_player_value_snapshots.py",
+    "checkpoint_player_value_snapshots": "services/checkpoint_player_value_snapshots.py",
+    "update_draft_supply": "services/update_draft_supply.py",
     "backfill_lookup_position_team": "services/backfill_lookup_position_team.py",
+    "verify_indexes": "services/verify_indexes.py",
     "all": "sync_all.py"
 }
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python main.py [game_logs|probable_pitchers|compute_stats|season_stats|yahoo_player_data|compute_auction_valuations|compute_player_value_snapshots|all] [--force]")
+        print("Usage: python main.py [game_logs|probable_pitchers|compute_stats|season_stats|yahoo_player_data|compute_auction_valuations|compute_player_value_snapshots|checkpoint_player_value_snapshots|update_draft_supply|backfill_lookup_position_team|verify_indexes|all] [--force]")
         sys.exit(1)
 
     key = sys.argv[1]
@@ -1,11 +1,12 @@
-import requests
 from urllib.parse import urlencode
+from models.api.http_client import HttpClient
 
 class EspnApi:
     BASE_URL = "https://site.api.espn.com/apis/site/v2/sports/baseball/mlb/scoreboard"
+    TIMEOUT = 20
 
     def __init__(self):
-        self.session = requests.Session()
+        self.http_client = HttpClient('espn_api', self.TIMEOUT)
 
     def request(self, params: dict) -> list[dict]:
         url = f"{self.BASE_URL}"
@@ -16,7 +17,8 @@ class EspnApi:
         if params:
             url += "?" + urlencode(params, doseq=True)
 
-        response = self.session.get(url, headers=headers)
+        response = self.http_client.get(url, headers=headers)
+        response.raise_for_status()
         return response.json()
     
     def get_probable_pitchers(self, start_date: str, end_date: str) -> list[dict]:
@@ -1,21 +1,23 @@
 import requests
 from datetime import datetime
+from models.api.http_client import HttpClient
 from utils.logger import logger
 from utils.constants import SEASON_START_DATE, SEASON_END_DATE, CURRENT_SEASON
 
 class FangraphsApi:
     BASE_URL = 'https://www.fangraphs.com/api/leaders/'
+    TIMEOUT = 60
 
     def __init__(self):
-        self.session = requests.Session()
+        self.http_client = HttpClient('fangraphs_api', self.TIMEOUT)
 
     def request(self, method: str, endpoint: str, headers: dict, params: dict) -> dict:
         try:
             logger.info(f"Fetching data from Fangraphs: {self.BASE_URL + endpoint}")
             if method == 'POST':
-                response = self.session.post(self.BASE_URL + endpoint, headers=headers, json=params)
+                response = self.http_client.post(self.BASE_URL + endpoint, headers=headers, json=params)
             elif method == 'GET':
-                response = self.session.get(self.BASE_URL + endpoint, headers=headers, params=params)
+                response = self.http_client.get(self.BASE_URL + endpoint, headers=headers, params=params)
             else:
                 raise ValueError(f"Invalid method: {method}")
             response.raise_for_status()
@@ -0,0 +1,169 @@
+import random
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit
+from models.api.rate_limiter import AdaptiveRateLimiter
+from utils.constants import HTTP_HOST_POLICIES, HTTP_DEFAULT_HOST_POLICY, HTTP_POOL_MAXSIZE
+from utils.logger import logger
+from utils.run_metrics import run_metrics
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request while a host's circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Opens after consecutive failures so callers fail fast. Once reset_seconds have passed it is half-open: one caller
+    takes the probe and everyone else keeps failing fast until the probe's success closes the circuit or its failure
+    re-opens it.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.probe_in_flight = False
+        self.probe_started_at = None
+        self.lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            now = time.monotonic()
+            if now - self.opened_at < self.reset_seconds:
+                return False
+            # A probe that never reported back (e.g. answered with a 429) is given up after reset_seconds
+            if self.probe_in_flight and now - self.probe_started_at < self.reset_seconds:
+                return False
+            self.probe_in_flight = True
+            self.probe_started_at = now
+            return True
+
+    def record_success(self):
+        with self.lock:
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self.probe_in_flight = False
+            self.probe_started_at = None
+
+    def record_failure(self) -> bool:
+        """Returns True when this failure opened (or re-opened) the circuit"""
+        with self.lock:
+            self.consecutive_failures += 1
+            if self.opened_at is None:
+                if self.consecutive_failures >= self.failure_threshold:
+                    self.opened_at = time.monotonic()
+                    return True
+                return False
+            if self.probe_in_flight:
+                # Half-open probe failed: wait out another reset_seconds before the next probe
+                self.opened_at = time.monotonic()
+                self.probe_in_flight = False
+                self.probe_started_at = None
+                return True
+            return False
+
+
+class HostTransport:
+    """Pooled session, rate limiter and circuit breaker for one host, shared by every client in the process."""
+
+    def __init__(self, host: str, policy: dict):
+        self.host = host
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=0, pool_block=True)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.rate_limiter = AdaptiveRateLimiter(policy['requests_per_second'], policy['burst'])
+        self.circuit_breaker = CircuitBreaker(policy['failure_threshold'], policy['reset_seconds'])
+
+
+class HttpClient:
+    """Common transport for the API clients: per-host connection pooling and token-bucket limits,
+    jittered retries on transient failures, a per-host circuit breaker and request metrics."""
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+    transports = {}
+    transports_lock = threading.Lock()
+
+    def __init__(self, name: str, timeout: float, max_retries: int = 3, retry_wait_time: float = 1.0, max_retry_wait_time: float = 30.0):
+        self.name = name
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_wait_time = retry_wait_time
+        self.max_retry_wait_time = max_retry_wait_time
+
+    @classmethod
+    def get_transport(cls, host: str) -> HostTransport:
+        with cls.transports_lock:
+            if host not in cls.transports:
+                cls.transports[host] = HostTransport(host, HTTP_DEFAULT_HOST_POLICY | HTTP_HOST_POLICIES.get(host, {}))
+            return cls.transports[host]
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request, retrying connection errors and RETRY_STATUS_CODES with full-jitter backoff.
+        Returns the last response (callers decide on raise_for_status); raises requests.RequestException
+        when no response was received or the host's circuit is open."""
+        host = urlsplit(url).netloc
+        transport = self.get_transport(host)
+        kwargs.setdefault('timeout', self.timeout)
+        metric_prefix = f"http.{self.name}"
+
+        for attempt in range(self.max_retries):
+            if not transport.circuit_breaker.allow_request():
+                run_metrics.increment(f"{metric_prefix}.circuit_open")
+                raise CircuitOpenError(f"Circuit open for {host}; skipping {method} {url}")
+
+            transport.rate_limiter.acquire()
+            started_at = time.perf_counter()
+            retry_after = None
+            try:
+                response = transport.session.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                run_metrics.increment(f"{metric_prefix}.errors")
+                self.record_failure(transport)
+                if attempt + 1 >= self.max_retries:
+                    raise
+                wait_time = self.get_retry_wait_time(attempt)
+                logger.warning(f"{self.name} request failed on attempt {attempt + 1}: {e}. Retrying in {wait_time:.1f}s...")
+                time.sleep(wait_time)
+                continue
+            finally:
+                run_metrics.record_timing(f"{metric_prefix}.latency", time.perf_counter() - started_at)
+                run_metrics.increment(f"{metric_prefix}.requests")
+
+            run_metrics.increment(f"{metric_prefix}.status.{response.status_code}")
+            if response.status_code not in self.RETRY_STATUS_CODES:
+                transport.circuit_breaker.record_success()
+                transport.rate_limiter.record_success()
+                return response
+
+            transport.rate_limiter.record_throttle()
+            run_metrics.increment(f"{metric_prefix}.throttled")
+            if response.status_code >= 500:
+                self.record_failure(transport)
+            if attempt + 1 >= self.max_retries:
+                return response
+            retry_after = response.headers.get("Retry-After")
+            wait_time = self.get_retry_wait_time(attempt, retry_after)
+            logger.warning(f"{self.name} got {response.status_code} on attempt {attempt + 1}. Retrying in {wait_time:.1f}s...")
+            time.sleep(wait_time)
+
+    def record_failure(self, transport: HostTransport):
+        if transport.circuit_breaker.record_failure():
+            logger.error(f"Opening circuit for {transport.host} after {transport.circuit_breaker.failure_threshold} consecutive failures")
+
+    def get_retry_wait_time(self, attempt: int, retry_after: str | None = None) -> float:
+        """Honour Retry-After when the server sends seconds, otherwise exponential backoff with full jitter"""
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), self.max_retry_wait_time)
+        return random.uniform(0, min(self.max_retry_wait_time, self.retry_wait_time * 2 ** attempt))
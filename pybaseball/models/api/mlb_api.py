@@ -1,6 +1,10 @@
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
+from models.api.http_client import HttpClient
+from utils.constants import MLB_PLAYER_INFO_WORKERS
 from utils.logger import logger
+from utils.run_metrics import run_metrics
 from urllib.parse import urlencode
 
 class MlbApi:
@@ -8,30 +12,30 @@ class MlbApi:
     MAX_RETRIES = 3
     MAX_PLAYERS_PER_REQUEST = 100
     RETRY_WAIT_TIME = 1.0
+    TIMEOUT = 10
 
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, max_workers: int = MLB_PLAYER_INFO_WORKERS):
+        # The host's rate limit slows down only when the API answers 429/5xx, and is shared by all threads
+        self.http_client = HttpClient('mlb_api', self.TIMEOUT, self.MAX_RETRIES, self.RETRY_WAIT_TIME)
+        self.max_workers = max_workers
 
     def request(self, endpoint: str, params: dict = None) -> dict:
+        response = self.get_response(endpoint, params)
+        return response.json() if response is not None else None
+
+    def get_response(self, endpoint: str, params: dict = None, headers: dict = None) -> requests.Response:
         url = f"{self.URL_BASE}/{endpoint}"
         logger.info(f"Fetching MLB data from {url}")
         if params:
             url += "?" + urlencode(params, doseq=True)
 
-        attempt = 0
-        while attempt < self.MAX_RETRIES:
-            try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                return response.json()
-            except requests.RequestException as e:
-                wait_time = 2 ** attempt
-                logger.warning(f"Request failed on attempt {attempt + 1}: {e}. Retrying in {wait_time}s...")
-                time.sleep(wait_time)
-                attempt += 1
-
-        logger.error(f"Max retries ({self.MAX_RETRIES}) exceeded. URL: {url}")
-        return None
+        try:
+            response = self.http_client.get(url, headers=headers)
+            response.raise_for_status()
+            return response
+        except requests.RequestException as e:
+            logger.error(f"Error fetching MLB data from {url}: {e}")
+            return None
 
     def get_player_info(
         self, player_ids: list[int], hydrate: str | None = None
@@ -39,20 +43,29 @@ class MlbApi:
         if not player_ids:
             return []
 
+        batches = [player_ids[i : i + self.MAX_PLAYERS_PER_REQUEST] for i in range(0, len(player_ids), self.MAX_PLAYERS_PER_REQUEST)]
+        logger.info(f"Fetching {len(player_ids)} players in {len(batches)} batches with up to {self.max_workers} in parallel")
         results = []
-        for i in range(0, len(player_ids), self.MAX_PLAYERS_PER_REQUEST):
-            batch_ids = player_ids[i : i + self.MAX_PLAYERS_PER_REQUEST]
-            batch_params = {"personIds": ",".join(map(str, batch_ids))}
-            if hydrate:
-                batch_params["hydrate"] = hydrate
-            data = self.request("people", batch_params)
-            if data and "people" in data:
-                results.extend(data["people"])
-            else:
-                logger.warning("No data returned for batch %s", batch_ids)
-            time.sleep(self.RETRY_WAIT_TIME)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # map keeps the batches in request order
+            for people in executor.map(lambda batch_ids: self.get_player_info_batch(batch_ids, hydrate), batches):
+                results.extend(people)
 
+        run_metrics.log_summary("http.mlb_api.")
         return results
+
+    def get_player_info_batch(self, batch_ids: list[int], hydrate: str | None = None) -> list[dict]:
+        batch_params = {"personIds": ",".join(map(str, batch_ids))}
+        if hydrate:
+            batch_params["hydrate"] = hydrate
+        started_at = time.perf_counter()
+        data = self.request("people", batch_params)
+        run_metrics.record_timing("http.mlb_api.player_info_batch", time.perf_counter() - started_at)
+        if data and "people" in data:
+            return data["people"]
+        run_metrics.increment("http.mlb_api.player_info_batch_failed")
+        logger.warning(f"No data returned for batch {batch_ids}")
+        return []
     
     def get_schedule(self, start_date: str, end_date: str) -> dict:
         params = {
@@ -74,3 +87,13 @@ class MlbApi:
             "rosterType": "active"
         }
         return self.request(f"teams/{team_id}/roster", params)
+
+    def get_team_roster_if_changed(self, team_id: int, etag: str | None = None) -> tuple[bool, dict | None, str | None]:
+        """Conditional roster request. Returns (not_modified, roster_data, etag); roster_data is None if unchanged or on failure."""
+        headers = {"If-None-Match": etag} if etag else None
+        response = self.get_response(f"teams/{team_id}/roster", {"rosterType": "active"}, headers)
+        if response is None:
+            return False, None, None
+        if response.status_code == 304:
+            return True, None, etag
+        return False, response.json(), response.headers.get("ETag")
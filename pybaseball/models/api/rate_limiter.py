@@ -0,0 +1,44 @@
+import threading
+import time
+
+class RateLimiter:
+    """Token bucket shared by every thread issuing requests through one API client."""
+
+    def __init__(self, requests_per_second: float, burst: int = 1):
+        self.requests_per_second = requests_per_second
+        self.capacity = max(burst, 1)
+        self.tokens = float(self.capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.requests_per_second)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_time = (1 - self.tokens) / self.requests_per_second
+            time.sleep(wait_time)
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """Runs at the full rate until the server pushes back, then halves the rate and recovers gradually on success."""
+
+    def __init__(self, requests_per_second: float, burst: int = 1, min_requests_per_second: float = 0.5, recovery_step: float = 0.5):
+        super().__init__(requests_per_second, burst)
+        self.max_requests_per_second = requests_per_second
+        self.min_requests_per_second = min_requests_per_second
+        self.recovery_step = recovery_step
+
+    def record_throttle(self):
+        with self.lock:
+            self.requests_per_second = max(self.min_requests_per_second, self.requests_per_second / 2)
+            self.tokens = min(self.tokens, 0.0)
+
+    def record_success(self):
+        with self.lock:
+            self.requests_per_second = min(self.max_requests_per_second, self.requests_per_second + self.recovery_step)
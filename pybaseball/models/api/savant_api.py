@@ -2,21 +2,52 @@ from __future__ import annotations
 
 from datetime import datetime
 from urllib.parse import urlencode
-from io import StringIO
+from importlib.util import find_spec
+from io import BytesIO
+import csv
 import pandas as pd
 import requests
 from pandas.errors import ParserError, EmptyDataError
+from models.api.http_client import HttpClient
 from utils.logger import logger
 
 
+# pyarrow parses the leaderboards multi-threaded when installed; the C engine is used otherwise
+CSV_ENGINE = 'pyarrow' if find_spec('pyarrow') else 'c'
+
+
 class SavantApi:
     BASE_URL = 'https://baseballsavant.mlb.com/leaderboard'
+    TIMEOUT = 30
+    # Only the columns the Savant stat logs consume are parsed, with their types fixed up front
+    LEADERBOARD_DTYPES = {
+        'statcast': {
+            'player_id': 'Int64',
+            'brl_percent': 'float64', 'ev95percent': 'float64', 'avg_hit_speed': 'float64',
+            'max_hit_speed': 'float64', 'anglesweetspotpercent': 'float64',
+        },
+        'custom_batting': {
+            'player_id': 'Int64',
+            'b_game': 'float64', 'ab': 'float64', 'hit': 'float64', 'home_run': 'float64', 'b_rbi': 'float64',
+            'r_run': 'float64', 'r_total_stolen_base': 'float64', 'player_age': 'float64',
+            'iz_contact_percent': 'float64', 'oz_contact_percent': 'float64', 'in_zone_swing': 'float64',
+            'out_zone_swing': 'float64', 'whiff_percent': 'float64', 'sprint_speed': 'float64',
+        },
+        'custom_pitching': {
+            'player_id': 'Int64',
+            'p_game': 'float64', 'hit': 'float64', 'home_run': 'float64', 'p_run': 'float64', 'player_age': 'float64',
+            'batting_avg': 'float64', 'on_base_percent': 'float64', 'slg_percent': 'float64', 'woba': 'float64',
+            'p_era': 'float64', 'p_called_strike': 'float64', 'p_swinging_strike': 'float64', 'pitch_count': 'float64',
+            'groundballs_percent': 'float64', 'flyballs_percent': 'float64',
+            'p_quality_start': 'float64', 'p_save': 'float64', 'p_hold': 'float64',
+        },
+    }
 
     def __init__(self):
-        self.session = requests.Session()
+        self.http_client = HttpClient('savant_api', self.TIMEOUT)
 
 
-    def request(self, endpoint: str, params: dict):
+    def request(self, endpoint: str, params: dict, leaderboard: str):
         url = f'{self.BASE_URL}/{endpoint}?{urlencode(params, doseq=True)}'
         logger.info(f"Fetching Baseball Savant data from {url}")
         
@@ -32,12 +63,12 @@ class SavantApi:
         }
         
         try:
-            response = self.session.get(url, headers=headers, timeout=30)
+            response = self.http_client.get(url, headers=headers)
             response.raise_for_status()
-            csv_text = self._extract_csv_text(response.text)
-            if csv_text is None:
+            csv_body = self._extract_csv_body(response.content)
+            if csv_body is None:
                 return None
-            df = self._read_savant_csv(csv_text)
+            df = self._read_savant_csv(csv_body, self.LEADERBOARD_DTYPES[leaderboard])
             if "player_id" not in df.columns:
                 logger.error(
                     "Savant CSV missing player_id column; response may be undecoded or malformed. Columns: %s",
@@ -101,42 +132,64 @@ class SavantApi:
         }
 
     def get_batting_stats(self):
-        return self.request('statcast', self.get_params('B'))
+        return self.request('statcast', self.get_params('B'), 'statcast')
 
     def get_advanced_batting_stats(self):
-        return self.request('custom', self.get_advanced_batting_params())
+        return self.request('custom', self.get_advanced_batting_params(), 'custom_batting')
 
     def get_pitching_stats(self):
-        return self.request('custom', self.get_advanced_pitching_params())
+        return self.request('custom', self.get_advanced_pitching_params(), 'custom_pitching')
 
-    def _extract_csv_text(self, body: str) -> str | None:
+    def _extract_csv_body(self, body: bytes) -> BytesIO | None:
         """
         Savant sometimes returns HTML (bot block, error page) with HTTP 200, or a preamble
-        before the CSV. Find the header row and strip anything before it.
+        before the CSV. Find the header row and return the body positioned at it, without
+        decoding or splitting the rest of the response.
         """
-        text = body.lstrip("\ufeff\u200b").strip()
-        if not text:
+        start = 0
+        for mark in (b"\xef\xbb\xbf", b"\xe2\x80\x8b"):
+            if body.startswith(mark, start):
+                start += len(mark)
+        while start < len(body) and body[start] in b" \t\r\n":
+            start += 1
+        if start == len(body):
             return None
 
-        first_nonempty = next((ln.strip() for ln in text.splitlines() if ln.strip()), "")
-        if first_nonempty.startswith("<"):
+        if body[start:start + 1] == b"<":
+            first_line = body[start:start + 120].decode("utf-8", "replace").splitlines()[0]
             logger.error(
                 "Baseball Savant returned HTML instead of CSV (blocked, error page, or unexpected response). "
                 "First line: %s",
-                first_nonempty[:120],
+                first_line,
             )
             return None
 
-        lines = text.splitlines()
-        for i, line in enumerate(lines):
-            if "player_id" in line and "," in line:
-                return "\n".join(lines[i:])
-        return text
-
-
-    def _read_savant_csv(self, csv_text: str) -> pd.DataFrame:
+        header = body.find(b"player_id", start)
+        if header != -1:
+            line_start = body.rfind(b"\n", start, header) + 1
+            line_end = body.find(b"\n", header)
+            if b"," in body[max(line_start, start):line_end if line_end != -1 else len(body)]:
+                start = max(line_start, start)
+        csv_body = BytesIO(body)
+        csv_body.seek(start)
+        return csv_body
+
+    def _read_savant_csv(self, csv_body: BytesIO, dtypes: dict) -> pd.DataFrame:
+        start = csv_body.tell()
+        header_line = csv_body.readline().decode("utf-8", "replace")
+        header = next(csv.reader([header_line.strip()]), [])
+        usecols = [column for column in header if column in dtypes]
+        if not usecols:
+            # Not a leaderboard we know; let the caller's player_id check report it
+            return pd.DataFrame(columns=header)
+        column_dtypes = {column: dtypes[column] for column in usecols}
         try:
-            return pd.read_csv(StringIO(csv_text))
-        except (ParserError, EmptyDataError) as e:
-            logger.warning("Savant CSV parse failed with default engine, retrying: %s", e)
-            return pd.read_csv(StringIO(csv_text), engine="python", on_bad_lines="skip")
+            csv_body.seek(start)
+            return pd.read_csv(csv_body, usecols=usecols, dtype=column_dtypes, engine=CSV_ENGINE)
+        except (ParserError, EmptyDataError, ValueError) as e:
+            logger.warning("Savant CSV parse failed with %s engine, retrying: %s", CSV_ENGINE, e)
+            csv_body.seek(start)
+            df = pd.read_csv(csv_body, usecols=usecols, engine="python", on_bad_lines="skip")
+            for column, dtype in column_dtypes.items():
+                df[column] = pd.to_numeric(df[column], errors="coerce").astype(dtype)
+            return df
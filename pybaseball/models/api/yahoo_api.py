@@ -3,11 +3,14 @@ import base64
 import requests
 from urllib.parse import quote
 import time
+from concurrent.futures import ThreadPoolExecutor
 from lxml import etree
 from datetime import datetime
+from models.api.http_client import HttpClient
 from models.yahoo_token import YahooToken
 from utils.logger import logger
 from utils.functions import normalise_name
+from utils.constants import YAHOO_PAGE_WORKERS
 
 class YahooApi:
     BASE_AUTH_URL = 'https://api.login.yahoo.com/oauth2/get_token'
@@ -17,9 +20,18 @@ class YahooApi:
     RETRY_WAIT_TIME = 0.4
     MAX_TIMEOUT = 20
     MAX_PAGE_SIZE = 25
+    # Compiled once and reused for every player node
+    PLAYERS_XPATH = etree.XPath('//yahoo:league/yahoo:players/yahoo:player', namespaces=NAMESPACE)
+    POSITIONS_XPATH = etree.XPath('yahoo:eligible_positions/yahoo:position/text()', namespaces=NAMESPACE)
+    PLAYER_FIELD_XPATHS = {
+        'yahoo_player_id': etree.XPath('string(yahoo:player_key)', namespaces=NAMESPACE),
+        'name': etree.XPath('string(yahoo:name/yahoo:full)', namespaces=NAMESPACE),
+        'mlb_team': etree.XPath('string(yahoo:editorial_team_abbr)', namespaces=NAMESPACE),
+        'headshot_url': etree.XPath('string(yahoo:headshot/yahoo:url)', namespaces=NAMESPACE),
+    }
 
     def __init__(self, yahoo_token: YahooToken):
-        self.session = requests.Session()
+        self.http_client = HttpClient('yahoo_api', self.MAX_TIMEOUT, self.MAX_RETRIES, self.RETRY_WAIT_TIME, max_retry_wait_time=5.0)
         self.yahoo_token = yahoo_token
         self.client_id = os.getenv('YAHOO_CLIENT_ID')
         self.client_secret = os.getenv('YAHOO_CLIENT_SECRET')
@@ -33,13 +45,13 @@ class YahooApi:
             'Authorization': f"Basic {auth}"
         }
 
-        response = self.session.post(url, headers=headers, data=params)
+        response = self.http_client.post(url, headers=headers, data=params)
         return response.json()
         
     def api_request(self, endpoint: str, params: dict) -> dict:
-        if self.yahoo_token.should_refresh_token():
-            self.refresh_token()
         token = self.yahoo_token.get_token()
+        if self.yahoo_token.should_refresh_token():
+            token = self.refresh_token(token)
         url = f"{self.BASE_API_URL}/{endpoint}"
         headers = {
             'Authorization': f"Bearer {token.get('yahoo_access_token', None)}",
@@ -51,40 +63,28 @@ class YahooApi:
             filter_string = ';'.join(f"{k}={quote(str(v), safe='')}" for k, v in params.items())
             url = f"{url};{filter_string}"
 
-        attempt = 0
-        did_refresh = False
-        while attempt < self.MAX_RETRIES:
-            try:
-                response = self.session.get(url, headers=headers, timeout=self.MAX_TIMEOUT)
-                # Handle auth expiry once
-                if response.status_code == 401 and not did_refresh:
-                    self.refresh_token()
-                    headers['Authorization'] = f"Bearer {self.yahoo_token.get_token().get('yahoo_access_token')}"
-                    did_refresh = True
-                    attempt += 1
-                    time.sleep(self.RETRY_WAIT_TIME)
-                    continue
-
-                # Retry on transient status codes
-                if response.status_code in (429, 500, 502, 503, 504):
-                    attempt += 1
-                    wait = min(5.0, self.RETRY_WAIT_TIME * (2 ** (attempt - 1)))
-                    logger.warning(f"Yahoo {response.status_code}; retrying in {wait:.1f}s… [{attempt}/{self.MAX_RETRIES}]")
-                    time.sleep(wait)
-                    continue
-
-                response.raise_for_status()
-                return etree.fromstring(response.content)
-            except requests.RequestException as e:
-                logger.error(f"Error fetching Yahoo data: {e}. Retrying in {self.RETRY_WAIT_TIME}s...")
-                attempt += 1
-                time.sleep(self.RETRY_WAIT_TIME)
-
-        logger.error(f"Max retries ({self.MAX_RETRIES}) exceeded. URL: {url}")
-        return None
-
-    def refresh_token(self):
-        refresh_token = self.yahoo_token.get_token().get('yahoo_refresh_token', None)
+        try:
+            response = self.http_client.get(url, headers=headers)
+            # Handle auth expiry once
+            if response.status_code == 401:
+                # Threads rejected with the same token share one refresh
+                token = self.refresh_token(token)
+                headers['Authorization'] = f"Bearer {token.get('yahoo_access_token')}"
+                response = self.http_client.get(url, headers=headers)
+            response.raise_for_status()
+            return etree.fromstring(response.content)
+        except requests.RequestException as e:
+            logger.error(f"Error fetching Yahoo data from {url}: {e}")
+            return None
+
+    def refresh_token(self, stale_token=None):
+        """Refresh the shared token unless another request already replaced stale_token; returns the current token"""
+        if stale_token is None:
+            stale_token = self.yahoo_token.get_token()
+        return self.yahoo_token.refresh_once(stale_token, self.request_new_token)
+
+    def request_new_token(self, current_token):
+        refresh_token = (current_token or {}).get('yahoo_refresh_token', None)
         if not refresh_token:
             raise Exception('No refresh token found')
 
@@ -111,26 +111,33 @@ class YahooApi:
             'yahoo_refresh_token': refresh_token,
             'yahoo_token_expires_at': expiry_datetime
         }
-        self.yahoo_token.set_token(new_token)
         return new_token
 
     def get_all_league_players(self) -> dict:
+        """
+        Page through every league player, YAHOO_PAGE_WORKERS pages at a time. The total is unknown up front,
+        so pages are requested in waves until one comes back short; the host rate limiter paces the requests.
+        """
         league_key = self.get_user_league_key()
         if not league_key:
             raise Exception('No league key found')
 
         all_players = []
         index_offset = 0
-        while True:
-            batch = self.get_league_players_batch(league_key, index_offset, self.MAX_PAGE_SIZE)
-            if not batch:
-                break
-            all_players.extend(batch)
-            logger.info("Fetched %d players (total=%d)", len(batch), len(all_players))
-            if len(batch) < self.MAX_PAGE_SIZE:
-                break
-            index_offset += self.MAX_PAGE_SIZE
-            time.sleep(self.RETRY_WAIT_TIME)
+        with ThreadPoolExecutor(max_workers=YAHOO_PAGE_WORKERS) as executor:
+            while True:
+                offsets = [index_offset + page * self.MAX_PAGE_SIZE for page in range(YAHOO_PAGE_WORKERS)]
+                batches = executor.map(lambda start: self.get_league_players_batch(league_key, start, self.MAX_PAGE_SIZE), offsets)
+                last_page = False
+                for batch in batches:
+                    if last_page:
+                        continue
+                    all_players.extend(batch)
+                    last_page = len(batch) < self.MAX_PAGE_SIZE
+                logger.info("Fetched players up to offset %d (total=%d)", offsets[-1] + self.MAX_PAGE_SIZE, len(all_players))
+                if last_page:
+                    break
+                index_offset = offsets[-1] + self.MAX_PAGE_SIZE
         return all_players
 
     def get_league_players_by_keys(self, keys: list[str]) -> list[dict]:
@@ -138,12 +145,12 @@ class YahooApi:
         if not league_key:
             raise Exception('No league key found')
 
+        chunks = [",".join(keys[i:i+self.MAX_PAGE_SIZE]) for i in range(0, len(keys), self.MAX_PAGE_SIZE)]
         results = []
-        for i in range(0, len(keys), self.MAX_PAGE_SIZE):
-            chunk = ",".join(keys[i:i+self.MAX_PAGE_SIZE])
-            response = self.api_request(f"league/{league_key}/players", {'player_keys': chunk})
-            results.extend(self.get_player_data_from_response(response))
-            time.sleep(self.RETRY_WAIT_TIME)
+        with ThreadPoolExecutor(max_workers=YAHOO_PAGE_WORKERS) as executor:
+            responses = executor.map(lambda chunk: self.api_request(f"league/{league_key}/players", {'player_keys': chunk}), chunks)
+            for response in responses:
+                results.extend(self.get_player_data_from_response(response))
         return results
 
     def get_user_league_key(self) -> str:
@@ -170,11 +177,8 @@ class YahooApi:
         if root is None:
             return []
         
-        # Find players using namespace
-        players = root.xpath('//yahoo:league/yahoo:players/yahoo:player', namespaces=self.NAMESPACE)
-        
         all_player_data = []
-        for p in players:
+        for p in self.PLAYERS_XPATH(root):
             try:
                 player_data = self.flatten_yahoo_player(p)
                 all_player_data.append(player_data)
@@ -184,24 +188,7 @@ class YahooApi:
         return all_player_data
 
     def flatten_yahoo_player(self, player_node) -> dict:
-        # positions
-        pos_nodes = player_node.xpath(self.prefix_subpaths("eligible_positions/position"), namespaces=self.NAMESPACE)
-        positions = [n.text for n in pos_nodes if (n.text or "").strip()]
-
-        return {
-            "yahoo_player_id": self.parse_xml_path(player_node, "player_key"),
-            "name": self.parse_xml_path(player_node, "name/full"),
-            "mlb_team": self.parse_xml_path(player_node, "editorial_team_abbr"),
-            "eligible_positions": sorted(set(positions)),
-            "headshot_url": self.parse_xml_path(player_node, "headshot/url"),
-        }
-
-    def prefix_subpaths(self, rel_path: str) -> str:
-        # convert "name/full" -> "f:name/f:full"
-        return "/".join(f"yahoo:{seg}" for seg in rel_path.split("/"))
-
-    def parse_xml_path(self, node, rel_path: str):
-        return node.xpath(f"string({self.prefix_subpaths(rel_path)})", namespaces=self.NAMESPACE) or None
-
-
-        
+        player_data = {field: xpath(player_node) or None for field, xpath in self.PLAYER_FIELD_XPATHS.items()}
+        positions = [position for position in self.POSITIONS_XPATH(player_node) if position.strip()]
+        player_data['eligible_positions'] = sorted(set(positions))
+        return player_data
@@ -0,0 +1,111 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+import numpy as np
+import pandas as pd
+from utils.constants import AUCTION_SIMULATIONS, AUCTION_SIMULATION_WORKERS
+from utils.logger import logger
+
+# (player columns, replacement rank, group budget) for hitters and pitchers
+AuctionGroup = Tuple[np.ndarray, int, float]
+
+
+def simulate_auction_prices(values: np.ndarray, sigmas: np.ndarray, groups: List[AuctionGroup], simulations: int,
+                            seed, chunk_size: int, min_dollar_value: float) -> np.ndarray:
+    """
+    Worker entry point: price every player in `simulations` auctions, returning a (simulations × players) float32 array.
+    Each auction draws total values from N(value, sigma), re-derives each group's replacement level at its rank and
+    splits the group budget over value above replacement, exactly like the deterministic dollar values.
+    """
+    rng = np.random.default_rng(seed)
+    prices = np.zeros((simulations, len(values)), dtype=np.float32)
+    for start in range(0, simulations, chunk_size):
+        stop = min(start + chunk_size, simulations)
+        sampled = values + rng.standard_normal((stop - start, len(values))) * sigmas
+        for columns, rank, budget in groups:
+            if len(columns) == 0 or rank <= 0:
+                continue
+            group_values = sampled[:, columns]
+            k = min(rank, len(columns)) - 1
+            # k-th largest per simulation, without sorting every row
+            replacement = -np.partition(-group_values, k, axis=1)[:, k]
+            var = np.maximum(group_values - replacement[:, None], 0.0)
+            var_sum = var.sum(axis=1, keepdims=True)
+            var_sum[var_sum == 0] = 1.0
+            dollars = var / var_sum * budget
+            prices[start:stop, columns] = np.where(dollars > 0, np.maximum(dollars, min_dollar_value), 0.0)
+    return prices
+
+
+class AuctionSimulator:
+    """
+    Monte Carlo price bands for draft values. Player value uncertainty is scaled from reliability and risk scores,
+    and whole-league auctions are simulated as batched (simulations × players) arrays, optionally sharded across
+    worker processes.
+    """
+    PERCENTILES = [10, 50, 90]
+    # Sigma as a fraction of the group's value spread: a floor, plus more for unreliable and risky players
+    BASE_UNCERTAINTY = 0.10
+    RELIABILITY_UNCERTAINTY = 0.25
+    RISK_UNCERTAINTY = 0.25
+    # Only players within POOL_MULT × the replacement rank of their group can realistically be bought
+    POOL_MULT = 3
+    CHUNK_SIZE = 1000
+
+    def __init__(self, simulations=AUCTION_SIMULATIONS, max_workers=AUCTION_SIMULATION_WORKERS, seed=None, min_dollar_value=1):
+        self.simulations = simulations
+        self.max_workers = max_workers
+        self.seed = seed
+        self.min_dollar_value = min_dollar_value
+
+    def get_value_sigmas(self, players: pd.DataFrame) -> np.ndarray:
+        reliability = players["reliability_score"].astype(float).fillna(0.0).clip(0, 100).to_numpy() / 100.0
+        risk = players["risk_score"].astype(float).fillna(100.0).clip(0, 100).to_numpy() / 100.0
+        spread = players.groupby("position")["total_value"].transform("std").fillna(0.0).to_numpy()
+        return spread * (self.BASE_UNCERTAINTY + self.RELIABILITY_UNCERTAINTY * (1.0 - reliability) + self.RISK_UNCERTAINTY * risk)
+
+    def simulate_price_bands(self, players: pd.DataFrame, hitter_rank: int, pitcher_rank: int,
+                             hitter_budget: float, pitcher_budget: float) -> pd.DataFrame:
+        """
+        players needs position (B/P), total_value, reliability_score and risk_score.
+        Returns price_p10, price_p50, price_p90 aligned to players' index; players outside the pool get 0.
+        """
+        bands = pd.DataFrame(0.0, index=players.index, columns=[f"price_p{p}" for p in self.PERCENTILES])
+        pool = self.get_pool(players, {"B": hitter_rank, "P": pitcher_rank})
+        if pool.empty or self.simulations <= 0:
+            return bands
+
+        values = pool["total_value"].astype(float).to_numpy()
+        sigmas = self.get_value_sigmas(pool)
+        positions = pool["position"].to_numpy()
+        groups = [
+            (np.flatnonzero(positions == "B"), hitter_rank, hitter_budget),
+            (np.flatnonzero(positions == "P"), pitcher_rank, pitcher_budget),
+        ]
+
+        shards = self.get_shards()
+        if len(shards) == 1:
+            prices = simulate_auction_prices(values, sigmas, groups, shards[0][0], shards[0][1], self.CHUNK_SIZE, self.min_dollar_value)
+        else:
+            with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+                futures = [
+                    executor.submit(simulate_auction_prices, values, sigmas, groups, simulations, seed, self.CHUNK_SIZE, self.min_dollar_value)
+                    for simulations, seed in shards
+                ]
+                prices = np.concatenate([future.result() for future in futures])
+
+        logger.info(f"Simulated {self.simulations} auctions over {len(pool)} players in {len(shards)} shards")
+        bands.loc[pool.index] = np.percentile(prices, self.PERCENTILES, axis=0).T.round(2)
+        return bands
+
+    def get_pool(self, players: pd.DataFrame, ranks: dict) -> pd.DataFrame:
+        pool = players[players["position"].isin(list(ranks))]
+        group_rank = pool.groupby("position")["total_value"].rank(method="first", ascending=False)
+        limit = pool["position"].map(ranks) * self.POOL_MULT
+        return pool[group_rank <= limit]
+
+    def get_shards(self) -> List[Tuple[int, np.random.SeedSequence]]:
+        """Split the simulations across workers, each with an independent random stream"""
+        shard_count = max(1, min(self.max_workers, self.simulations))
+        seeds = np.random.SeedSequence(self.seed).spawn(shard_count)
+        sizes = [len(part) for part in np.array_split(np.arange(self.simulations), shard_count)]
+        return list(zip(sizes, seeds))
@@ -33,10 +33,39 @@ class DB_Recorder():
     def purge_old_records(self, table_name):
         cutoff_date = datetime.today() - timedelta(days=MAX_AGE_DAYS)
         logger.info(f"Purging {table_name} older than {cutoff_date.date()}")
+        # Whole expired partitions are dropped; the DELETE then only touches the boundary partition
+        self.drop_partitions_before(table_name, cutoff_date.date())
         with self.conn.cursor() as cursor:
             cursor.execute(f"DELETE FROM {table_name} WHERE game_date < %s", (cutoff_date.date(),))
         self.conn.commit()
 
+    def get_range_partitions(self, table_name):
+        """Return [(partition_name, upper_bound)] for a table range-partitioned by date, in order.
+        The upper bound is exclusive and None for the MAXVALUE partition. Unpartitioned tables return []."""
+        rows = self.get_query("""
+            SELECT PARTITION_NAME AS name, PARTITION_DESCRIPTION AS description
+            FROM information_schema.PARTITIONS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s AND PARTITION_NAME IS NOT NULL
+            ORDER BY PARTITION_ORDINAL_POSITION
+        """, (table_name,))
+        partitions = []
+        for row in rows:
+            description = row['description']
+            upper_bound = None if description == 'MAXVALUE' else datetime.strptime(description.strip("'"), '%Y-%m-%d').date()
+            partitions.append((row['name'], upper_bound))
+        return partitions
+
+    def drop_partitions_before(self, table_name, cutoff_date):
+        """Drop every partition whose rows all fall before cutoff_date. No-op for unpartitioned tables."""
+        expired_partitions = [
+            name for name, upper_bound in self.get_range_partitions(table_name)
+            if upper_bound is not None and upper_bound <= cutoff_date
+        ]
+        if not expired_partitions:
+            return
+        logger.info(f"Dropping {len(expired_partitions)} partitions from {table_name} older than {cutoff_date}")
+        self.execute_query(f"ALTER TABLE {table_name} DROP PARTITION {', '.join(expired_partitions)}")
+
     def purge_records_with_conditions(self, table_name, conditions):
         with self.conn.cursor() as cursor:
             where_clause = "WHERE " + ' AND '.join(conditions)
@@ -148,6 +177,62 @@ class DB_Recorder():
         self.conn.rollback()
         self.conn.autocommit = True
 
+    def batch_upsert_in_transaction(self, insert_query, rows):
+        """Batch insert rows within the current transaction (no auto-commit)"""
+        with self.conn.cursor() as cursor:
+            for batch in [rows[i:i + BATCH_SIZE] for i in range(0, len(rows), BATCH_SIZE)]:
+                cursor.executemany(insert_query, batch)
+
+    def bulk_update(self, table_name, key_column, key_type, columns, rows, coalesce_columns=()):
+        """
+        Apply (key, value, ...) rows to table_name in a handful of statements: the rows are batch inserted into a
+        temporary table and joined back with a single UPDATE. columns maps each updated column, in row order, to its
+        SQL type. Columns in coalesce_columns keep their current value unless it is NULL. Returns the rows changed.
+        """
+        if not rows:
+            return 0
+        temp_table = f"tmp_bulk_{table_name}"
+        column_names = list(columns.keys())
+        set_clause = ", ".join(
+            f"t.{column} = COALESCE(t.{column}, u.{column})" if column in coalesce_columns else f"t.{column} = u.{column}"
+            for column in column_names
+        )
+        self.reset_connection_state()
+        self.begin_transaction()
+        try:
+            self.execute_query_in_transaction(f"DROP TEMPORARY TABLE IF EXISTS {temp_table}")
+            self.execute_query_in_transaction(f"""
+                CREATE TEMPORARY TABLE {temp_table} (
+                    {key_column} {key_type} PRIMARY KEY,
+                    {', '.join(f'{column} {column_type}' for column, column_type in columns.items())}
+                ) ENGINE=MEMORY
+            """)
+            self.batch_upsert_in_transaction(
+                # A key given twice keeps its last values
+                f"INSERT INTO {temp_table} ({key_column}, {', '.join(column_names)}) "
+                f"VALUES ({', '.join(['%s'] * (len(column_names) + 1))}) "
+                f"ON DUPLICATE KEY UPDATE {', '.join(f'{column} = VALUES({column})' for column in column_names)}",
+                rows,
+            )
+            with self.conn.cursor() as cursor:
+                cursor.execute(f"""
+                    UPDATE {table_name} t
+                    JOIN {temp_table} u ON u.{key_column} = t.{key_column}
+                    SET {set_clause}
+                """)
+                updated = cursor.rowcount
+            self.execute_query_in_transaction(f"DROP TEMPORARY TABLE IF EXISTS {temp_table}")
+            self.commit_transaction()
+            logger.info(f"Bulk updated {updated} of {len(rows)} rows in {table_name}")
+            return updated
+        except Exception:
+            self.rollback_transaction()
+            try:
+                self.execute_query(f"DROP TEMPORARY TABLE IF EXISTS {temp_table}")
+            except Exception:
+                pass
+            raise
+
     def execute_query_in_transaction(self, query, params=None):
         """Execute a query within the current transaction (no auto-commit)"""
         with self.conn.cursor() as cursor:
@@ -1,3 +1,5 @@
+from collections import Counter
+import pandas as pd
 from models.api.fangraphs_api import FangraphsApi
 from models.season_stats import SeasonStats
 from models.game_logs.logs_inserter import LogsInserter
@@ -7,6 +9,7 @@ from models.game_logs.fangraphs_team_batting_stat_log import FangraphsTeamBattin
 from models.game_logs.fangraphs_team_pitching_stat_log import FangraphsTeamPitchingStatLog
 from models.player_lookups import PlayerLookups
 from utils.logger import logger
+from utils.constants import MLB_TEAM_IDS
 from datetime import datetime
 
 class FangraphsStats(SeasonStats):
@@ -15,71 +18,111 @@ class FangraphsStats(SeasonStats):
         self.api = fangraphs_api
         self.player_lookups = player_lookups
 
+    def get_source_downloads(self):
+        """Independent Fangraphs downloads keyed by (kind, position), so they can be fetched concurrently"""
+        return {
+            ('player', 'P'): lambda: self.api.get_player_data('P'),
+            ('player', 'B'): lambda: self.api.get_player_data('B'),
+            ('team', 'P'): lambda: self.api.get_team_data('P'),
+            ('team', 'B'): lambda: self.api.get_team_data('B'),
+        }
+
+    def upsert_source(self, source, data_response, season_year=None):
+        kind, position = source
+        if kind == 'player':
+            self.upsert_player_stats(position, data_response, season_year)
+        else:
+            self.upsert_team_stats(position, data_response, season_year)
+
     def update_all_player_stats(self, season_year=None):
         if season_year is None:
             season_year = datetime.now().year
         logger.info(f"Updating all season player stats from Fangraphs for {season_year}")
-        all_pitcher_stats = LogsInserter(FangraphsPitcherStatLog.KEYS, FangraphsPitcherStatLog.ID_KEYS)
-        all_batter_stats = LogsInserter(FangraphsBatterStatLog.KEYS, FangraphsBatterStatLog.ID_KEYS)
+        for position in ('P', 'B'):
+            self.upsert_player_stats(position, self.api.get_player_data(position), season_year)
 
-        pitcher_data_response = self.api.get_player_data('P')
-        batter_data_response = self.api.get_player_data('B')
+    def upsert_player_stats(self, position, data_response, season_year=None):
+        if season_year is None:
+            season_year = datetime.now().year
+        label = 'pitcher' if position == 'P' else 'batter'
+        stat_log = FangraphsPitcherStatLog if position == 'P' else FangraphsBatterStatLog
+        all_stats = LogsInserter(stat_log.KEYS, stat_log.ID_KEYS, stat_log.COALESCE_KEYS)
 
-        if pitcher_data_response is None:
-            logger.error("No pitcher data found from Fangraphs")
-        else:
-            pitcher_columns = pitcher_data_response.get('k', [])
-            pitcher_data = pitcher_data_response.get('v', [])
-            logger.info(f"Found {len(pitcher_data)} rows of pitcher stats")
-            for data in pitcher_data:
-                pitcher_info = dict(zip(pitcher_columns, data))
-                all_pitcher_stats.add_row(FangraphsPitcherStatLog(pitcher_info, season_year))
+        if data_response is None:
+            logger.error(f"No {label} data found from Fangraphs")
+            return
 
-            logger.info(f"Upserting {all_pitcher_stats.get_row_count()} pitcher stats")
-            self.upsert_stats(self.PLAYER_STATS_TABLE, all_pitcher_stats)
+        data = pd.DataFrame(data_response.get('v', []), columns=data_response.get('k', []))
+        logger.info(f"Found {len(data)} rows of {label} stats")
+        all_stats.add_rows(self.key_player_rows(stat_log.KEYS, stat_log.get_rows(data, season_year)))
 
-        if batter_data_response is None:
-            logger.error("No batter data found from Fangraphs")
-        else:
-            batter_columns = batter_data_response.get('k', [])
-            batter_data = batter_data_response.get('v', [])
-            logger.info(f"Found {len(batter_data)} rows of batter stats")
-            for data in batter_data:
-                batter_info = dict(zip(batter_columns, data))
-                all_batter_stats.add_row(FangraphsBatterStatLog(batter_info, season_year))
+        logger.info(f"Upserting {all_stats.get_row_count()} {label} stats")
+        self.upsert_stats(self.PLAYER_STATS_TABLE, all_stats)
 
-            logger.info(f"Upserting {all_batter_stats.get_row_count()} batter stats")
-            self.upsert_stats(self.PLAYER_STATS_TABLE, all_batter_stats)
+    def key_player_rows(self, keys, rows):
+        """
+        Set player_id, and team when Fangraphs has no single valid team, from player_lookup before the rows are written.
+        Every row is first matched by (fangraphs_player_id, position); only rows still unkeyed then fall back to
+        (normalised_name, team, position), then (normalised_name, position) when that pair is unique both in the lookup
+        and in this batch. A player_id is only given to one row per position, and exact id matches claim theirs first.
+        """
+        resolver = self.player_lookups.identity_resolver
+        fangraphs_index, player_index, name_index, team_index, position_index = (
+            keys.index(key) for key in ('fangraphs_player_id', 'player_id', 'normalised_name', 'team', 'position')
+        )
+        name_counts = Counter((row[name_index], row[position_index]) for row in rows)
+        claimed = set()
+        keyed_rows = [list(row) for row in rows]
+        unkeyed_rows = []
+        for row in keyed_rows:
+            lookup = resolver.get_by_id('fangraphs_player_id', row[fangraphs_index], row[position_index])
+            if not self.claim_lookup(row, lookup, claimed, player_index, team_index, position_index):
+                unkeyed_rows.append(row)
+        for row in unkeyed_rows:
+            position = row[position_index]
+            lookup = resolver.resolve(
+                position,
+                normalised_name=row[name_index],
+                team=row[team_index],
+                unique_name=name_counts[(row[name_index], position)] == 1,
+            )
+            if self.claim_lookup(row, lookup, claimed, player_index, team_index, position_index):
+                resolver.backfill_lookup_id(lookup, 'fangraphs_player_id', row[fangraphs_index])
+        resolver.flush_lookup_updates()
+        logger.info(f"Keyed {len(claimed)} of {len(rows)} rows to a player_id")
+        return [tuple(row) for row in keyed_rows]
+
+    def claim_lookup(self, row, lookup, claimed, player_index, team_index, position_index):
+        """Key row to lookup unless its (player_id, position) was already given to another row. Returns True when keyed."""
+        if lookup is None or (lookup['player_id'], row[position_index]) in claimed:
+            return False
+        claimed.add((lookup['player_id'], row[position_index]))
+        row[player_index] = lookup['player_id']
+        if row[team_index] not in MLB_TEAM_IDS and lookup['team'] is not None:
+            row[team_index] = lookup['team']
+        return True
 
     def update_all_team_stats(self, season_year=None):
         if season_year is None:
             season_year = datetime.now().year
         logger.info(f"Updating all season team stats from Fangraphs for {season_year}")
-        all_team_pitching_stats = LogsInserter(FangraphsTeamPitchingStatLog.KEYS, FangraphsTeamPitchingStatLog.ID_KEYS)
-        all_team_batting_stats = LogsInserter(FangraphsTeamBattingStatLog.KEYS, FangraphsTeamBattingStatLog.ID_KEYS)
-
-        team_pitching_data_response = self.api.get_team_data('P')
-        team_batting_data_response = self.api.get_team_data('B')
-
-        if team_pitching_data_response is None:
-            logger.error("No team pitching data found from Fangraphs")
-        else:
-            team_pitching_data = team_pitching_data_response.get('data', [])
-            logger.info(f"Found {len(team_pitching_data)} rows of team pitching stats")
-            for data in team_pitching_data:
-                all_team_pitching_stats.add_row(FangraphsTeamPitchingStatLog(data, season_year))
+        for position in ('P', 'B'):
+            self.upsert_team_stats(position, self.api.get_team_data(position), season_year)
 
-            logger.info(f"Upserting {all_team_pitching_stats.get_row_count()} team pitching stats")
-            self.upsert_stats(self.TEAM_STATS_TABLE, all_team_pitching_stats)
+    def upsert_team_stats(self, position, data_response, season_year=None):
+        if season_year is None:
+            season_year = datetime.now().year
+        label = 'team pitching' if position == 'P' else 'team batting'
+        stat_log = FangraphsTeamPitchingStatLog if position == 'P' else FangraphsTeamBattingStatLog
+        all_stats = LogsInserter(stat_log.KEYS, stat_log.ID_KEYS)
 
-        if team_batting_data_response is None:
-            logger.error("No team batting data found from Fangraphs")
-        else:
-            team_batting_data = team_batting_data_response.get('data', [])
-            logger.info(f"Found {len(team_batting_data)} rows of team batting stats")
-            for data in team_batting_data:
-                all_team_batting_stats.add_row(FangraphsTeamBattingStatLog(data, season_year))
+        if data_response is None:
+            logger.error(f"No {label} data found from Fangraphs")
+            return
 
-            logger.info(f"Upserting {all_team_batting_stats.get_row_count()} team batting stats")
-            self.upsert_stats(self.TEAM_STATS_TABLE, all_team_batting_stats)
+        data = pd.DataFrame(data_response.get('data', []))
+        logger.info(f"Found {len(data)} rows of {label} stats")
+        all_stats.add_rows(stat_log.get_rows(data, season_year))
 
+        logger.info(f"Upserting {all_stats.get_row_count()} {label} stats")
+        self.upsert_stats(self.TEAM_STATS_TABLE, all_stats)
@@ -0,0 +1,74 @@
+from datetime import date, datetime, timedelta
+from models.db_recorder import DB_Recorder
+from models.team_game_logs import TeamGameLogs
+from models.probable_pitchers import ProbablePitchers
+from utils.constants import GAME_LOG_PARTITION_DAYS, GAME_LOG_FUTURE_PARTITION_DAYS
+from utils.logger import logger
+
+class GameLogPartitions(DB_Recorder):
+    """
+    Keeps dated partitions ahead of the game_date range-partitioned tables so retention can drop partitions instead
+    of deleting rows. The tables are partitioned by migration 064; only tables whose unique keys already include
+    game_date are, so partitioning never changes what an upsert matches.
+    """
+    FUTURE_PARTITION = "p_future"
+    HISTORY_PARTITION = "p_history"
+    PARTITIONED_TABLES = [
+        TeamGameLogs.GAME_LOGS_TABLE,
+        ProbablePitchers.PROBABLE_PITCHERS_TABLE,
+    ]
+
+    def __init__(self, conn, partition_days=GAME_LOG_PARTITION_DAYS, future_days=GAME_LOG_FUTURE_PARTITION_DAYS):
+        super().__init__(conn)
+        self.partition_days = partition_days
+        self.future_days = future_days
+
+    def maintain_partitions(self):
+        """Pre-create partitions for upcoming dates on every partitioned table."""
+        for table_name in self.PARTITIONED_TABLES:
+            self.add_future_partitions(table_name)
+
+    def add_future_partitions(self, table_name):
+        """Split the catch-all partition so dated partitions always cover future_days ahead."""
+        partitions = self.get_range_partitions(table_name)
+        if not partitions:
+            logger.warning(f"{table_name} is not partitioned; run migration 064 to enable partition retention")
+            return
+
+        upper_bounds = [upper_bound for _, upper_bound in partitions if upper_bound is not None]
+        today = datetime.today().date()
+        horizon = today + timedelta(days=self.future_days)
+        if upper_bounds and max(upper_bounds) >= horizon:
+            return
+
+        boundaries = self.get_partition_boundaries(max(upper_bounds) if upper_bounds else today, horizon)
+        definitions = self.get_partition_definitions(boundaries)
+        if not upper_bounds:
+            # First split after the migration: everything already stored stays in one partition that retention
+            # drops as a whole once it has aged out
+            definitions = f"PARTITION {self.HISTORY_PARTITION} VALUES LESS THAN ('{boundaries[0][0].strftime('%Y-%m-%d')}'), {definitions}"
+
+        logger.info(f"Adding {len(boundaries)} future partitions to {table_name}")
+        self.execute_query(f"""
+            ALTER TABLE {table_name}
+            REORGANIZE PARTITION {self.FUTURE_PARTITION} INTO ({definitions})
+        """)
+
+    def get_partition_boundaries(self, start_date, end_date):
+        """Return [(lower, upper)] ranges of partition_days each, aligned so weekly partitions start on Monday."""
+        ordinal = start_date.toordinal()
+        lower = date.fromordinal(ordinal - (ordinal - 1) % self.partition_days)
+        boundaries = []
+        while lower < end_date:
+            upper = lower + timedelta(days=self.partition_days)
+            boundaries.append((lower, upper))
+            lower = upper
+        return boundaries
+
+    def get_partition_definitions(self, boundaries):
+        definitions = [
+            f"PARTITION p{lower.strftime('%Y%m%d')} VALUES LESS THAN ('{upper.strftime('%Y-%m-%d')}')"
+            for lower, upper in boundaries
+        ]
+        definitions.append(f"PARTITION {self.FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE)")
+        return ', '.join(definitions)
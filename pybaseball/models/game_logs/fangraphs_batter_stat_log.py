@@ -1,34 +1,19 @@
 from models.game_logs.fangraphs_player_stat_log import FangraphsPlayerStatLog
-from utils.logger import logger
+from models.game_logs.mapped_stat_log import ColumnSpec
 
 class FangraphsBatterStatLog(FangraphsPlayerStatLog):
     KEYS = [
-        'fangraphs_player_id', 'normalised_name', 'team', 'position', 'season_year', 'last_updated', # ID
+        'fangraphs_player_id', 'player_id', 'normalised_name', 'team', 'position', 'season_year', 'last_updated', # ID
         'pa', 'avg', 'obp', 'slg', 'ops', 'bb_rate', 'k_rate', # Basic stats
         'iso', 'babip', 'woba', 'wrc_plus', 'wraa' # Advanced batting stats
     ]
-
-    def __init__(self, player_info, season_year=None):
-        super().__init__(player_info, season_year)
-        self.player_info = player_info
-        self.set_values()
-
-    def get_value_for_key(self, key):
-        if key == 'position':
-            return 'B'
-        elif key == 'pa':
-            return int(self.player_info.get('PA', 0)) if self.player_info.get('PA') else None
-        elif key == 'ops':
-            return float(self.player_info.get('OPS', 0)) if self.player_info.get('OPS') else None
-        elif key == 'bb_rate':
-            return float(self.player_info.get('BB%', 0)) if self.player_info.get('BB%') else None
-        elif key == 'k_rate':
-            return float(self.player_info.get('K%', 0)) if self.player_info.get('K%') else None
-        elif key == 'iso':
-            return float(self.player_info.get('ISO', 0)) if self.player_info.get('ISO') else None
-        elif key == 'wrc_plus':
-            return int(float(self.player_info.get('wRC+', 0))) if self.player_info.get('wRC+') else None
-        elif key == 'wraa':
-            return float(self.player_info.get('wRAA', 0)) if self.player_info.get('wRAA') else None
-        else:
-            return super().get_value_for_key(key)
\ No newline at end of file
+    POSITION = 'B'
+    COLUMN_MAP = FangraphsPlayerStatLog.COLUMN_MAP + [
+        ColumnSpec('pa', 'PA', 'int'),
+        ColumnSpec('ops', 'OPS', 'float'),
+        ColumnSpec('bb_rate', 'BB%', 'float'),
+        ColumnSpec('k_rate', 'K%', 'float'),
+        ColumnSpec('iso', 'ISO', 'float'),
+        ColumnSpec('wrc_plus', 'wRC+', 'int'),
+        ColumnSpec('wraa', 'wRAA', 'float'),
+    ]
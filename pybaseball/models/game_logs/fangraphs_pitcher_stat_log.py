@@ -1,41 +1,22 @@
 from models.game_logs.fangraphs_player_stat_log import FangraphsPlayerStatLog
-from utils.logger import logger
+from models.game_logs.mapped_stat_log import ColumnSpec
 
 class FangraphsPitcherStatLog(FangraphsPlayerStatLog):
     KEYS = [
-        'fangraphs_player_id', 'normalised_name', 'team', 'position', 'season_year', 'last_updated', # ID
+        'fangraphs_player_id', 'player_id', 'normalised_name', 'team', 'position', 'season_year', 'last_updated', # ID
         'babip', # Advanced batting stats
         'ip', 'whip', 'fip', 'x_fip', 'k_per_9', 'bb_per_9', 'hr_per_9', 'k_pct', 'bb_pct', 'lob_pct' # Advanced pitching stats
     ]
-
-    def __init__(self, player_info, season_year=None):
-        super().__init__(player_info, season_year)
-        self.player_info = player_info
-
-        self.set_values()
-
-    def get_value_for_key(self, key):
-        if key == 'position':
-            return 'P'
-        elif key == 'ip':
-            return float(self.player_info.get('IP', 0)) if self.player_info.get('IP') else None
-        elif key == 'whip':
-            return float(self.player_info.get('WHIP', 0)) if self.player_info.get('WHIP') else None
-        elif key == 'fip':
-            return float(self.player_info.get('FIP', 0)) if self.player_info.get('FIP') else None
-        elif key == 'x_fip':
-            return float(self.player_info.get('xFIP', 0)) if self.player_info.get('xFIP') else None
-        elif key == 'k_per_9':
-            return float(self.player_info.get('K/9', 0)) if self.player_info.get('K/9') else None
-        elif key == 'bb_per_9':
-            return float(self.player_info.get('BB/9', 0)) if self.player_info.get('BB/9') else None
-        elif key == 'hr_per_9':
-            return float(self.player_info.get('HR/9', 0)) if self.player_info.get('HR/9') else None
-        elif key == 'k_pct':
-            return float(self.player_info.get('K%', 0)) if self.player_info.get('K%') else None
-        elif key == 'bb_pct':
-            return float(self.player_info.get('BB%', 0)) if self.player_info.get('BB%') else None
-        elif key == 'lob_pct':
-            return float(self.player_info.get('LOB%', 0)) if self.player_info.get('LOB%') else None
-        else:
-            return super().get_value_for_key(key)
\ No newline at end of file
+    POSITION = 'P'
+    COLUMN_MAP = FangraphsPlayerStatLog.COLUMN_MAP + [
+        ColumnSpec('ip', 'IP', 'float'),
+        ColumnSpec('whip', 'WHIP', 'float'),
+        ColumnSpec('fip', 'FIP', 'float'),
+        ColumnSpec('x_fip', 'xFIP', 'float'),
+        ColumnSpec('k_per_9', 'K/9', 'float'),
+        ColumnSpec('bb_per_9', 'BB/9', 'float'),
+        ColumnSpec('hr_per_9', 'HR/9', 'float'),
+        ColumnSpec('k_pct', 'K%', 'float'),
+        ColumnSpec('bb_pct', 'BB%', 'float'),
+        ColumnSpec('lob_pct', 'LOB%', 'float'),
+    ]
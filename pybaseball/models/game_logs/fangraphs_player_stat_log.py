@@ -1,35 +1,16 @@
-from models.game_logs.mlb_log import MlbLog
-from utils.functions import normalise_name
-from datetime import datetime, timezone
+from models.game_logs.mapped_stat_log import MappedStatLog, ColumnSpec
 
-class FangraphsPlayerStatLog(MlbLog):
+class FangraphsPlayerStatLog(MappedStatLog):
     ID_KEYS = ['fangraphs_player_id', 'position', 'season_year']
-
-    def __init__(self, player_info, season_year=None):
-        super().__init__()
-        self.player_info = player_info
-        self.season_year = season_year if season_year is not None else datetime.now().year
-
-    def get_value_for_key(self, key):
-        if key == 'season_year':
-            return self.season_year
-        elif key == 'fangraphs_player_id':
-            return self.player_info.get('playerid', None)
-        elif key == 'normalised_name':
-            return normalise_name(self.player_info.get('playerName', ''))
-        elif key == 'team':
-            return self.player_info.get('TeamNameAbb', '')
-        elif key == 'last_updated':
-            return datetime.now(timezone.utc)
-        elif key == 'avg':
-            return float(self.player_info.get('AVG', 0)) if self.player_info.get('AVG') else None
-        elif key == 'obp':
-            return float(self.player_info.get('OBP', 0)) if self.player_info.get('OBP') else None
-        elif key == 'slg':
-            return float(self.player_info.get('SLG', 0)) if self.player_info.get('SLG') else None
-        elif key == 'babip':
-            return float(self.player_info.get('BABIP', 0)) if self.player_info.get('BABIP') else None
-        elif key == 'woba':
-            return float(self.player_info.get('wOBA', 0)) if self.player_info.get('wOBA') else None
-        else:
-            return None
\ No newline at end of file
+    # Set from player_lookup before insert; never cleared by a row the lookup could not match
+    COALESCE_KEYS = ['player_id']
+    COLUMN_MAP = [
+        ColumnSpec('fangraphs_player_id', 'playerid', 'raw'),
+        ColumnSpec('normalised_name', 'playerName', 'name'),
+        ColumnSpec('team', 'TeamNameAbb', 'text', ''),
+        ColumnSpec('avg', 'AVG', 'float'),
+        ColumnSpec('obp', 'OBP', 'float'),
+        ColumnSpec('slg', 'SLG', 'float'),
+        ColumnSpec('babip', 'BABIP', 'float'),
+        ColumnSpec('woba', 'wOBA', 'float'),
+    ]
@@ -1,4 +1,5 @@
 from models.game_logs.fangraphs_team_stat_log import FangraphsTeamStatLog
+from models.game_logs.mapped_stat_log import ColumnSpec
 
 class FangraphsTeamPitchingStatLog(FangraphsTeamStatLog):
     KEYS = [
@@ -6,42 +7,21 @@ class FangraphsTeamPitchingStatLog(FangraphsTeamStatLog):
         'ip', 'era', 'whip', 'fip', 'x_fip', 'k_per_9', 'bb_per_9', 'hr_per_9', # Pitching
         'k_pct', 'bb_pct', 'swinging_strike_pct', 'csw_pct', 'ground_ball_pct', 'fly_ball_pct', 'lob_pct', # Statcast
     ]
-
-    def __init__(self, team_data, season_year=None):
-        super().__init__(team_data, season_year)
-        self.team_data = team_data
-        self.set_values()
-
-    def get_value_for_key(self, key):
-        if key == 'ip':
-            return float(self.team_data.get('IP', 0)) if self.team_data.get('IP') else None
-        elif key == 'era':
-            return float(self.team_data.get('ERA', 0)) if self.team_data.get('ERA') else None
-        elif key == 'whip':
-            return float(self.team_data.get('WHIP', 0)) if self.team_data.get('WHIP') else None
-        elif key == 'fip':
-            return float(self.team_data.get('FIP', 0)) if self.team_data.get('FIP') else None
-        elif key == 'x_fip':
-            return float(self.team_data.get('xFIP', 0)) if self.team_data.get('xFIP') else None
-        elif key == 'k_per_9':
-            return float(self.team_data.get('K/9', 0)) if self.team_data.get('K/9') else None
-        elif key == 'bb_per_9':
-            return float(self.team_data.get('BB/9', 0)) if self.team_data.get('BB/9') else None
-        elif key == 'hr_per_9':
-            return float(self.team_data.get('HR/9', 0)) if self.team_data.get('HR/9') else None
-        elif key == 'k_pct':
-            return float(self.team_data.get('K%', 0)) if self.team_data.get('K%') else None
-        elif key == 'bb_pct':
-            return float(self.team_data.get('BB%', 0)) if self.team_data.get('BB%') else None
-        elif key == 'swinging_strike_pct':
-            return float(self.team_data.get('LOB%', 0)) if self.team_data.get('LOB%') else None
-        elif key == 'csw_pct':
-            return float(self.team_data.get('LOB%', 0)) if self.team_data.get('LOB%') else None
-        elif key == 'ground_ball_pct':
-            return float(self.team_data.get('LOB%', 0)) if self.team_data.get('LOB%') else None
-        elif key == 'fly_ball_pct':
-            return float(self.team_data.get('LOB%', 0)) if self.team_data.get('LOB%') else None
-        elif key == 'lob_pct':
-            return float(self.team_data.get('LOB%', 0)) if self.team_data.get('LOB%') else None
-        else:
-            return super().get_value_for_key(key)
\ No newline at end of file
+    COLUMN_MAP = FangraphsTeamStatLog.COLUMN_MAP + [
+        ColumnSpec('ip', 'IP', 'float'),
+        ColumnSpec('era', 'ERA', 'float'),
+        ColumnSpec('whip', 'WHIP', 'float'),
+        ColumnSpec('fip', 'FIP', 'float'),
+        ColumnSpec('x_fip', 'xFIP', 'float'),
+        ColumnSpec('k_per_9', 'K/9', 'float'),
+        ColumnSpec('bb_per_9', 'BB/9', 'float'),
+        ColumnSpec('hr_per_9', 'HR/9', 'float'),
+        ColumnSpec('k_pct', 'K%', 'float'),
+        ColumnSpec('bb_pct', 'BB%', 'float'),
+        # The statcast columns have always been filled from LOB%, kept as-is so stored values don't change
+        ColumnSpec('swinging_strike_pct', 'LOB%', 'float'),
+        ColumnSpec('csw_pct', 'LOB%', 'float'),
+        ColumnSpec('ground_ball_pct', 'LOB%', 'float'),
+        ColumnSpec('fly_ball_pct', 'LOB%', 'float'),
+        ColumnSpec('lob_pct', 'LOB%', 'float'),
+    ]
@@ -1,7 +1,9 @@
 class LogsInserter():
-    def __init__(self, keys, id_keys):
+    def __init__(self, keys, id_keys, coalesce_keys=None):
         self.keys = keys
         self.id_keys = id_keys
+        # Keys only overwritten on duplicate when the new value is not NULL
+        self.coalesce_keys = coalesce_keys or []
         self.rows = []
         self.row_count = 0
 
@@ -15,6 +17,10 @@ class LogsInserter():
         self.rows.append(mlb_log.get_values())
         self.row_count += 1
 
+    def add_rows(self, rows):
+        self.rows.extend(rows)
+        self.row_count += len(rows)
+
     def get_rows(self):
         return self.rows
 
@@ -25,5 +31,8 @@ class LogsInserter():
         return ', '.join(['%s'] * len(self.keys))
 
     def get_duplicate_update_keys(self):
-        duplicate_update_keys = [f'{key} = VALUES({key})' for key in self.keys if key not in self.id_keys]
+        duplicate_update_keys = [
+            f'{key} = COALESCE(VALUES({key}), {key})' if key in self.coalesce_keys else f'{key} = VALUES({key})'
+            for key in self.keys if key not in self.id_keys
+        ]
         return ', '.join(duplicate_update_keys)
\ No newline at end of file
@@ -0,0 +1,87 @@
+from collections import namedtuple
+from functools import lru_cache
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+from utils.functions import normalise_name
+
+# target: stat table column, source: source column (a tuple for derived columns),
+# converter: one of CONVERTERS or a callable over the cleaned source columns,
+# default: value used when the source is missing (text columns only)
+ColumnSpec = namedtuple('ColumnSpec', ['target', 'source', 'converter', 'default'], defaults=[None])
+
+
+@lru_cache(maxsize=None)
+def cached_normalise_name(name):
+    return normalise_name(name)
+
+
+def to_float(series, default=None):
+    # Falsy source values (missing, empty, 0) are stored as NULL, as the per-row stat logs did
+    values = pd.to_numeric(series, errors='coerce').astype(float)
+    return values.where(values != 0)
+
+
+def to_int(series, default=None):
+    return np.trunc(to_float(series)).astype('Int64')
+
+
+def to_text(series, default=None):
+    return series.where(series.notna(), default)
+
+
+def to_normalised_name(series, default=None):
+    names = series.fillna('')
+    return names.map({name: cached_normalise_name(name) for name in names.unique()})
+
+
+def to_raw(series, default=None):
+    return series
+
+
+CONVERTERS = {
+    'float': to_float,
+    'int': to_int,
+    'text': to_text,
+    'name': to_normalised_name,
+    'raw': to_raw,
+}
+
+
+class MappedStatLog:
+    """Declarative source column -> stat table column mapping, applied to a whole DataFrame at once"""
+    KEYS = [] # Set in child class
+    ID_KEYS = [] # Set in child class
+    COLUMN_MAP = [] # Set in child class
+    COALESCE_KEYS = []
+    POSITION = None
+
+    @classmethod
+    def get_rows(cls, frame: pd.DataFrame, season_year=None):
+        """Return one tuple per source row, ordered like KEYS and ready for batch_upsert"""
+        if season_year is None:
+            season_year = datetime.now().year
+        constants = {'season_year': season_year, 'last_updated': datetime.now(timezone.utc), 'position': cls.POSITION}
+        mapped = {spec.target: spec for spec in cls.COLUMN_MAP}
+
+        columns = {}
+        for key in cls.KEYS:
+            if key in mapped:
+                column = cls.map_column(frame, mapped[key])
+                columns[key] = column.astype(object).where(column.notna(), None)
+            else:
+                columns[key] = pd.Series([constants.get(key)] * len(frame), index=frame.index, dtype=object)
+        return list(pd.DataFrame(columns, index=frame.index).itertuples(index=False, name=None))
+
+    @classmethod
+    def map_column(cls, frame, spec):
+        if isinstance(spec.source, tuple):
+            sources = [cls.get_source(frame, source, 'float') for source in spec.source]
+            return spec.converter(*sources)
+        return cls.get_source(frame, spec.source, spec.converter, spec.default)
+
+    @classmethod
+    def get_source(cls, frame, source, converter, default=None):
+        if source not in frame.columns:
+            return pd.Series(default, index=frame.index, dtype=float if converter in ('float', 'int') else object)
+        return CONVERTERS[converter](frame[source], default)
@@ -1,63 +1,31 @@
 from models.game_logs.savant_player_stat_log import SavantPlayerStatLog
-import math
-import logging
+from models.game_logs.mapped_stat_log import ColumnSpec
 
-logger = logging.getLogger(__name__)
+def contact_pct(zone_contact_pct, zone_swings, out_of_zone_contact_pct, out_of_zone_swings):
+    # Swing-weighted blend of in and out of zone contact; NULL unless every input is present
+    total_swings = zone_swings + out_of_zone_swings
+    return ((zone_contact_pct * zone_swings) + (out_of_zone_contact_pct * out_of_zone_swings)) / total_swings
 
 class SavantAdvancedBatterStatLog(SavantPlayerStatLog):
     KEYS = [
-        'player_id', 'position', 'season_year', 'last_updated', # ID
+        'player_id', 'normalised_name', 'position', 'season_year', 'last_updated', # ID
         'games', 'ab', 'hits', 'hr', 'rbi', 'runs', 'sb', # Basic counting stats
         'chase_pct', 'contact_pct', 'zone_contact_pct', 'whiff_pct', # Plate discipline
         'sprint_speed', 'age' # Meta
     ]
-
-    def __init__(self, player_data: dict, season_year=None):
-        super().__init__(player_data, season_year)
-        self.player_data = player_data
-
-        self.zone_contact_pct = self.get_clean_value('iz_contact_percent')
-        zone_swings = self.get_clean_value('in_zone_swing')
-        self.out_of_zone_contact_pct = self.get_clean_value('oz_contact_percent')
-        out_of_zone_swings = self.get_clean_value('out_zone_swing')
-        if zone_swings and out_of_zone_swings and self.zone_contact_pct and self.out_of_zone_contact_pct:
-            total_swings = zone_swings + out_of_zone_swings
-            contact_pct = ((self.zone_contact_pct * zone_swings) + (self.out_of_zone_contact_pct * out_of_zone_swings)) / total_swings
-            self.contact_pct = contact_pct if not math.isnan(contact_pct) else None
-        else:
-            self.contact_pct = None
-        
-        self.set_values()
-
-
-    def get_value_for_key(self, key: str):
-        if key == 'position':
-            return 'B'
-        elif key == 'chase_pct':
-            return self.out_of_zone_contact_pct
-        elif key == 'contact_pct':
-            return self.contact_pct
-        elif key == 'zone_contact_pct':
-            return self.zone_contact_pct
-        elif key == 'whiff_pct':
-            return self.get_clean_value('whiff_percent')
-        elif key == 'sprint_speed':
-            return self.get_clean_value('sprint_speed')
-        elif key == 'age':
-            return self.get_clean_value('player_age')
-        elif key == 'games':
-            return self.get_clean_value('b_game')
-        elif key == 'ab':
-            return self.get_clean_value('ab')
-        elif key == 'hits':
-            return self.get_clean_value('hit')
-        elif key == 'hr':
-            return self.get_clean_value('home_run')
-        elif key == 'rbi':
-            return self.get_clean_value('b_rbi')
-        elif key == 'runs':
-            return self.get_clean_value('r_run')
-        elif key == 'sb':
-            return self.get_clean_value('r_total_stolen_base')
-        else:
-            return super().get_value_for_key(key)
\ No newline at end of file
+    POSITION = 'B'
+    COLUMN_MAP = SavantPlayerStatLog.COLUMN_MAP + [
+        ColumnSpec('games', 'b_game', 'int'),
+        ColumnSpec('ab', 'ab', 'int'),
+        ColumnSpec('hits', 'hit', 'int'),
+        ColumnSpec('hr', 'home_run', 'int'),
+        ColumnSpec('rbi', 'b_rbi', 'int'),
+        ColumnSpec('runs', 'r_run', 'int'),
+        ColumnSpec('sb', 'r_total_stolen_base', 'int'),
+        ColumnSpec('chase_pct', 'oz_contact_percent', 'float'),
+        ColumnSpec('contact_pct', ('iz_contact_percent', 'in_zone_swing', 'oz_contact_percent', 'out_zone_swing'), contact_pct),
+        ColumnSpec('zone_contact_pct', 'iz_contact_percent', 'float'),
+        ColumnSpec('whiff_pct', 'whiff_percent', 'float'),
+        ColumnSpec('sprint_speed', 'sprint_speed', 'float'),
+        ColumnSpec('age', 'player_age', 'int'),
+    ]
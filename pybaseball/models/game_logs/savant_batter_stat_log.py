@@ -1,28 +1,16 @@
 from models.game_logs.savant_player_stat_log import SavantPlayerStatLog
+from models.game_logs.mapped_stat_log import ColumnSpec
 
 class SavantBatterStatLog(SavantPlayerStatLog):
     KEYS = [
-        'player_id', 'position', 'season_year', 'last_updated', # ID
+        'player_id', 'normalised_name', 'position', 'season_year', 'last_updated', # ID
         'barrel_pct', 'hard_hit_pct', 'avg_ev', 'max_ev', 'sweet_spot_pct' # Statcast batting stats
     ]
-
-    def __init__(self, player_data: dict, season_year=None):
-        super().__init__(player_data, season_year)
-        self.player_data = player_data
-        self.set_values()
-
-    def get_value_for_key(self, key: str):
-        if key == 'position':
-            return 'B'
-        elif key == 'barrel_pct':
-            return self.get_clean_value('brl_percent')
-        elif key == 'hard_hit_pct':
-            return self.get_clean_value('ev95percent')
-        elif key == 'avg_ev':
-            return self.get_clean_value('avg_hit_speed')
-        elif key == 'max_ev':
-            return self.get_clean_value('max_hit_speed')
-        elif key == 'sweet_spot_pct':
-            return self.get_clean_value('anglesweetspotpercent')
-        else:
-            return super().get_value_for_key(key)
\ No newline at end of file
+    POSITION = 'B'
+    COLUMN_MAP = SavantPlayerStatLog.COLUMN_MAP + [
+        ColumnSpec('barrel_pct', 'brl_percent', 'float'),
+        ColumnSpec('hard_hit_pct', 'ev95percent', 'float'),
+        ColumnSpec('avg_ev', 'avg_hit_speed', 'float'),
+        ColumnSpec('max_ev', 'max_hit_speed', 'float'),
+        ColumnSpec('sweet_spot_pct', 'anglesweetspotpercent', 'float'),
+    ]
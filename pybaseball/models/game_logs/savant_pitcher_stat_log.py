@@ -1,74 +1,39 @@
 from models.game_logs.savant_player_stat_log import SavantPlayerStatLog
-import math
+from models.game_logs.mapped_stat_log import ColumnSpec
+
+def csw_pct(called_strikes, swinging_strikes, total_pitches):
+    return (called_strikes + swinging_strikes) * 100 / total_pitches
+
+def swinging_strike_pct(swinging_strikes, total_pitches):
+    swinging_strike_pct = swinging_strikes * 100 / total_pitches
+    return swinging_strike_pct.where(swinging_strike_pct < 100)
 
 class SavantPitcherStatLog(SavantPlayerStatLog):
     KEYS = [
-        'player_id', 'position', 'season_year', 'last_updated', # ID
+        'player_id', 'normalised_name', 'position', 'season_year', 'last_updated', # ID
         'games', 'hits', 'hr', 'runs', 'avg', 'obp', 'slg',  # Basic counting stats
         'woba', 'era',  # Advanced batting/pitching stats
         'csw_pct', 'swinging_strike_pct', 'ground_ball_pct', 'fly_ball_pct', # Advanced pitching stats
         'qs', 'sv', 'hld', # Results based
         'age' # Meta
     ]
-
-    def __init__(self, player_data: dict, season_year=None):
-        super().__init__(player_data, season_year)
-        self.player_data = player_data
-        
-        swinging_strikes = self.get_clean_value('p_swinging_strike')
-        called_strikes = self.get_clean_value('p_called_strike')
-        total_pitches = self.get_clean_value('pitch_count')
-
-        if swinging_strikes and called_strikes and total_pitches:
-            called_strikes_whiffs_pct = (called_strikes + swinging_strikes) * 100 / total_pitches
-            self.called_strikes_whiffs_pct = called_strikes_whiffs_pct if not math.isnan(called_strikes_whiffs_pct) else None
-        else:
-            self.called_strikes_whiffs_pct = None
-        
-        if swinging_strikes and total_pitches:
-            swinging_strike_pct = swinging_strikes * 100 / total_pitches
-            self.swinging_strike_pct = swinging_strike_pct if not math.isnan(swinging_strike_pct) and swinging_strike_pct < 100 else None
-        else:
-            self.swinging_strike_pct = None
-        
-        self.set_values()
-
-    def get_value_for_key(self, key: str):
-        if key == 'position':
-            return 'P'
-        elif key == 'csw_pct':
-            return self.called_strikes_whiffs_pct
-        elif key == 'swinging_strike_pct':
-            return self.swinging_strike_pct
-        elif key == 'ground_ball_pct':
-            return self.get_clean_value('groundballs_percent')
-        elif key == 'fly_ball_pct':
-            return self.get_clean_value('flyballs_percent')
-        elif key == 'qs':
-            return self.get_clean_value('p_quality_start')
-        elif key == 'sv':
-            return self.get_clean_value('p_save')
-        elif key == 'hld':
-            return self.get_clean_value('p_hold')
-        elif key == 'age':
-            return self.get_clean_value('player_age')
-        elif key == 'games':
-            return self.get_clean_value('p_game')
-        elif key == 'hits':
-            return self.get_clean_value('hit')
-        elif key == 'hr':
-            return self.get_clean_value('home_run')
-        elif key == 'runs':
-            return self.get_clean_value('p_run')
-        elif key == 'avg':
-            return self.get_clean_value('batting_avg')
-        elif key == 'obp':
-            return self.get_clean_value('on_base_percent')
-        elif key == 'slg':
-            return self.get_clean_value('slg_percent')
-        elif key == 'woba':
-            return self.get_clean_value('woba')
-        elif key == 'era':
-            return self.get_clean_value('p_era')
-        else:
-            return super().get_value_for_key(key)
\ No newline at end of file
+    POSITION = 'P'
+    COLUMN_MAP = SavantPlayerStatLog.COLUMN_MAP + [
+        ColumnSpec('games', 'p_game', 'int'),
+        ColumnSpec('hits', 'hit', 'int'),
+        ColumnSpec('hr', 'home_run', 'int'),
+        ColumnSpec('runs', 'p_run', 'int'),
+        ColumnSpec('avg', 'batting_avg', 'float'),
+        ColumnSpec('obp', 'on_base_percent', 'float'),
+        ColumnSpec('slg', 'slg_percent', 'float'),
+        ColumnSpec('woba', 'woba', 'float'),
+        ColumnSpec('era', 'p_era', 'float'),
+        ColumnSpec('csw_pct', ('p_called_strike', 'p_swinging_strike', 'pitch_count'), csw_pct),
+        ColumnSpec('swinging_strike_pct', ('p_swinging_strike', 'pitch_count'), swinging_strike_pct),
+        ColumnSpec('ground_ball_pct', 'groundballs_percent', 'float'),
+        ColumnSpec('fly_ball_pct', 'flyballs_percent', 'float'),
+        ColumnSpec('qs', 'p_quality_start', 'int'),
+        ColumnSpec('sv', 'p_save', 'int'),
+        ColumnSpec('hld', 'p_hold', 'int'),
+        ColumnSpec('age', 'player_age', 'int'),
+    ]
@@ -4,10 +4,11 @@ from models.game_logs.logs_inserter import LogsInserter
 
 class GamePitchers(GameLogsDB):
     GAME_PITCHERS_TABLE = "game_pitchers"
+    ARCHIVE_TABLE = "game_pitchers_archive"
 
-    def __init__(self, conn):
+    def __init__(self, conn, archive=False):
         self.conn = conn
-        super().__init__(conn, self.GAME_PITCHERS_TABLE)
+        super().__init__(conn, self.ARCHIVE_TABLE if archive else self.GAME_PITCHERS_TABLE)
 
     def upsert_game_pitchers(self, game_pitchers: LogsInserter):
         if game_pitchers.is_empty():
@@ -38,12 +38,13 @@ class LeagueGameLogs():
             
         return min(latest_player_date, latest_team_date, latest_game_pitcher_date)
 
-    def upsert_game_logs(self, games):
+    def upsert_game_logs(self, games, update_advanced_statistics=True):
         player_game_logs, team_game_logs, game_pitchers = self.process_game_logs(games)
         self.player_game_logs.upsert_game_logs(player_game_logs)
         self.team_game_logs.upsert_game_logs(team_game_logs)
         self.game_pitchers.upsert_game_pitchers(game_pitchers)
-        self.team_game_logs.update_advanced_statistics()
+        if update_advanced_statistics:
+            self.team_game_logs.update_advanced_statistics({game['game_pk'] for game in games})
 
     def compute_rolling_stats(self, season_year=None):
         from datetime import datetime
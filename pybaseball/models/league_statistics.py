@@ -1,4 +1,7 @@
+import numpy as np
+import pandas as pd
 from utils.logger import logger
+from utils.constants import FIP_CONSTANT
 from models.db_recorder import DB_Recorder
 from models.player_game_logs import PlayerGameLogs
 from models.team_game_logs import TeamGameLogs
@@ -7,10 +10,19 @@ from datetime import datetime
 class LeagueStatistics(DB_Recorder):
     ROLLING_STATS_TABLE = "league_rolling_stats"
     ADVANCED_ROLLING_STATS_TABLE = "league_advanced_rolling_stats"
+    ROLLING_STATS_KEYS = [
+        'avg', 'obp', 'slg', 'ops',
+        'hr_per_game', 'sb_per_game', 'rbi_per_game', 'runs_per_game', 'k_per_game', 'bb_per_game',
+        'whip', 'era', 'fip', 'qs_rate',
+    ]
+    ADVANCED_ROLLING_STATS_KEYS = ['obp', 'slg', 'ops', 'woba', 'fip']
+    PLAYER_ADVANCED_SOURCE_KEYS = ['player_id', 'position', 'split_type', 'span_days', 'start_date', 'end_date', 'abs', 'pa', 'ip', 'obp', 'slg', 'ops', 'woba', 'fip']
 
     def __init__(self, conn):
         self.conn = conn
         super().__init__(conn)
+        # player_advanced_rolling_stats read once per season and shared by both league average tables
+        self.player_advanced_rolling_stats = {}
 
     def compute_league_averages(self, season_year=None):
         if season_year is None:
@@ -20,11 +32,20 @@ class LeagueStatistics(DB_Recorder):
 
         try:
             logger.info(f"Computing league averages for {season_year}")
+            rows = (
+                self.compute_player_averages(season_year)
+                + self.compute_team_averages(season_year)
+                + self.compute_basic_team_vs_batter_averages(season_year)
+                + self.compute_basic_team_vs_pitcher_averages(season_year)
+            )
             self.purge_season_records_in_transaction(self.ROLLING_STATS_TABLE, season_year)
-            self.compute_player_averages(season_year)
-            self.compute_team_averages(season_year)
-            self.compute_basic_team_vs_batter_averages(season_year)
-            self.compute_basic_team_vs_pitcher_averages(season_year)
+            insert_keys = ['season_year', 'entity_type', 'split_type', 'span_days'] + self.ROLLING_STATS_KEYS + ['entity_count']
+            insert_query = f"""
+                INSERT INTO {self.ROLLING_STATS_TABLE} ({', '.join(insert_keys)})
+                VALUES ({', '.join(['%s'] * len(insert_keys))})
+            """
+            logger.info(f"Inserting {len(rows)} league average rows")
+            self.batch_upsert_in_transaction(insert_query, rows)
 
             # Commit transaction
             self.commit_transaction()
@@ -35,117 +56,159 @@ class LeagueStatistics(DB_Recorder):
             self.rollback_transaction()
             raise
 
-    def compute_player_averages(self, season_year=None):
+    def compute_advanced_league_averages(self, season_year=None):
+        """Pool player advanced rolling stats back into league-wide obp/slg/ops/woba/fip per split and window.
+
+        Runs inside the caller's transaction, after the player rows are written and before the +/- stats use them.
+        Rates are re-weighted by their denominators (pa, abs, ip) so the result matches aggregating the game logs.
+        """
         if season_year is None:
             season_year = datetime.now().year
-        logger.info("Computing player league averages (basic and advanced)")
+        logger.info(f"Computing advanced league averages for {season_year}")
+        player_stats = self.load_player_advanced_rolling_stats(season_year, refresh=True)
+        self.purge_season_records_in_transaction(self.ADVANCED_ROLLING_STATS_TABLE, season_year)
+        if player_stats.empty:
+            logger.info("No player advanced rolling stats to average")
+            return
+
+        batters = player_stats[player_stats['position'] == 'B']
+        pitchers = player_stats[player_stats['position'] == 'P']
+        batting = batters.assign(
+            obp_num=batters['obp'] * batters['pa'],
+            slg_num=batters['slg'] * batters['abs'],
+            woba_num=batters['woba'] * batters['pa'],
+        ).groupby(['split_type', 'span_days'])[['obp_num', 'slg_num', 'woba_num', 'pa', 'abs']].sum()
+        pitching = pitchers.assign(
+            fip_num=(pitchers['fip'] - FIP_CONSTANT) * pitchers['ip'],
+        ).groupby(['split_type', 'span_days'])[['fip_num', 'ip']].sum()
+        dates = player_stats.groupby(['split_type', 'span_days'])[['start_date', 'end_date']].first()
+
+        averages = dates.join(batting, how='left').join(pitching, how='left')
+        pa = averages['pa'].replace(0, np.nan)
+        obp = averages['obp_num'] / pa
+        slg = averages['slg_num'] / averages['abs'].replace(0, np.nan)
+        averages['obp'] = obp.round(3)
+        averages['slg'] = slg.round(3)
+        averages['ops'] = (obp + slg).round(3)
+        averages['woba'] = (averages['woba_num'] / pa).round(3)
+        averages['fip'] = (averages['fip_num'] / averages['ip'].replace(0, np.nan) + FIP_CONSTANT).round(2)
+
+        rows = [
+            (season_year, split_type, int(span_days), row['start_date'], row['end_date'], *self.to_sql_values(row, self.ADVANCED_ROLLING_STATS_KEYS))
+            for (split_type, span_days), row in averages.iterrows()
+        ]
+        insert_keys = ['season_year', 'split_type', 'span_days', 'start_date', 'end_date'] + self.ADVANCED_ROLLING_STATS_KEYS
         insert_query = f"""
-            INSERT INTO {self.ROLLING_STATS_TABLE} (
-                season_year, entity_type, split_type, span_days,
-                avg, whip, era,
-                hr_per_game, sb_per_game, rbi_per_game, runs_per_game, k_per_game, qs_rate,
-                obp, slg, ops, fip,
-                entity_count
-            )
-            SELECT
-                {season_year}, 'player', pr.split_type, pr.span_days,
-                AVG(pr.avg), AVG(pr.whip), AVG(pr.era),
-                AVG(pr.hr / NULLIF(pr.games, 0)),
-                AVG(pr.sb / NULLIF(pr.games, 0)),
-                AVG(pr.rbi / NULLIF(pr.games, 0)),
-                AVG(pr.runs / NULLIF(pr.games, 0)),
-                AVG(pr.k / NULLIF(pr.games, 0)),
-                AVG(pr.qs / NULLIF(pr.games, 0)),
-                AVG(par.obp), AVG(par.slg), AVG(par.ops), AVG(par.fip),
-                COUNT(*)
-            FROM {PlayerGameLogs.BASIC_ROLLING_STATS_TABLE} pr
-            LEFT JOIN {PlayerGameLogs.ADVANCED_ROLLING_STATS_TABLE} par
-                ON pr.player_id = par.player_id
-                AND pr.season_year = par.season_year
-                AND pr.split_type = par.split_type
-                AND pr.span_days = par.span_days
-            WHERE pr.season_year = {season_year}
-            GROUP BY pr.split_type, pr.span_days;
+            INSERT INTO {self.ADVANCED_ROLLING_STATS_TABLE} ({', '.join(insert_keys)})
+            VALUES ({', '.join(['%s'] * len(insert_keys))})
+            ON DUPLICATE KEY UPDATE {', '.join([f'{key} = VALUES({key})' for key in insert_keys])}
         """
-        self.execute_query_in_transaction(insert_query)
+        self.batch_upsert_in_transaction(insert_query, rows)
 
+    def compute_player_averages(self, season_year=None):
+        if season_year is None:
+            season_year = datetime.now().year
+        logger.info("Computing player league averages (basic and advanced)")
+        basic = self.load_table(
+            PlayerGameLogs.BASIC_ROLLING_STATS_TABLE,
+            ['player_id', 'position', 'split_type', 'span_days', 'games', 'avg', 'whip', 'era', 'hr', 'sb', 'rbi', 'runs', 'k', 'qs'],
+            season_year,
+        )
+        if basic.empty:
+            return []
+        advanced = self.load_player_advanced_rolling_stats(season_year)[['player_id', 'position', 'split_type', 'span_days', 'obp', 'slg', 'ops', 'fip']]
+        players = basic.merge(advanced, on=['player_id', 'position', 'split_type', 'span_days'], how='left')
+        games = players['games'].replace(0, np.nan)
+        players = players.assign(
+            hr_per_game=players['hr'] / games,
+            sb_per_game=players['sb'] / games,
+            rbi_per_game=players['rbi'] / games,
+            runs_per_game=players['runs'] / games,
+            k_per_game=players['k'] / games,
+            qs_rate=players['qs'] / games,
+        )
+        return self.average_entities(
+            players, 'player', 'split_type', season_year,
+            ['avg', 'whip', 'era', 'hr_per_game', 'sb_per_game', 'rbi_per_game', 'runs_per_game', 'k_per_game', 'qs_rate', 'obp', 'slg', 'ops', 'fip'],
+        )
 
     def compute_team_averages(self, season_year=None):
         if season_year is None:
             season_year = datetime.now().year
         logger.info("Computing team league averages")
-        insert_query = f"""
-            INSERT INTO {self.ROLLING_STATS_TABLE} (
-                season_year, entity_type, split_type, span_days,
-                avg, obp, slg, ops,
-                era, whip, fip,
-                runs_per_game, k_per_game, bb_per_game,
-                entity_count
-            )
-            SELECT
-                {season_year}, 'team', trs.split_type, trs.span_days,
-                AVG(trs.avg), AVG(trs.obp), AVG(trs.slg), AVG(trs.ops),
-                AVG(trs.era), AVG(trs.whip), AVG(trs.fip),
-                AVG(trs.avg_runs_scored),
-                AVG(trs.strikeouts / NULLIF(trs.games_played, 0)),
-                AVG(trs.walks / NULLIF(trs.games_played, 0)),
-                COUNT(*)
-            FROM {TeamGameLogs.ROLLING_STATS_TABLE} trs
-            WHERE trs.season_year = {season_year}
-            GROUP BY trs.split_type, trs.span_days;
-        """
-        self.execute_query_in_transaction(insert_query)
+        teams = self.load_table(
+            TeamGameLogs.ROLLING_STATS_TABLE,
+            ['split_type', 'span_days', 'games_played', 'avg', 'obp', 'slg', 'ops', 'era', 'whip', 'fip', 'avg_runs_scored', 'strikeouts', 'walks'],
+            season_year,
+        )
+        if teams.empty:
+            return []
+        games = teams['games_played'].replace(0, np.nan)
+        teams = teams.assign(
+            runs_per_game=teams['avg_runs_scored'],
+            k_per_game=teams['strikeouts'] / games,
+            bb_per_game=teams['walks'] / games,
+        )
+        return self.average_entities(
+            teams, 'team', 'split_type', season_year,
+            ['avg', 'obp', 'slg', 'ops', 'era', 'whip', 'fip', 'runs_per_game', 'k_per_game', 'bb_per_game'],
+        )
 
     def compute_basic_team_vs_batter_averages(self, season_year=None):
         if season_year is None:
             season_year = datetime.now().year
         logger.info("Computing basic team vs batter league averages")
-        insert_query = f"""
-            INSERT INTO {self.ROLLING_STATS_TABLE} (
-                season_year, entity_type, span_days, split_type,
-                avg, obp, slg, ops,
-                hr_per_game, sb_per_game, rbi_per_game, runs_per_game, k_per_game, bb_per_game,
-                entity_count
-            )
-            SELECT
-                {season_year}, 'team_vs_batter', tvb.span_days, tvb.bats AS split_type,
-                AVG(tvb.avg), AVG(tvb.obp), AVG(tvb.slg), AVG(tvb.ops),
-                AVG(tvb.hr / NULLIF(tvb.games_played, 0)),
-                AVG(tvb.sb / NULLIF(tvb.games_played, 0)),
-                AVG(tvb.rbi / NULLIF(tvb.games_played, 0)),
-                AVG(tvb.runs / NULLIF(tvb.games_played, 0)),
-                AVG(tvb.k / NULLIF(tvb.games_played, 0)),
-                AVG(tvb.bb / NULLIF(tvb.games_played, 0)),
-                COUNT(*)
-            FROM {TeamGameLogs.TEAM_VS_BATTER_SPLITS_TABLE} tvb
-            WHERE tvb.season_year = {season_year}
-            GROUP BY tvb.span_days, tvb.bats;
-        """
-        self.execute_query_in_transaction(insert_query)
+        return self.compute_team_vs_split_averages(TeamGameLogs.TEAM_VS_BATTER_SPLITS_TABLE, 'team_vs_batter', 'bats', season_year)
 
     def compute_basic_team_vs_pitcher_averages(self, season_year=None):
         if season_year is None:
             season_year = datetime.now().year
         logger.info("Computing basic team vs pitcher league averages")
-        insert_query = f"""
-            INSERT INTO {self.ROLLING_STATS_TABLE} (
-                season_year, entity_type, span_days, split_type,
-                avg, obp, slg, ops,
-                hr_per_game, sb_per_game, rbi_per_game, runs_per_game, k_per_game, bb_per_game,
-                entity_count
+        return self.compute_team_vs_split_averages(TeamGameLogs.TEAM_VS_PITCHER_SPLITS_TABLE, 'team_vs_pitcher', 'throws', season_year)
+
+    def compute_team_vs_split_averages(self, table_name, entity_type, hand_key, season_year):
+        splits = self.load_table(
+            table_name,
+            [hand_key, 'span_days', 'games_played', 'avg', 'obp', 'slg', 'ops', 'hr', 'sb', 'rbi', 'runs', 'k', 'bb'],
+            season_year,
+        )
+        if splits.empty:
+            return []
+        games = splits['games_played'].replace(0, np.nan)
+        splits = splits.assign(**{f'{stat}_per_game': splits[stat] / games for stat in ['hr', 'sb', 'rbi', 'runs', 'k', 'bb']})
+        return self.average_entities(
+            splits, entity_type, hand_key, season_year,
+            ['avg', 'obp', 'slg', 'ops', 'hr_per_game', 'sb_per_game', 'rbi_per_game', 'runs_per_game', 'k_per_game', 'bb_per_game'],
+        )
+
+    def average_entities(self, entities, entity_type, split_key, season_year, stat_keys):
+        """Mean of each stat per (split, span), ignoring missing values like SQL AVG; rows ordered for ROLLING_STATS_TABLE"""
+        grouped = entities.groupby([split_key, 'span_days'])
+        averages = grouped[stat_keys].mean()
+        averages['entity_count'] = grouped.size()
+        return [
+            (season_year, entity_type, split_type, int(span_days), *self.to_sql_values(row, self.ROLLING_STATS_KEYS), int(row['entity_count']))
+            for (split_type, span_days), row in averages.iterrows()
+        ]
+
+    def load_player_advanced_rolling_stats(self, season_year, refresh=False):
+        if refresh or season_year not in self.player_advanced_rolling_stats:
+            self.player_advanced_rolling_stats[season_year] = self.load_table(
+                PlayerGameLogs.ADVANCED_ROLLING_STATS_TABLE, self.PLAYER_ADVANCED_SOURCE_KEYS, season_year
             )
-            SELECT
-                {season_year}, 'team_vs_pitcher', tvp.span_days, tvp.throws AS split_type,
-                AVG(tvp.avg), AVG(tvp.obp), AVG(tvp.slg), AVG(tvp.ops),
-                AVG(tvp.hr / NULLIF(tvp.games_played, 0)),
-                AVG(tvp.sb / NULLIF(tvp.games_played, 0)),
-                AVG(tvp.rbi / NULLIF(tvp.games_played, 0)),
-                AVG(tvp.runs / NULLIF(tvp.games_played, 0)),
-                AVG(tvp.k / NULLIF(tvp.games_played, 0)),
-                AVG(tvp.bb / NULLIF(tvp.games_played, 0)),
-                COUNT(*)
-            FROM {TeamGameLogs.TEAM_VS_PITCHER_SPLITS_TABLE} tvp
-            WHERE tvp.season_year = {season_year}
-            GROUP BY tvp.span_days, tvp.throws;
-        """
-        self.execute_query_in_transaction(insert_query)
\ No newline at end of file
+        return self.player_advanced_rolling_stats[season_year]
+
+    def load_table(self, table_name, fields, season_year):
+        """Read one season of a rolling/split table, with DECIMAL columns converted to floats"""
+        with self.conn.cursor(dictionary=True) as cursor:
+            cursor.execute(f"SELECT {', '.join(fields)} FROM {table_name} WHERE season_year = %s", (season_year,))
+            rows = cursor.fetchall()
+        frame = pd.DataFrame(rows, columns=fields)
+        for field in fields:
+            if field not in ('player_id', 'position', 'split_type', 'span_days', 'bats', 'throws', 'start_date', 'end_date'):
+                frame[field] = pd.to_numeric(frame[field], errors='coerce').astype(float)
+        return frame
+
+    @staticmethod
+    def to_sql_values(row, keys):
+        return [None if key not in row or pd.isna(row[key]) else float(row[key]) for key in keys]
@@ -0,0 +1,125 @@
+from datetime import datetime
+from models.db_recorder import DB_Recorder
+from models.player_game_logs import PlayerGameLogs
+from models.season_stats import SeasonStats
+from models.sync_status import SyncStatus
+from models.team_game_logs import TeamGameLogs
+from utils.constants import ROLLING_WINDOWS
+from utils.logger import logger
+
+class MatchupFeatures(DB_Recorder):
+    """Per-pitcher and per-team inputs shared by the probable pitcher scores, keyed by (player_id or team, split, span)."""
+    PITCHER_FEATURES_TABLE = "pitcher_matchup_features"
+    TEAM_FEATURES_TABLE = "team_matchup_features"
+    SYNC_NAME = "matchup_features"
+    PITCHER_FEATURE_KEYS = ['games', 'ip', 'qs', 'nrfi', 'fip_minus_pct', 'k_pct_pct', 'bb_pct_pct', 'hr_per_9_pct']
+    TEAM_FEATURE_KEYS = ['avg_runs_scored_pct', 'nrfi_pct', 'vs_hand_ops_pct', 'vs_hand_so_rate_pct', 'vs_hand_nrfi_pct']
+    HAND_SPLITS = {'L': 'vs_lhp', 'R': 'vs_rhp'}
+
+    def __init__(self, conn, sync_status: SyncStatus = None):
+        super().__init__(conn)
+        self.sync_status = sync_status if sync_status is not None else SyncStatus(conn)
+        self.player_rolling_stats_table = PlayerGameLogs.BASIC_ROLLING_STATS_TABLE
+        self.player_advanced_rolling_stats_percentiles_table = PlayerGameLogs.ADVANCED_ROLLING_STATS_TABLE + "_percentiles"
+        self.player_season_stats_percentiles_table = SeasonStats.PLAYER_STATS_TABLE + "_percentiles"
+        self.team_rolling_stats_percentiles_table = TeamGameLogs.ROLLING_STATS_TABLE + "_percentiles"
+        self.team_vs_pitcher_splits_percentiles_table = TeamGameLogs.TEAM_VS_PITCHER_SPLITS_TABLE + "_percentiles"
+        # (table, change timestamp column) the features are derived from
+        self.source_tables = [
+            (self.player_rolling_stats_table, 'updated_at'),
+            (self.player_advanced_rolling_stats_percentiles_table, 'updated_at'),
+            (self.player_season_stats_percentiles_table, 'last_updated'),
+            (self.team_rolling_stats_percentiles_table, 'updated_at'),
+            (self.team_vs_pitcher_splits_percentiles_table, 'updated_at'),
+        ]
+
+    def refresh_features(self, season_year=None, force=False):
+        """Rebuild the feature tables for a season only when a source table has changed since the last build"""
+        if season_year is None:
+            season_year = datetime.now().year
+        sync_name = f"{self.SYNC_NAME}_{season_year}"
+        fingerprint = self.get_source_fingerprint(season_year)
+        if not force and self.sync_status.get_last_message(sync_name) == fingerprint:
+            logger.info(f"Matchup features for {season_year} are up to date")
+            return False
+
+        self.build_features(season_year)
+        self.sync_status.set_sync_status(sync_name, 'success', fingerprint)
+        return True
+
+    def get_source_fingerprint(self, season_year):
+        """Row count and latest change of every source table for the season; purge-and-recompute always moves it"""
+        query = " UNION ALL ".join(
+            f"SELECT '{table_name}' AS table_name, COUNT(*) AS row_count, MAX({timestamp_column}) AS last_change "
+            f"FROM {table_name} WHERE season_year = %s"
+            for table_name, timestamp_column in self.source_tables
+        )
+        rows = self.get_query(query, tuple(season_year for _ in self.source_tables))
+        return ';'.join(f"{row['table_name']}:{row['row_count']}:{row['last_change']}" for row in rows)
+
+    def build_features(self, season_year):
+        logger.info(f"Building matchup features for {season_year}")
+        self.begin_transaction()
+        try:
+            self.purge_season_records_in_transaction(self.PITCHER_FEATURES_TABLE, season_year)
+            self.purge_season_records_in_transaction(self.TEAM_FEATURES_TABLE, season_year)
+            self.insert_pitcher_features(season_year)
+            self.insert_team_features(season_year)
+            self.commit_transaction()
+            logger.info(f"Matchup features for {season_year} built successfully")
+        except Exception as e:
+            logger.exception(f"Error building matchup features: {e}")
+            self.rollback_transaction()
+            raise e
+
+    def insert_pitcher_features(self, season_year):
+        # Rolling form for every pitcher split and window, with season percentiles attached to each row
+        self.execute_query_in_transaction(f"""
+            INSERT INTO {self.PITCHER_FEATURES_TABLE} (player_id, season_year, split_type, span_days, {', '.join(self.PITCHER_FEATURE_KEYS)})
+            SELECT
+                prs.player_id, prs.season_year, prs.split_type, prs.span_days,
+                prs.games, prs.ip, prs.qs, prs.nrfi,
+                parsp.fip_minus_pct,
+                ps.k_pct_pct, ps.bb_pct_pct, ps.hr_per_9_pct
+            FROM {self.player_rolling_stats_table} prs
+            LEFT JOIN {self.player_advanced_rolling_stats_percentiles_table} parsp
+                ON parsp.player_id = prs.player_id AND parsp.position = 'P'
+                AND parsp.split_type = prs.split_type AND parsp.span_days = prs.span_days AND parsp.season_year = prs.season_year
+            LEFT JOIN {self.player_season_stats_percentiles_table} ps
+                ON ps.player_id = prs.player_id AND ps.position = 'P' AND ps.season_year = prs.season_year
+            WHERE prs.position = 'P' AND prs.season_year = %s
+            ON DUPLICATE KEY UPDATE {', '.join(f'{key} = VALUES({key})' for key in self.PITCHER_FEATURE_KEYS)}
+        """, (season_year,))
+
+        # Pitchers with season percentiles but no recent appearances still get overall rows
+        windows = " UNION ALL ".join(f"SELECT {span_days} AS span_days" for span_days in ROLLING_WINDOWS)
+        self.execute_query_in_transaction(f"""
+            INSERT INTO {self.PITCHER_FEATURES_TABLE} (player_id, season_year, split_type, span_days, k_pct_pct, bb_pct_pct, hr_per_9_pct)
+            SELECT ps.player_id, ps.season_year, 'overall', w.span_days, ps.k_pct_pct, ps.bb_pct_pct, ps.hr_per_9_pct
+            FROM {self.player_season_stats_percentiles_table} ps
+            CROSS JOIN ({windows}) w
+            WHERE ps.position = 'P' AND ps.season_year = %s AND ps.player_id IS NOT NULL
+            ON DUPLICATE KEY UPDATE
+                k_pct_pct = VALUES(k_pct_pct), bb_pct_pct = VALUES(bb_pct_pct), hr_per_9_pct = VALUES(hr_per_9_pct)
+        """, (season_year,))
+
+    def insert_team_features(self, season_year):
+        self.execute_query_in_transaction(f"""
+            INSERT INTO {self.TEAM_FEATURES_TABLE} (team, season_year, split_type, span_days, avg_runs_scored_pct, nrfi_pct)
+            SELECT team, season_year, split_type, span_days, avg_runs_scored_pct, nrfi_pct
+            FROM {self.team_rolling_stats_percentiles_table}
+            WHERE season_year = %s
+            ON DUPLICATE KEY UPDATE avg_runs_scored_pct = VALUES(avg_runs_scored_pct), nrfi_pct = VALUES(nrfi_pct)
+        """, (season_year,))
+
+        # Offense against each pitcher hand lands on the matching vs_lhp / vs_rhp row
+        self.execute_query_in_transaction(f"""
+            INSERT INTO {self.TEAM_FEATURES_TABLE} (team, season_year, split_type, span_days, vs_hand_ops_pct, vs_hand_so_rate_pct, vs_hand_nrfi_pct)
+            SELECT team, season_year, CASE throws WHEN 'L' THEN 'vs_lhp' ELSE 'vs_rhp' END, span_days, ops_pct, so_rate_pct, nrfi_pct
+            FROM {self.team_vs_pitcher_splits_percentiles_table}
+            WHERE season_year = %s AND throws IN ('L', 'R')
+            ON DUPLICATE KEY UPDATE
+                vs_hand_ops_pct = VALUES(vs_hand_ops_pct),
+                vs_hand_so_rate_pct = VALUES(vs_hand_so_rate_pct),
+                vs_hand_nrfi_pct = VALUES(vs_hand_nrfi_pct)
+        """, (season_year,))
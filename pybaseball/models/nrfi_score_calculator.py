@@ -1,14 +1,93 @@
+import numpy as np
 from datetime import datetime
 from models.score_calculator import ScoreCalculator
 from utils.logger import logger
 
 class NRFIScoreCalculator(ScoreCalculator):
+    NRFI_WEIGHTS = {
+        'comp_our_p_nrfi_rate': 0.35,
+        'comp_opp_p_nrfi_rate': 0.20,
+        'comp_opp_off_nrfi_vs_hand': 0.20,
+        'comp_our_off_nrfi_vs_opp_hand': 0.15,
+        'comp_our_team_nrfi_split': 0.05,
+        'comp_opp_team_nrfi_split': 0.05,
+    }
+    # Reweighted (each / 0.80) when the opposing starter or their rolling NRFI rate is unknown
+    NRFI_WEIGHTS_WITHOUT_OPP_PITCHER = {
+        'comp_our_p_nrfi_rate': 0.44,
+        'comp_opp_off_nrfi_vs_hand': 0.25,
+        'comp_our_off_nrfi_vs_opp_hand': 0.19,
+        'comp_our_team_nrfi_split': 0.06,
+        'comp_opp_team_nrfi_split': 0.06,
+    }
+
     def __init__(self, conn):
         super().__init__(conn)
 
-    def update_probables_nrfi_scores(self, season_year=None):
+    def update_probables_nrfi_scores(self, season_year=None, vectorized=True):
         start_date, end_date = self.get_window_dates()
-        self.update_nrfi_likelihood_scores(start_date, end_date, season_year)
+        if vectorized:
+            self.score_nrfi_likelihood(start_date, end_date, season_year)
+        else:
+            self.update_nrfi_likelihood_scores(start_date, end_date, season_year)
+
+    def score_nrfi_likelihood(self, start_date, end_date, season_year=None):
+        """Vectorized equivalent of update_nrfi_likelihood_scores: look up the matchup features, score in NumPy, write back in bulk"""
+        if season_year is None:
+            season_year = datetime.now().year
+        logger.info(f"Scoring NRFI likelihood for probable pitchers from {start_date} to {end_date} (season {season_year})")
+        probables = self.get_probable_pitchers(start_date, end_date)
+        if not probables:
+            logger.info("No probable pitchers to score")
+            return
+        features = self.get_nrfi_features(probables, season_year)
+        scores = self.compute_nrfi_scores(features)
+        self.bulk_update_scores('nrfi_likelihood_score', [row['pp_id'] for row in probables], scores)
+
+    def get_nrfi_features(self, probables, season_year):
+        """Raw inputs for compute_nrfi_scores, one array entry per probable pitcher"""
+        hands = self.get_pitcher_hands()
+        pitcher_features = self.load_pitcher_features(['nrfi', 'games'], season_year)
+        team_features = self.load_team_features(['nrfi_pct', 'vs_hand_nrfi_pct'], season_year)
+
+        our_pitcher = self.lookup_features(pitcher_features, [(row['player_id'],) for row in probables])
+        opp_pitcher = self.lookup_features(pitcher_features, [(row['opp_pitcher_id'],) for row in probables])
+        # Opponent offense vs our hand, and our offense vs the opposing starter's hand
+        opp_off = self.lookup_features(team_features, [(row['opp_team'], self.hand_split(hands.get(row['player_id']))) for row in probables])
+        our_off = self.lookup_features(team_features, [(row['pitcher_team'], self.hand_split(hands.get(row['opp_pitcher_id']))) for row in probables])
+        our_team = self.lookup_features(team_features, [(row['pitcher_team'], 'home' if row['home'] else 'away') for row in probables])
+        opp_team = self.lookup_features(team_features, [(row['opp_team'], 'away' if row['home'] else 'home') for row in probables])
+        return {
+            'our_nrfi': our_pitcher['nrfi'],
+            'our_g': our_pitcher['games'],
+            'opp_nrfi': opp_pitcher['nrfi'],
+            'opp_g': opp_pitcher['games'],
+            'opp_off_nrfi_vs_our_hand_pct': opp_off['vs_hand_nrfi_pct'],
+            'our_off_nrfi_vs_opp_hand_pct': our_off['vs_hand_nrfi_pct'],
+            'our_team_nrfi_split': our_team['nrfi_pct'],
+            'opp_team_nrfi_split': opp_team['nrfi_pct'],
+        }
+
+    @classmethod
+    def compute_nrfi_components(cls, features):
+        """0-100 components from the raw feature arrays; comp_opp_p_nrfi_rate is NaN when the opposing starter is unknown"""
+        return {
+            'comp_our_p_nrfi_rate': cls.soften_rate(features['our_nrfi'], features['our_g'], 0.70),
+            'comp_opp_p_nrfi_rate': cls.soften_rate(features['opp_nrfi'], features['opp_g'], 0.70, empty_value=np.nan),
+            'comp_opp_off_nrfi_vs_hand': cls.percentile_or_zero(features['opp_off_nrfi_vs_our_hand_pct']),
+            'comp_our_off_nrfi_vs_opp_hand': cls.percentile_or_zero(features['our_off_nrfi_vs_opp_hand_pct']),
+            'comp_our_team_nrfi_split': cls.percentile_or_zero(features['our_team_nrfi_split']),
+            'comp_opp_team_nrfi_split': cls.percentile_or_zero(features['opp_team_nrfi_split']),
+        }
+
+    @classmethod
+    def compute_nrfi_scores(cls, features):
+        """Weighted NRFI likelihood (0-100, one decimal) for each entry of the feature arrays. Pure NumPy; no database access."""
+        components = cls.compute_nrfi_components(features)
+        with_opp_pitcher = sum(components[name] * weight for name, weight in cls.NRFI_WEIGHTS.items())
+        without_opp_pitcher = sum(components[name] * weight for name, weight in cls.NRFI_WEIGHTS_WITHOUT_OPP_PITCHER.items())
+        scores = np.where(np.isnan(components['comp_opp_p_nrfi_rate']), without_opp_pitcher, with_opp_pitcher)
+        return cls.round_scores(scores)
 
     def update_nrfi_likelihood_scores(self, start_date, end_date, season_year=None):
         if season_year is None:
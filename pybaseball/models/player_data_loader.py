@@ -172,13 +172,14 @@ class PlayerDataLoader(DB_Recorder):
         sql = """
             INSERT INTO player_value_snapshots
                 (model_id, player_pk, mlb_player_id, position, span_days, split_type, as_of_date,
-                total_value, tier, reliability_score, risk_score)
-            VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
+                total_value, tier, reliability_score, risk_score, is_removed)
+            VALUES (%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)
             ON DUPLICATE KEY UPDATE
                 total_value=VALUES(total_value),
                 tier=VALUES(tier),
                 reliability_score=VALUES(reliability_score),
-                risk_score=VALUES(risk_score)
+                risk_score=VALUES(risk_score),
+                is_removed=VALUES(is_removed)
         """
         rows = []
         for _, r in df.iterrows():
@@ -194,6 +195,7 @@ class PlayerDataLoader(DB_Recorder):
                 int(r["tier"]) if not pd.isna(r["tier"]) else None,
                 int(r["reliability_score"]) if "reliability_score" in r and not pd.isna(r["reliability_score"]) else None,
                 int(r["risk_score"]) if "risk_score" in r and not pd.isna(r["risk_score"]) else None,
+                int(r["is_removed"]) if "is_removed" in r else 0,
             ))
         if self.dry_run:
             self.logger.info(f"[dry-run] Would upsert {len(rows)} totals rows for model={model_id} span={span_days} split={split_type}")
@@ -324,19 +326,23 @@ class PlayerDataLoader(DB_Recorder):
         """
         Writes draft_player_values with ON DUPLICATE KEY UPDATE.
         Expects df columns: player_pk,total_value,est_auction_value,est_max_auction_value,tier,reliability_score,risk_score
+        and optionally the simulated price bands price_p10,price_p50,price_p90
         """
         as_of_date = date.today()
         insert_sql = """
             INSERT INTO draft_player_values
                 (model_id, player_pk, as_of_date, total_value, est_auction_value, est_max_auction_value,
-                tier, reliability_score, risk_score)
+                price_p10, price_p50, price_p90, tier, reliability_score, risk_score)
             VALUES
-            (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+            (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
             ON DUPLICATE KEY UPDATE
                 as_of_date = VALUES(as_of_date),
                 total_value = VALUES(total_value),
                 est_auction_value = VALUES(est_auction_value),
                 est_max_auction_value = VALUES(est_max_auction_value),
+                price_p10 = VALUES(price_p10),
+                price_p50 = VALUES(price_p50),
+                price_p90 = VALUES(price_p90),
                 tier = VALUES(tier),
                 reliability_score = VALUES(reliability_score),
                 risk_score = VALUES(risk_score)
@@ -351,6 +357,7 @@ class PlayerDataLoader(DB_Recorder):
                 float(r["total_value"]),
                 float(r["est_auction_value"]),
                 float(r["est_max_auction_value"]),
+                *(float(r[band]) if band in r and not pd.isna(r[band]) else None for band in ["price_p10", "price_p50", "price_p90"]),
                 int(r["tier"]) if not pd.isna(r["tier"]) else None,
                 int(r["reliability_score"]) if "reliability_score" in r and not pd.isna(r["reliability_score"]) else None,
                 int(r["risk_score"]) if "risk_score" in r and not pd.isna(r["risk_score"]) else None,
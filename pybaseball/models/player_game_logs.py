@@ -1,17 +1,20 @@
 from utils.logger import logger
 from models.game_logs_db import GameLogsDB
 from models.game_logs.logs_inserter import LogsInserter
+from models.player_hydration_queue import PlayerHydrationQueue
 
 class PlayerGameLogs(GameLogsDB):
     GAME_LOGS_TABLE = "player_game_logs"
+    ARCHIVE_TABLE = "player_game_logs_archive"
     BASIC_ROLLING_STATS_TABLE = "player_rolling_stats"
     ADVANCED_ROLLING_STATS_TABLE = "player_advanced_rolling_stats"
 
-    def __init__(self, conn, player_basic_rolling_stats=None, player_advanced_rolling_stats=None):
+    def __init__(self, conn, player_basic_rolling_stats=None, player_advanced_rolling_stats=None, archive=False):
         self.conn = conn
         self.player_basic_rolling_stats = player_basic_rolling_stats
         self.player_advanced_rolling_stats = player_advanced_rolling_stats
-        super().__init__(conn, self.GAME_LOGS_TABLE)
+        self.hydration_queue = PlayerHydrationQueue(conn)
+        super().__init__(conn, self.ARCHIVE_TABLE if archive else self.GAME_LOGS_TABLE)
 
     def upsert_game_logs(self, player_game_logs: LogsInserter):
         """Upsert player game logs to database"""
@@ -23,6 +26,12 @@ class PlayerGameLogs(GameLogsDB):
         
         super().upsert_game_logs(player_game_logs)
 
+        # Players seen in these logs whose lookup is missing or incomplete get hydrated on the next run
+        player_index, position_index = (player_game_logs.keys.index(key) for key in ('player_id', 'position'))
+        self.hydration_queue.enqueue_if_incomplete(
+            [(row[player_index], row[position_index]) for row in player_game_logs.get_rows()], 'game_log'
+        )
+
     def compute_rolling_stats(self, season_year=None):
         self.player_basic_rolling_stats.compute_rolling_stats(season_year)
         self.player_advanced_rolling_stats.compute_rolling_stats(season_year)
\ No newline at end of file
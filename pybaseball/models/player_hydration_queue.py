@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta, timezone
+from models.db_recorder import DB_Recorder
+from utils.constants import BATCH_SIZE
+from utils.logger import logger
+
+class PlayerHydrationQueue(DB_Recorder):
+    """
+    Dirty-set of player_ids that need hydrating from the MLB API. Ids are enqueued when new game log or roster
+    rows reference a lookup that is missing or incomplete, and when a lookup expires, so each hydration run only
+    reads the queue instead of re-scanning player_game_logs and player_lookup.
+    """
+    QUEUE_TABLE = "player_hydration_queue"
+    LOOKUP_TABLE = "player_lookup"
+    PLACEHOLDER_VALUES = ('', 'unknown', 'N/A', 'Unk')
+
+    def __init__(self, conn):
+        super().__init__(conn)
+
+    def enqueue(self, player_ids, reason):
+        rows = [(int(player_id), reason) for player_id in set(player_ids) if player_id is not None]
+        if not rows:
+            return
+        logger.info(f"Enqueueing {len(rows)} players for hydration ({reason})")
+        self.batch_upsert(
+            f"INSERT IGNORE INTO {self.QUEUE_TABLE} (player_id, reason, enqueued_at) VALUES (%s, %s, UTC_TIMESTAMP())",
+            rows,
+        )
+
+    def enqueue_if_incomplete(self, player_positions, reason):
+        """Enqueue each (player_id, position) whose lookup row is missing or lacks status, bats or throws"""
+        player_positions = {(int(player_id), position) for player_id, position in player_positions if player_id is not None}
+        player_ids = sorted({player_id for player_id, _ in player_positions})
+        complete = set()
+        for batch in [player_ids[i:i + BATCH_SIZE] for i in range(0, len(player_ids), BATCH_SIZE)]:
+            rows = self.get_query(f"""
+                SELECT player_id, position
+                FROM {self.LOOKUP_TABLE}
+                WHERE player_id IN ({', '.join(['%s'] * len(batch))})
+                    AND {self.get_complete_conditions()}
+            """, (*batch, *self.PLACEHOLDER_VALUES * 3))
+            complete.update((row['player_id'], row['position']) for row in rows)
+        self.enqueue([player_id for player_id, position in player_positions if (player_id, position) not in complete], reason)
+
+    def enqueue_expired(self, max_stale_days):
+        """Enqueue lookups last hydrated more than max_stale_days ago (a range scan on idx_last_updated)"""
+        stale_date = datetime.now(timezone.utc) - timedelta(days=max_stale_days)
+        self.execute_query(f"""
+            INSERT IGNORE INTO {self.QUEUE_TABLE} (player_id, reason, enqueued_at)
+            SELECT DISTINCT player_id, 'expired', UTC_TIMESTAMP()
+            FROM {self.LOOKUP_TABLE}
+            WHERE last_updated < %s OR last_updated IS NULL
+        """, (stale_date,))
+
+    def get_queued_player_ids(self):
+        return [row['player_id'] for row in self.get_query(f"SELECT player_id FROM {self.QUEUE_TABLE}")]
+
+    def dequeue(self, player_ids):
+        rows = [(int(player_id),) for player_id in set(player_ids)]
+        if not rows:
+            return
+        self.batch_upsert(f"DELETE FROM {self.QUEUE_TABLE} WHERE player_id = %s", rows)
+
+    def get_complete_conditions(self):
+        placeholders = ', '.join(['%s'] * len(self.PLACEHOLDER_VALUES))
+        return " AND ".join(
+            f"{field} IS NOT NULL AND {field} NOT IN ({placeholders})" for field in ('status', 'bats', 'throws')
+        )
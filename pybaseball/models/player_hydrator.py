@@ -1,3 +1,6 @@
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from models.api.mlb_api import MlbApi
 from models.sync_status import SyncStatus
 from models.db_recorder import DB_Recorder
@@ -6,13 +9,12 @@ from models.player_lookups import PlayerLookups
 from models.game_logs.player_lookup import PlayerLookup
 from models.game_logs.logs_inserter import LogsInserter
 from models.player_game_logs import PlayerGameLogs
-from models.probable_pitchers import ProbablePitchers
-from models.season_stats import SeasonStats
-from utils.constants import MLB_TEAM_IDS
+from utils.constants import MLB_TEAM_IDS, MLB_ROSTER_FETCH_WORKERS, MLB_ROSTER_CACHE_TTL_HOURS
 
 class PlayerHydrator(DB_Recorder):
     HYDRATE_PLAYER_LOOKUP_SYNC_NAME = "hydrate_player_lookup"
     UPDATE_ACTIVE_TEAM_ROSTERS_SYNC_NAME = "update_active_team_rosters"
+    ROSTER_CACHE_TABLE = "team_roster_cache"
 
     def __init__(self, conn, mlb_api: MlbApi, sync_status: SyncStatus, player_lookups: PlayerLookups):
         super().__init__(conn)
@@ -38,6 +40,9 @@ class PlayerHydrator(DB_Recorder):
 
         self.player_lookups.insert_rows_into_lookup_table(all_rows)
         self.player_lookups.consolidate_null_position_lookup_rows()
+        # Only hydrated ids leave the queue; ids with no data or a failed batch are retried next run
+        player_id_index = all_rows.keys.index('player_id')
+        self.player_lookups.hydration_queue.dequeue([row[player_id_index] for row in all_rows.get_rows()])
 
         self.set_sync_status(self.HYDRATE_PLAYER_LOOKUP_SYNC_NAME, "success", f"Hydrated {all_rows.get_row_count()} players")
         logger.info(f"Hydrated {all_rows.get_row_count()} players")
@@ -54,15 +59,14 @@ class PlayerHydrator(DB_Recorder):
             all_players = LogsInserter(PlayerLookup.KEYS + extra_keys, PlayerLookup.ID_KEYS)
             all_player_ids = []
             logger.info(f"Getting rosters for {len(MLB_TEAM_IDS)} MLB teams...")
+            team_rosters = self.get_team_rosters()
 
-            for team_code, team_id in MLB_TEAM_IDS.items():
-                logger.info(f"Getting roster for {team_code} (ID: {team_id})...")
-
-                roster_data = self.mlb_api.get_team_roster(team_id)
+            for team_code in MLB_TEAM_IDS:
+                roster_data = team_rosters.get(team_code)
 
                 if roster_data and 'roster' in roster_data:
                     roster = roster_data['roster']
-                    logger.info(f"  Found {len(roster)} players")
+                    logger.info(f"Found {len(roster)} players for {team_code}")
 
                     for player in roster:
                         person = player.get('person', {})
@@ -84,6 +88,12 @@ class PlayerHydrator(DB_Recorder):
                 
                 self.player_lookups.insert_rows_into_lookup_table(all_players)
                 self.player_lookups.consolidate_null_position_lookup_rows()
+                # Newly rostered players arrive without bats/throws
+                player_id_index = all_players.keys.index('player_id')
+                position_index = all_players.keys.index('position')
+                self.player_lookups.hydration_queue.enqueue_if_incomplete(
+                    [(row[player_id_index], row[position_index]) for row in all_players.get_rows()], 'roster'
+                )
                 self.set_sync_status(self.UPDATE_ACTIVE_TEAM_ROSTERS_SYNC_NAME, "success", f"Updated {all_players.get_row_count()} player records")
                 self.player_lookups.set_unrostered_players_to_inactive(all_player_ids)
                 logger.info("Player lookup table updated successfully")
@@ -95,6 +105,62 @@ class PlayerHydrator(DB_Recorder):
             logger.error(f"Error updating player lookup table with active team rosters: {e}")
             self.set_sync_status(self.UPDATE_ACTIVE_TEAM_ROSTERS_SYNC_NAME, "error", f"Error updating player lookup table with active team rosters: {e}")
 
+    def get_team_rosters(self) -> dict:
+        """Roster payload per team code. Rosters fetched within the cache TTL are reused; the rest are requested
+        concurrently as conditional requests, so an unchanged roster is answered with 304 rather than re-downloaded."""
+        cached_rosters = self.get_cached_rosters()
+        fresh_after = datetime.now() - timedelta(hours=MLB_ROSTER_CACHE_TTL_HOURS)
+        team_rosters = {}
+        teams_to_fetch = {}
+        for team_code, team_id in MLB_TEAM_IDS.items():
+            cached = cached_rosters.get(team_code)
+            if cached and cached['fetched_at'] >= fresh_after:
+                team_rosters[team_code] = json.loads(cached['payload'])
+            else:
+                teams_to_fetch[team_code] = team_id
+        logger.info(f"Reusing {len(team_rosters)} cached rosters, requesting {len(teams_to_fetch)}")
+
+        refreshed_rows = []
+        fetched_at = datetime.now()
+        with ThreadPoolExecutor(max_workers=MLB_ROSTER_FETCH_WORKERS) as executor:
+            futures = {
+                executor.submit(self.mlb_api.get_team_roster_if_changed, team_id, cached_rosters.get(team_code, {}).get('etag')): team_code
+                for team_code, team_id in teams_to_fetch.items()
+            }
+            for future in as_completed(futures):
+                team_code = futures[future]
+                cached = cached_rosters.get(team_code)
+                try:
+                    not_modified, roster_data, etag = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to get roster for {team_code}: {e}")
+                    not_modified, roster_data, etag = False, None, None
+
+                if roster_data is not None:
+                    team_rosters[team_code] = roster_data
+                    refreshed_rows.append((team_code, etag, json.dumps(roster_data), fetched_at))
+                elif cached:
+                    # Unchanged (304), or the request failed and the last known roster is better than none
+                    team_rosters[team_code] = json.loads(cached['payload'])
+                    if not_modified:
+                        refreshed_rows.append((team_code, cached['etag'], cached['payload'], fetched_at))
+
+        self.save_cached_rosters(refreshed_rows)
+        return team_rosters
+
+    def get_cached_rosters(self) -> dict:
+        rows = self.get_query(f"SELECT team, etag, payload, fetched_at FROM {self.ROSTER_CACHE_TABLE}")
+        return {row['team']: row for row in rows}
+
+    def save_cached_rosters(self, rows: list[tuple]) -> None:
+        if not rows:
+            return
+        self.batch_upsert(f"""
+            INSERT INTO {self.ROSTER_CACHE_TABLE} (team, etag, payload, fetched_at)
+            VALUES (%s, %s, %s, %s)
+            ON DUPLICATE KEY UPDATE etag = VALUES(etag), payload = VALUES(payload), fetched_at = VALUES(fetched_at)
+        """, rows)
+
     def process_players(self, player_info: list[dict]) -> LogsInserter:
         extra_keys = ['position', 'bats', 'throws']
         all_rows = LogsInserter(PlayerLookup.KEYS + extra_keys, PlayerLookup.ID_KEYS)
@@ -103,51 +169,13 @@ class PlayerHydrator(DB_Recorder):
         return all_rows
 
     def update_table_from_lookup(self, table_name: str) -> None:
+        """
+        Catch-up pass for rows written before player_lookup knew their player.
+        Season stats and probable pitchers are keyed by the identity resolver as they are written.
+        """
         logger.info(f"Updating {table_name} from player lookup table")
-        if table_name == PlayerGameLogs.GAME_LOGS_TABLE:
+        if table_name in (PlayerGameLogs.GAME_LOGS_TABLE, PlayerGameLogs.ARCHIVE_TABLE):
             self.player_lookups.update_player_names_from_lookup(table_name, matching_conditions=["position"])
-        elif table_name == ProbablePitchers.PROBABLE_PITCHERS_TABLE:
-            self.player_lookups.update_player_ids_from_lookup(
-                table_name, 
-                matching_conditions={'espn_pitcher_id': 'espn_player_id'},
-                lookup_position="P",
-            )
-            self.player_lookups.update_player_ids_from_lookup(
-                table_name,
-                matching_conditions={"team": "team"},
-                lookup_position="P",
-            )
-            self.player_lookups.update_player_names_from_lookup(
-                table_name, 
-                lookup_position="P"
-            )
-            self.player_lookups.update_lookup_fields_from_table(
-                table_name, 
-                fields={'espn_player_id': 'espn_pitcher_id'},
-                matching_conditions={},
-                lookup_position="P",
-            )
-        elif table_name == SeasonStats.PLAYER_STATS_TABLE:
-            tables_to_update = [ table_name, table_name + '_percentiles']
-            for table in tables_to_update:
-                self.player_lookups.hydrate_season_stats_team_and_player_id(table)
-                self.player_lookups.update_player_ids_from_lookup(
-                    table,
-                    matching_conditions={'fangraphs_player_id': 'fangraphs_player_id', 'position': 'position'},
-                )
-                self.player_lookups.update_player_ids_from_lookup(
-                    table,
-                    matching_conditions={'team': 'team', 'position': 'position'},
-                )
-                self.player_lookups.update_player_names_from_lookup(
-                    table, 
-                    matching_conditions={'position': 'position'},
-                )
-                self.player_lookups.update_lookup_fields_from_table(
-                    table, 
-                    {'fangraphs_player_id': 'fangraphs_player_id'},
-                    matching_conditions={'position': 'position'},
-                )
 
     def should_run_sync(self, sync_name: str, force: bool=False) -> bool:
         if not self.sync_status.should_sync(sync_name, force):
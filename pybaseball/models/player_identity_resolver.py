@@ -0,0 +1,97 @@
+from models.db_recorder import DB_Recorder
+from utils.logger import logger
+
+class PlayerIdentityResolver(DB_Recorder):
+    """
+    In-memory view of player_lookup for keying incoming rows before they are written.
+    Loaded once into hash indexes on every cross-source id and on (normalised_name, team, position),
+    so each row resolves with dictionary lookups instead of table-wide UPDATE ... JOIN passes.
+    """
+    LOOKUP_TABLE = "player_lookup"
+    LOOKUP_FIELDS = ['id', 'player_id', 'position', 'normalised_name', 'team', 'fangraphs_player_id', 'yahoo_player_id', 'espn_player_id']
+    # Cross-source id columns, each unique per position
+    ID_FIELDS = ['player_id', 'fangraphs_player_id', 'yahoo_player_id', 'espn_player_id']
+    ID_FIELD_TYPES = {'player_id': 'INT', 'fangraphs_player_id': 'INT', 'yahoo_player_id': 'VARCHAR(50)', 'espn_player_id': 'INT'}
+
+    def __init__(self, conn):
+        super().__init__(conn)
+        self.id_indexes = {}
+        self.name_team_index = {}
+        self.name_index = {}
+        self.pending_lookup_updates = {}
+        self.loaded = False
+
+    def load(self):
+        lookups = self.get_query(f"SELECT {', '.join(self.LOOKUP_FIELDS)} FROM {self.LOOKUP_TABLE}")
+        self.id_indexes = {field: {} for field in self.ID_FIELDS}
+        self.name_team_index = {}
+        self.name_index = {}
+        for lookup in lookups:
+            self.index_lookup(lookup)
+        self.loaded = True
+        logger.info(f"Loaded {len(lookups)} player lookups into the identity resolver")
+
+    def invalidate(self):
+        """Force a reload on next use, after player_lookup was changed outside the resolver"""
+        self.loaded = False
+
+    def ensure_loaded(self):
+        if not self.loaded:
+            self.load()
+
+    def index_lookup(self, lookup):
+        position = lookup['position']
+        for field in self.ID_FIELDS:
+            if lookup[field] is not None:
+                self.id_indexes[field][(lookup[field], position)] = lookup
+        if lookup['normalised_name']:
+            self.name_team_index.setdefault((lookup['normalised_name'], lookup['team'], position), []).append(lookup)
+            self.name_index.setdefault((lookup['normalised_name'], position), []).append(lookup)
+
+    def get_by_id(self, field, value, position):
+        """Lookup row for a cross-source id (player_id, fangraphs_player_id, yahoo_player_id, espn_player_id)"""
+        self.ensure_loaded()
+        if value is None:
+            return None
+        return self.id_indexes[field].get((value, position))
+
+    def resolve(self, position, ids=None, normalised_name=None, team=None, unique_name=False):
+        """
+        Return the lookup row for an incoming row, or None when it cannot be matched unambiguously.
+        ids are tried first ({field: value}, in order), then (normalised_name, team, position) when it matches
+        exactly one lookup. With unique_name, (normalised_name, position) is tried last, again only when exactly
+        one lookup has that pair; callers also require the pair to be unique in their own batch.
+        """
+        self.ensure_loaded()
+        for field, value in (ids or {}).items():
+            lookup = self.get_by_id(field, value, position)
+            if lookup is not None:
+                return lookup
+        if not normalised_name:
+            return None
+        candidates = self.name_team_index.get((normalised_name, team, position), [])
+        if len(candidates) == 1:
+            return candidates[0]
+        if unique_name:
+            candidates = self.name_index.get((normalised_name, position), [])
+            if len(candidates) == 1:
+                return candidates[0]
+        return None
+
+    def backfill_lookup_id(self, lookup, field, value):
+        """Record a cross-source id learned from an incoming row, for a lookup that does not have one yet"""
+        if value is None or lookup[field] is not None:
+            return
+        # The id columns are unique per position; never steal one that belongs to another lookup
+        if (value, lookup['position']) in self.id_indexes[field]:
+            return
+        lookup[field] = value
+        self.id_indexes[field][(value, lookup['position'])] = lookup
+        self.pending_lookup_updates.setdefault(field, []).append((lookup['id'], value))
+
+    def flush_lookup_updates(self):
+        """Write the ids collected by backfill_lookup_id back to player_lookup"""
+        for field, updates in self.pending_lookup_updates.items():
+            logger.info(f"Backfilling {len(updates)} lookup {field} values")
+            self.bulk_update(self.LOOKUP_TABLE, 'id', 'INT', {field: self.ID_FIELD_TYPES[field]}, updates, coalesce_columns=[field])
+        self.pending_lookup_updates = {}
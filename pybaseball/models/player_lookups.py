@@ -1,20 +1,23 @@
 from utils.logger import logger
 from models.db_recorder import DB_Recorder
 from models.player_game_logs import PlayerGameLogs
-from datetime import datetime, timedelta, timezone
+from models.player_identity_resolver import PlayerIdentityResolver
+from models.player_hydration_queue import PlayerHydrationQueue
 from models.game_logs.logs_inserter import LogsInserter
-from utils.constants import MLB_TEAM_IDS
 
 class PlayerLookups(DB_Recorder):
     LOOKUP_TABLE = "player_lookup"
     PLAYERS_TABLE = "players"
     ID_KEYS = ['player_id']
     MAX_STALE_DAYS = 1
+    ACTIVE_PLAYER_IDS_TABLE = "tmp_active_player_ids"
 
     def __init__(self, conn, mlb_api=None):
         self.conn = conn
         self.mlb_api = mlb_api
         self.player_game_logs_table = PlayerGameLogs.GAME_LOGS_TABLE
+        self.identity_resolver = PlayerIdentityResolver(conn)
+        self.hydration_queue = PlayerHydrationQueue(conn)
 
 
     def insert_rows_into_lookup_table(self, all_rows: LogsInserter):
@@ -25,14 +28,29 @@ class PlayerLookups(DB_Recorder):
                 {all_rows.get_duplicate_update_keys()}
         """
         self.batch_upsert(insert_query, all_rows.get_rows())
+        self.identity_resolver.invalidate()
 
     def set_unrostered_players_to_inactive(self, active_player_ids: list[int]):
-        update_query = f"""
-            UPDATE {self.LOOKUP_TABLE}
-            SET status = 'Inactive'
-            WHERE player_id NOT IN ({','.join(map(str, active_player_ids))})
-        """
-        self.execute_query(update_query)
+        # Anti-join against a temp table rather than a NOT IN list of every rostered id
+        self.execute_query(f"DROP TEMPORARY TABLE IF EXISTS {self.ACTIVE_PLAYER_IDS_TABLE}")
+        self.execute_query(f"""
+            CREATE TEMPORARY TABLE {self.ACTIVE_PLAYER_IDS_TABLE} (
+                player_id INT PRIMARY KEY
+            ) ENGINE=MEMORY
+        """)
+        try:
+            self.batch_upsert(
+                f"INSERT IGNORE INTO {self.ACTIVE_PLAYER_IDS_TABLE} (player_id) VALUES (%s)",
+                [(int(player_id),) for player_id in active_player_ids]
+            )
+            self.execute_query(f"""
+                UPDATE {self.LOOKUP_TABLE} pl
+                LEFT JOIN {self.ACTIVE_PLAYER_IDS_TABLE} a ON a.player_id = pl.player_id
+                SET pl.status = 'Inactive'
+                WHERE a.player_id IS NULL
+            """)
+        finally:
+            self.execute_query(f"DROP TEMPORARY TABLE IF EXISTS {self.ACTIVE_PLAYER_IDS_TABLE}")
 
     def update_player_names_from_lookup(
         self,
@@ -66,100 +84,6 @@ class PlayerLookups(DB_Recorder):
         except Exception as e:
             logger.error(f"Error updating player names from lookup table for {table}: {e}")
 
-    def update_player_ids_from_lookup(
-        self,
-        table: str,
-        matching_conditions: dict = {},
-        unique_group_columns: list[str] | None = None,
-        lookup_position: str | None = None,
-    ):
-        """
-        Set player_id on table from player_lookup by joining on normalised_name and matching_conditions.
-        Include 'position': 'position' in matching_conditions when the table has position so the join
-        is 1:1. When the table has no position (e.g. probable_pitchers), pass lookup_position='P' or 'B'.
-        """
-        logger.info(f"Updating player ids from lookup table for {table}")
-        try:
-            self.consolidate_duplicate_players()
-            default_join_conditions = ["t.normalised_name = pl.normalised_name"]
-            join_conditions = default_join_conditions + [f"t.{key} = pl.{value}" for key, value in matching_conditions.items()]
-            if lookup_position is not None:
-                join_conditions.append("pl.position = %s")
-            conditions_str = " AND ".join(join_conditions)
-
-            if unique_group_columns:
-                group_cols = ", ".join(unique_group_columns)
-                join_to_single = " AND ".join(
-                    [f"t.{c} = single.{c}" for c in unique_group_columns] + ["t.id = single.min_id"]
-                )
-                update_query = f"""
-                    UPDATE {table} t
-                    JOIN {self.LOOKUP_TABLE} pl ON {conditions_str}
-                    JOIN (
-                        SELECT {group_cols}, min_id FROM (
-                            SELECT {group_cols}, MIN(id) AS min_id
-                            FROM {table}
-                            WHERE player_id IS NULL
-                            GROUP BY {group_cols}
-                        ) AS inner_single
-                    ) single ON {join_to_single}
-                    LEFT JOIN (
-                        SELECT existing_id, existing_pid, existing_pos FROM (
-                            SELECT id AS existing_id, player_id AS existing_pid, position AS existing_pos
-                            FROM {table}
-                        ) AS inner_existing
-                    ) existing ON existing.existing_pid = pl.player_id
-                        AND existing.existing_pos = t.position
-                        AND existing.existing_id <> t.id
-                    SET t.player_id = pl.player_id
-                    WHERE t.player_id IS NULL
-                        AND existing.existing_id IS NULL
-                """
-            else:
-                update_query = f"""
-                    UPDATE {table} t
-                    JOIN {self.LOOKUP_TABLE} pl ON {conditions_str}
-                    SET t.player_id = pl.player_id
-                    WHERE t.player_id IS NULL
-                """
-            if lookup_position is not None:
-                self.execute_query(update_query, (lookup_position,))
-            else:
-                self.execute_query(update_query)
-            logger.info(f"Player ids updated successfully for {table}")
-        except Exception as e:
-            logger.error(f"Error updating player ids from lookup table for {table}: {e}")
-
-    def update_lookup_fields_from_table(
-        self, 
-        table: str, 
-        fields: dict[str, str], 
-        matching_conditions: dict[str, str] = {},
-        lookup_position: str | None = None,
-    ):
-        default_join_conditions = ["pl.player_id = t.player_id"]
-        join_conditions = default_join_conditions + [f"pl.{key} = t.{value}" for key, value in matching_conditions.items()]
-        conditions_str = " AND ".join(join_conditions)
-        logger.info(f"Updating lookup fields from {table} for {fields}")
-        try:
-            update_fields = ", ".join([f"pl.{key} = t.{value}" for key, value in fields.items()])
-            where_clause = " AND ".join([f"pl.{key} IS NULL" for key in fields.keys()])
-            if lookup_position is not None:
-                where_clause += f" AND pl.position = %s"
-            update_query = f"""
-                UPDATE {self.LOOKUP_TABLE} pl
-                JOIN {table} t ON {conditions_str}
-                SET {update_fields}
-                WHERE {where_clause}
-            """
-            if lookup_position is not None:
-                self.execute_query(update_query, (lookup_position,))
-            else:
-                self.execute_query(update_query)
-            logger.info(f"Lookup fields updated successfully for {table}")
-        except Exception as e:
-            logger.error(f"Error updating lookup fields from {table} for {fields}: {e}")
-
     def sync_lookup_from_players(
         self,
         table: str,
@@ -207,7 +131,7 @@ class PlayerLookups(DB_Recorder):
                    OR pl.team IS NULL OR pl.team != p.{team_column_in_players}
             """)
             # 4) Match by yahoo_player_id: backfill lookup.position from players when players has it and lookup doesn't
-            #    (so update_player_ids_from_lookup_by_yahoo can match on (yahoo_player_id, position) and set player_id)
+            #    (so the identity resolver can match players on (yahoo_player_id, position) and set player_id)
             self.execute_query(f"""
                 UPDATE {self.LOOKUP_TABLE} pl
                 INNER JOIN {table} p ON pl.yahoo_player_id = p.yahoo_player_id
@@ -220,44 +144,12 @@ class PlayerLookups(DB_Recorder):
                 SET pl.position = p.{position_column_in_players}
                 WHERE existing.id IS NULL
             """)
+            self.identity_resolver.invalidate()
             logger.info("player_lookup synced from players successfully")
         except Exception as e:
             logger.error("Error syncing lookup from players: %s", e)
             raise
 
-    def update_player_ids_from_lookup_by_yahoo(
-        self,
-        table: str,
-        yahoo_id_column: str = "yahoo_player_id",
-        position_column: str = "position",
-    ):
-        """
-        Set player_id on table from player_lookup where (yahoo_player_id, position) match.
-        Skips updating when (player_id, position) already exists on another row to avoid
-        unique key violation (e.g. two players rows with different yahoo ids both mapping
-        to the same lookup player_id).
-        """
-        logger.info("Updating player ids from lookup by yahoo_player_id for %s", table)
-        try:
-            update_query = f"""
-                UPDATE {table} t
-                INNER JOIN {self.LOOKUP_TABLE} pl
-                    ON t.{yahoo_id_column} = pl.yahoo_player_id
-                    AND (t.{position_column} <=> pl.position)
-                LEFT JOIN {table} existing
-                    ON existing.player_id = pl.player_id
-                    AND (existing.{position_column} <=> t.{position_column})
-                    AND existing.id <> t.id
-                SET t.player_id = pl.player_id
-                WHERE t.player_id IS NULL AND t.{yahoo_id_column} IS NOT NULL
-                  AND existing.id IS NULL
-            """
-            self.execute_query(update_query)
-            logger.info("Player ids updated from lookup by yahoo_player_id successfully")
-        except Exception as e:
-            logger.error("Error updating player ids from lookup by yahoo: %s", e)
-            raise
-
     def consolidate_null_position_lookup_rows(self) -> None:
         """
         Remove spurious NULL-position rows from player_lookup that are created when
@@ -319,6 +211,7 @@ class PlayerLookups(DB_Recorder):
             """)
 
             self.commit_transaction()
+            self.identity_resolver.invalidate()
             logger.info("Consolidated NULL-position duplicate rows in player_lookup")
         except Exception as e:
             self.rollback_transaction()
@@ -351,35 +244,9 @@ class PlayerLookups(DB_Recorder):
             logger.info("Duplicate players consolidated successfully")
 
     def get_stale_player_ids(self) -> list[int]:
-        with self.conn.cursor() as cursor:
-            # Calculate the stale date threshold
-            stale_date = datetime.now(timezone.utc) - timedelta(days=self.MAX_STALE_DAYS)
-            
-            # Subquery 1: From player_game_logs (join on player_id and position)
-            cursor.execute(f"""
-                SELECT DISTINCT pgl.player_id
-                FROM {self.player_game_logs_table} pgl
-                LEFT JOIN {self.LOOKUP_TABLE} pl ON pgl.player_id = pl.player_id AND (pgl.position <=> pl.position)
-                WHERE pl.status IS NULL OR pl.status IN ('', 'unknown', 'N/A', 'Unk')
-                    OR pl.bats IS NULL OR pl.bats IN ('', 'unknown', 'N/A', 'Unk')
-                    OR pl.throws IS NULL OR pl.throws IN ('', 'unknown', 'N/A', 'Unk')
-                    OR pl.last_updated IS NULL OR pl.last_updated < %s
-            """, (stale_date,))
-            ids_game_log = [row[0] for row in cursor.fetchall()]
-
-            # Subquery 2: From player_lookup where status, bats, or throws is null or stale
-            cursor.execute(f"""
-                SELECT DISTINCT pl.player_id
-                FROM {self.LOOKUP_TABLE} pl
-                WHERE pl.status IS NULL OR pl.status IN ('', 'unknown', 'N/A', 'Unk')
-                    OR pl.bats IS NULL OR pl.bats IN ('', 'unknown', 'N/A', 'Unk')
-                    OR pl.throws IS NULL OR pl.throws IN ('', 'unknown', 'N/A', 'Unk')
-                    OR pl.last_updated IS NULL OR pl.last_updated < %s
-            """, (stale_date,))
-            ids_lookup = [row[0] for row in cursor.fetchall()]
-
-        all_ids = ids_lookup + ids_game_log
-        return list(set(id for id in all_ids if id is not None))
+        """Players queued for hydration, after queueing any lookup not refreshed within MAX_STALE_DAYS"""
+        self.hydration_queue.enqueue_expired(self.MAX_STALE_DAYS)
+        return self.hydration_queue.get_queued_player_ids()
 
     def consolidate_duplicate_season_stats(self, table: str) -> None:
         """
@@ -453,67 +320,3 @@ class PlayerLookups(DB_Recorder):
             self.rollback_transaction()
             logger.exception("Error consolidating duplicate season stats for %s: %s", table, e)
             raise
-
-    def hydrate_season_stats_team_and_player_id(
-        self,
-        table: str,
-        valid_teams: set[str] | None = None,
-        team_column: str = "team",
-    ) -> None:
-        """
-        Fix team and player_id on season stats using player_lookup (after Yahoo sync).
-        - When team is not in valid_teams: update from lookup by (fangraphs_player_id, position)
-          or (player_id, position), then set table.team and table.player_id from lookup.
-        - For rows still with invalid/missing team or player_id: match by (normalised_name, position)
-          only when both lookup and this table have exactly one row for that pair (unambiguous);
-          then update team and player_id from lookup. Avoids e.g. two "Max Muncy" B rows both
-          getting the same player_id and violating unique (player_id, position).
-        """
-        if valid_teams is None:
-            valid_teams = set(MLB_TEAM_IDS.keys())
-        logger.info("Hydrating season stats team and player_id from lookup for %s", table)
-        valid_teams_list = ",".join(repr(t) for t in valid_teams)
-        try:
-            # 1a) Rows where team not in valid_teams: update from lookup by (fangraphs_player_id, position)
-            self.execute_query(f"""
-                UPDATE {table} t
-                INNER JOIN {self.LOOKUP_TABLE} pl
-                    ON t.fangraphs_player_id IS NOT NULL AND pl.fangraphs_player_id = t.fangraphs_player_id AND (t.position <=> pl.position)
-                SET t.{team_column} = pl.team, t.player_id = COALESCE(t.player_id, pl.player_id)
-                WHERE (t.{team_column} IS NULL OR t.{team_column} NOT IN ({valid_teams_list}))
-                  AND pl.team IS NOT NULL
-            """)
-            # 1b) Rows where team not in valid_teams: update from lookup by (player_id, position)
-            self.execute_query(f"""
-                UPDATE {table} t
-                INNER JOIN {self.LOOKUP_TABLE} pl
-                    ON t.player_id IS NOT NULL AND pl.player_id = t.player_id AND (t.position <=> pl.position)
-                SET t.{team_column} = pl.team
-                WHERE (t.{team_column} IS NULL OR t.{team_column} NOT IN ({valid_teams_list}))
-                  AND pl.team IS NOT NULL
-            """)
-            # 2) Rows still with bad/missing team or player_id: match by (normalised_name, position) only when
-            #    both lookup and this table have exactly one row for that pair (unambiguous match).
-            self.execute_query(f"""
-                UPDATE {table} t
-                INNER JOIN {self.LOOKUP_TABLE} pl ON t.normalised_name = pl.normalised_name AND (t.position <=> pl.position)
-                INNER JOIN (
-                    SELECT normalised_name, position
-                    FROM {self.LOOKUP_TABLE}
-                    GROUP BY normalised_name, position
-                    HAVING COUNT(*) = 1
-                ) single_pl ON pl.normalised_name = single_pl.normalised_name AND (pl.position <=> single_pl.position)
-                INNER JOIN (
-                    SELECT normalised_name, position
-                    FROM {table}
-                    GROUP BY normalised_name, position
-                    HAVING COUNT(*) = 1
-                ) single_t ON t.normalised_name = single_t.normalised_name AND (t.position <=> single_t.position)
-                SET t.{team_column} = COALESCE(NULLIF(t.{team_column}, ''), pl.team), t.player_id = COALESCE(t.player_id, pl.player_id)
-                WHERE (t.{team_column} IS NULL OR t.{team_column} NOT IN ({valid_teams_list}) OR t.player_id IS NULL)
-                  AND pl.team IS NOT NULL
-            """)
-            logger.info("Hydrated season stats team and player_id for %s", table)
-        except Exception as e:
-            logger.exception("Error hydrating season stats for %s: %s", table, e)
-            raise
\ No newline at end of file
@@ -2,6 +2,7 @@ import pandas as pd
 from typing import Dict, Tuple, List
 from models.value_calculator import ValueCalculator
 from models.player_data_loader import LeagueSettings
+from models.auction_simulator import AuctionSimulator
 import numpy as np
 
 class PlayerValueCalculator:
@@ -16,7 +17,7 @@ class PlayerValueCalculator:
 
     BASE_COLUMNS = ["player_pk", "mlb_player_id", "name", "mlb_team", "position",
                  "is_c", "is_1b", "is_2b", "is_3b", "is_ss", "is_of", "is_util", "is_sp", "is_rp"]
-    OUTPUT_COLUMNS = ["player_pk", "total_value", "est_auction_value", "est_max_auction_value", "tier", "reliability_score", "risk_score"]
+    OUTPUT_COLUMNS = ["player_pk", "total_value", "est_auction_value", "est_max_auction_value", "price_p10", "price_p50", "price_p90", "tier", "reliability_score", "risk_score"]
     
     def __init__(
         self, 
@@ -25,7 +26,8 @@ class PlayerValueCalculator:
         roster_slots: pd.DataFrame,
         all_players_df: pd.DataFrame,
         hitters_stats_df: pd.DataFrame,
-        pitchers_stats_df: pd.DataFrame
+        pitchers_stats_df: pd.DataFrame,
+        auction_simulator: AuctionSimulator = None
     ):
         self.calculator = calculator
         self.league = league
@@ -33,6 +35,8 @@ class PlayerValueCalculator:
         self.all_players_df = all_players_df
         self.hitters_stats_df = hitters_stats_df
         self.pitchers_stats_df = pitchers_stats_df
+        # When set, est_max_auction_value is the upper simulated price band instead of the percentile heuristic
+        self.auction_simulator = auction_simulator
 
     def get_player_value_snapshots(self, roster_df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         """
@@ -42,7 +46,7 @@ class PlayerValueCalculator:
         """
         # Compute values
         values = self.calculator.calculate_player_values()
-        player_value_components_df = values["weighted_values_per_stat_df"].copy()
+        player_value_components_df = values["zscore_values"].components_df().copy()
         player_value_totals_df = values["total_values_df"].copy()
 
         # Join metadata for snapshots
@@ -56,26 +60,19 @@ class PlayerValueCalculator:
         ], ignore_index=True).groupby("player_pk", as_index=False).max()
         player_value_totals_df = player_value_totals_df.merge(extra, on="player_pk", how="left")
 
-        # Tier per slice, split hitters/pitchers
-        hitters_totals = player_value_totals_df[player_value_totals_df["position"] == "B"].copy().sort_values("total_value", ascending=False)
-        pitchers_totals = player_value_totals_df[player_value_totals_df["position"] == "P"].copy().sort_values("total_value", ascending=False)
-
-        hitters_totals["tier"] = self.calculate_tiers(hitters_totals["total_value"])
-        pitchers_totals["tier"] = self.calculate_tiers(pitchers_totals["total_value"])
-
-        player_value_totals_df = pd.concat([hitters_totals, pitchers_totals], ignore_index=True)
+        # Tier per slice, split hitters/pitchers (hitters first, each sorted by total_value desc)
+        player_value_totals_df = player_value_totals_df[player_value_totals_df["position"].isin(["B", "P"])]
+        player_value_totals_df = player_value_totals_df.sort_values(["position", "total_value"], ascending=[True, False], kind="stable")
+        player_value_totals_df["tier"] = self.assign_tiers(player_value_totals_df, "total_value", ["position"])
+        player_value_totals_df = player_value_totals_df.reset_index(drop=True)
 
         # Per-category tiers (also split B/P)
         # Player value components df has player_pk, category_code, weighted_value
         player_value_components_df = player_value_components_df.merge(meta, on="player_pk", how="left")
+        is_tiered = player_value_components_df["position"].isin(["B", "P"])
+        component_tiers = self.assign_tiers(player_value_components_df[is_tiered], "weighted_value", ["position", "category_code"])
         player_value_components_df["tier"] = None
-        for group_pos in ["B", "P"]:
-            group_components = player_value_components_df[player_value_components_df["position"] == group_pos].copy()
-            for cat in group_components["category_code"].unique():
-                idx = group_components["category_code"] == cat
-                sub = group_components[idx].sort_values("weighted_value", ascending=False)
-                group_components.loc[sub.index, "tier"] = self.calculate_tiers(sub["weighted_value"]).values
-            player_value_components_df.loc[group_components.index, "tier"] = group_components["tier"]
+        player_value_components_df.loc[is_tiered, "tier"] = component_tiers.astype(object)
 
         # Compute league aggregates
         category_totals_df, position_totals_df = self.compute_league_aggregates(roster_df, player_value_totals_df, player_value_components_df)
@@ -209,14 +206,29 @@ class PlayerValueCalculator:
         # Enforce minimum $1 for any player we give a price to
         player_total_values_df["est_auction_value"] = player_total_values_df["est_auction_value"].apply(lambda x: float(max(x, self.MIN_DOLLAR_VALUE)) if x > 0 else 0.0)
 
-        # Max auction value (ceiling): simple variance proxy using total_value spread
-        # You can replace this later with reliability.
-        # MVP: ceiling = est * (1 + 0.35) for low-ish value players, tapering for elites.
-        # Here we use a gentle function of percentile rank.
-        pct = player_total_values_df["total_value"].rank(pct=True).fillna(0.5)
-        # elites (pct ~1) => multiplier ~1.10; low (pct ~0) => ~1.35
-        mult = 1.35 - (0.25 * pct)
-        player_total_values_df["est_max_auction_value"] = (player_total_values_df["est_auction_value"] * mult).round(2)
+        if self.auction_simulator is not None:
+            # Max auction value (ceiling): upper band of simulated auctions, never below the point estimate
+            replacement_ranks = self.calculate_replacement_ranks()
+            price_bands = self.auction_simulator.simulate_price_bands(
+                player_total_values_df,
+                replacement_ranks["hitter_rank"],
+                replacement_ranks["pitcher_rank"],
+                hitter_budget,
+                pitcher_budget,
+            )
+            upper_band = price_bands[f"price_p{max(self.auction_simulator.PERCENTILES)}"]
+            player_total_values_df["est_max_auction_value"] = np.maximum(upper_band, player_total_values_df["est_auction_value"]).round(2)
+            player_total_values_df[list(price_bands.columns)] = price_bands
+        else:
+            # Max auction value (ceiling): simple variance proxy using total_value spread
+            # MVP: ceiling = est * (1 + 0.35) for low-ish value players, tapering for elites.
+            # Here we use a gentle function of percentile rank.
+            pct = player_total_values_df["total_value"].rank(pct=True).fillna(0.5)
+            # elites (pct ~1) => multiplier ~1.10; low (pct ~0) => ~1.35
+            mult = 1.35 - (0.25 * pct)
+            player_total_values_df["est_max_auction_value"] = (player_total_values_df["est_auction_value"] * mult).round(2)
+            # No simulated bands to store
+            player_total_values_df[["price_p10", "price_p50", "price_p90"]] = np.nan
 
         output_values_df = player_total_values_df[self.OUTPUT_COLUMNS].copy()
         return {
@@ -246,22 +258,17 @@ class PlayerValueCalculator:
         player_values_df["risk_score"] = player_values_df["risk_score"].fillna(100).astype(int)
 
         calculated_values = self.calculator.calculate_player_values()
-        player_value_components_df = calculated_values["weighted_values_per_stat_df"]
+        player_value_components_df = calculated_values["zscore_values"].components_df()
         player_total_values_df = calculated_values["total_values_df"]
 
         player_values_df = player_values_df.merge(player_total_values_df, on="player_pk", how="inner")
         player_values_df = player_values_df.sort_values("total_value", ascending=False).reset_index(drop=True)
 
         # Tiers are computed separately for hitters and pitchers (each group gets 1, 2, 3, ...)
+        is_tiered = player_values_df["position"].isin(["B", "P"])
         player_values_df["tier"] = 0
-        hitters = player_values_df[player_values_df["position"] == "B"]
-        pitchers = player_values_df[player_values_df["position"] == "P"]
-        if not hitters.empty:
-            hitters_sorted = hitters.sort_values("total_value", ascending=False)
-            player_values_df.loc[hitters_sorted.index, "tier"] = self.calculate_tiers(hitters_sorted["total_value"])
-        if not pitchers.empty:
-            pitchers_sorted = pitchers.sort_values("total_value", ascending=False)
-            player_values_df.loc[pitchers_sorted.index, "tier"] = self.calculate_tiers(pitchers_sorted["total_value"])
+        if is_tiered.any():
+            player_values_df.loc[is_tiered, "tier"] = self.assign_tiers(player_values_df[is_tiered], "total_value", ["position"]).astype(int)
 
         return {
             "player_values_df": player_values_df,
@@ -313,7 +320,7 @@ class PlayerValueCalculator:
         if values.empty:
             return pd.Series(dtype="int")
 
-        vals = values.to_numpy()
+        vals = values.to_numpy(dtype=float)
         gaps = np.abs(np.diff(vals))  # vals is already sorted desc
         if gaps.size == 0:
             return pd.Series([1] * len(vals), index=values.index)
@@ -322,14 +329,19 @@ class PlayerValueCalculator:
         median_absolute_deviation = np.median(np.abs(gaps - median)) + 1e-9
         threshold = median + self.TIER_GAP_MULT * median_absolute_deviation
 
-        tier = 1
-        tiers = [tier]
-        for g in gaps:
-            if g >= threshold:
-                tier += 1
-            tiers.append(tier)
+        # Each gap at or above the threshold starts a new tier
+        tiers = np.concatenate(([1], 1 + np.cumsum(gaps >= threshold)))
         return pd.Series(tiers, index=values.index)
 
+    def assign_tiers(self, df: pd.DataFrame, value_column: str, group_columns: List[str]) -> pd.Series:
+        """
+            Tier every row within its group, aligned to df's index: one descending sort of the whole
+            frame, then calculate_tiers per group. Rows with a missing group key get NaN.
+        """
+        ordered = df.sort_values(value_column, ascending=False, kind="stable")
+        tiers = ordered.groupby(group_columns)[value_column].transform(self.calculate_tiers)
+        return tiers.reindex(df.index)
+
     def calculate_replacement_values_for_players(self, all_players_df: pd.DataFrame) -> Dict[str, float]:
         """
         Compute replacement total_value for each slot_code based on league-wide demand.
@@ -337,6 +349,22 @@ class PlayerValueCalculator:
         - For each slot_code, take eligible players sorted by total_value desc,
             replacement_value = value at index demand[slot]-1 (1-indexed).
         """
+        replacement_ranks = self.calculate_replacement_ranks()
+        hitter_rank = replacement_ranks["hitter_rank"]
+        pitcher_rank = replacement_ranks["pitcher_rank"]
+
+        all_hitters = all_players_df[all_players_df["position"] == "B"]
+        all_pitchers = all_players_df[all_players_df["position"] == "P"]
+
+        hitter_replacement_value = self.replacement_at_rank(all_hitters, hitter_rank)
+        pitcher_replacement_value = self.replacement_at_rank(all_pitchers, pitcher_rank)
+        return {
+            "hitter_replacement_value": hitter_replacement_value,
+            "pitcher_replacement_value": pitcher_replacement_value
+        }
+
+    def calculate_replacement_ranks(self) -> Dict[str, int]:
+        """Rostered hitters and pitchers league-wide (starters plus a 60/40 bench split): the replacement rank per group."""
         # Compute combined pitcher demand for dollar baseline
         position_demand = self.calculate_position_demand()
 
@@ -361,17 +389,9 @@ class PlayerValueCalculator:
         bench_hitter = int(round(bench_total * 0.60))
         bench_pitcher = bench_total - bench_hitter
 
-        hitter_rank = hitter_demand_total + bench_hitter
-        pitcher_rank = pitcher_demand_total + bench_pitcher
-        
-        all_hitters = all_players_df[all_players_df["position"] == "B"]
-        all_pitchers = all_players_df[all_players_df["position"] == "P"]
-
-        hitter_replacement_value = self.replacement_at_rank(all_hitters, hitter_rank)
-        pitcher_replacement_value = self.replacement_at_rank(all_pitchers, pitcher_rank)
         return {
-            "hitter_replacement_value": hitter_replacement_value,
-            "pitcher_replacement_value": pitcher_replacement_value
+            "hitter_rank": hitter_demand_total + bench_hitter,
+            "pitcher_rank": pitcher_demand_total + bench_pitcher
         }
 
     # Replacement baseline for dollars: use rank = demand_total
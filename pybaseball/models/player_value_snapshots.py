@@ -0,0 +1,187 @@
+import numpy as np
+import pandas as pd
+from datetime import date
+from typing import Optional, Tuple
+from models.db_recorder import DB_Recorder
+from models.player_data_loader import PlayerDataLoader
+from utils.constants import SNAPSHOT_CHECKPOINT_DAYS
+from utils.logger import logger
+
+class PlayerValueSnapshots(DB_Recorder):
+    """
+    Delta storage for player value snapshots. A player's totals and component rows are written together, and only on
+    the as_of_date their quantized values change; players that drop out of a slice get an is_removed tombstone.
+    The snapshot for any date is each player's latest row on or before it, read from the latest checkpoint (a date
+    on which every live player was written) onwards.
+    """
+    TOTALS_TABLE = "player_value_snapshots"
+    COMPONENTS_TABLE = "player_value_snapshot_components"
+    CHECKPOINTS_TABLE = "player_value_snapshot_checkpoints"
+    TOTALS_FIELDS = ["player_pk", "mlb_player_id", "position", "as_of_date", "total_value", "tier", "reliability_score", "risk_score", "is_removed"]
+    COMPONENTS_FIELDS = ["player_pk", "as_of_date", "category_code", "projection_value", "zscore", "weighted_value", "tier"]
+    # Values are compared at this many decimal places, so float noise between runs is not a change
+    VALUE_DECIMALS = 6
+
+    def __init__(self, conn, loader: PlayerDataLoader):
+        super().__init__(conn)
+        self.loader = loader
+        self.dry_run = loader.dry_run
+
+    def write_snapshot(self, as_of: date, model_id: int, span_days: int, split_type: str,
+                       totals_df: pd.DataFrame, components_df: pd.DataFrame) -> None:
+        """Persist one (model, span, split) snapshot, writing only players whose values changed since the previous date"""
+        previous_date = self.get_previous_date(model_id, span_days, split_type, as_of)
+        is_checkpoint = previous_date is None or self.get_latest_checkpoint(model_id, span_days, split_type, as_of) == as_of
+        # A re-run for the same date replaces whatever that date already holds
+        self.purge_date(as_of, model_id, span_days, split_type)
+        if is_checkpoint:
+            self.write_rows(as_of, model_id, span_days, split_type, totals_df, components_df)
+            self.record_checkpoint(as_of, model_id, span_days, split_type)
+            logger.info(f"Snapshot checkpoint: model={model_id} span={span_days} split={split_type} players={len(totals_df)}")
+            return
+
+        previous_totals, previous_components = self.load_snapshot(model_id, span_days, split_type, previous_date)
+        current_hashes = self.get_player_hashes(totals_df, components_df)
+        previous_hashes = self.get_player_hashes(previous_totals, previous_components)
+        unchanged = current_hashes.index.isin(previous_hashes.index)
+        unchanged[unchanged] = current_hashes[unchanged].to_numpy() == previous_hashes.reindex(current_hashes.index[unchanged]).to_numpy()
+        changed_players = current_hashes.index[~unchanged]
+
+        removed = previous_totals[~previous_totals["player_pk"].isin(totals_df["player_pk"])].copy()
+        removed = removed.assign(total_value=0.0, tier=None, reliability_score=None, risk_score=None, is_removed=1)
+        changed_totals = pd.concat([
+            totals_df[totals_df["player_pk"].isin(changed_players)].assign(is_removed=0),
+            removed,
+        ], ignore_index=True)
+        changed_components = components_df[components_df["player_pk"].isin(changed_players)]
+
+        self.write_rows(as_of, model_id, span_days, split_type, changed_totals, changed_components)
+        logger.info(
+            f"Snapshot delta: model={model_id} span={span_days} split={split_type} since {previous_date}: "
+            f"{len(changed_players)} changed, {len(removed)} removed, {len(totals_df) - len(changed_players)} unchanged"
+        )
+
+    def write_rows(self, as_of, model_id, span_days, split_type, totals_df, components_df):
+        self.loader.upsert_snapshot_totals(as_of, model_id, span_days, split_type, totals_df)
+        self.loader.upsert_snapshot_components(as_of, model_id, span_days, split_type, components_df)
+
+    def purge_date(self, as_of, model_id, span_days, split_type):
+        if self.dry_run:
+            return
+        for table in [self.COMPONENTS_TABLE, self.TOTALS_TABLE]:
+            self.execute_query(
+                f"DELETE FROM {table} WHERE model_id = %s AND span_days = %s AND split_type = %s AND as_of_date = %s",
+                (model_id, span_days, split_type, as_of),
+            )
+
+    def load_snapshot(self, model_id: int, span_days: int, split_type: str, as_of: date) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Reconstruct the full snapshot for a date: (totals_df, components_df) of live players, as originally written"""
+        checkpoint = self.get_latest_checkpoint(model_id, span_days, split_type, as_of)
+        lower_bound = "AND as_of_date >= %s" if checkpoint is not None else ""
+        latest_params = (model_id, span_days, split_type, as_of) + ((checkpoint,) if checkpoint is not None else ())
+        latest = f"""
+            SELECT player_pk, MAX(as_of_date) AS as_of_date
+            FROM {self.TOTALS_TABLE}
+            WHERE model_id = %s AND span_days = %s AND split_type = %s AND as_of_date <= %s {lower_bound}
+            GROUP BY player_pk
+        """
+        totals = self.get_query(f"""
+            SELECT {', '.join(f's.{field}' for field in self.TOTALS_FIELDS)}
+            FROM {self.TOTALS_TABLE} s
+            JOIN ({latest}) latest ON latest.player_pk = s.player_pk AND latest.as_of_date = s.as_of_date
+            WHERE s.model_id = %s AND s.span_days = %s AND s.split_type = %s AND s.is_removed = 0
+        """, latest_params + (model_id, span_days, split_type))
+        components = self.get_query(f"""
+            SELECT {', '.join(f'c.{field}' for field in self.COMPONENTS_FIELDS)}
+            FROM {self.COMPONENTS_TABLE} c
+            JOIN ({latest}) latest ON latest.player_pk = c.player_pk AND latest.as_of_date = c.as_of_date
+            WHERE c.model_id = %s AND c.span_days = %s AND c.split_type = %s
+        """, latest_params + (model_id, span_days, split_type))
+
+        totals_df = pd.DataFrame(totals, columns=self.TOTALS_FIELDS)
+        components_df = pd.DataFrame(components, columns=self.COMPONENTS_FIELDS)
+        # Tombstoned players have no components, so only live players' rows remain
+        components_df = components_df[components_df["player_pk"].isin(totals_df["player_pk"])].reset_index(drop=True)
+        return totals_df, components_df
+
+    def checkpoint(self, model_id: int, span_days: int, split_type: str, as_of: date) -> int:
+        """Materialize the full snapshot for as_of as a checkpoint, so later reads start from it. Returns players written."""
+        totals_df, components_df = self.load_snapshot(model_id, span_days, split_type, as_of)
+        self.write_rows(as_of, model_id, span_days, split_type, totals_df, components_df)
+        self.record_checkpoint(as_of, model_id, span_days, split_type)
+        logger.info(f"Checkpointed model={model_id} span={span_days} split={split_type} at {as_of} with {len(totals_df)} players")
+        return len(totals_df)
+
+    def get_slices_due_for_checkpoint(self, every_days: int = SNAPSHOT_CHECKPOINT_DAYS) -> list:
+        """(model_id, span_days, split_type, latest_date) for slices whose latest date is every_days or more past their last checkpoint"""
+        slices = self.get_query(f"""
+            SELECT s.model_id, s.span_days, s.split_type, s.latest_date, MAX(c.as_of_date) AS checkpoint_date
+            FROM (
+                SELECT model_id, span_days, split_type, MAX(as_of_date) AS latest_date
+                FROM {self.TOTALS_TABLE}
+                GROUP BY model_id, span_days, split_type
+            ) s
+            LEFT JOIN {self.CHECKPOINTS_TABLE} c
+                ON c.model_id = s.model_id AND c.span_days = s.span_days AND c.split_type = s.split_type
+            GROUP BY s.model_id, s.span_days, s.split_type, s.latest_date
+        """)
+        return [
+            (row["model_id"], row["span_days"], row["split_type"], row["latest_date"])
+            for row in slices
+            if row["checkpoint_date"] is None or (row["latest_date"] - row["checkpoint_date"]).days >= every_days
+        ]
+
+    def get_previous_date(self, model_id: int, span_days: int, split_type: str, as_of: date) -> Optional[date]:
+        rows = self.get_query(
+            f"SELECT MAX(as_of_date) AS as_of_date FROM {self.TOTALS_TABLE} WHERE model_id = %s AND span_days = %s AND split_type = %s AND as_of_date < %s",
+            (model_id, span_days, split_type, as_of),
+        )
+        return rows[0]["as_of_date"] if rows else None
+
+    def get_latest_checkpoint(self, model_id: int, span_days: int, split_type: str, as_of: date) -> Optional[date]:
+        rows = self.get_query(
+            f"SELECT MAX(as_of_date) AS as_of_date FROM {self.CHECKPOINTS_TABLE} WHERE model_id = %s AND span_days = %s AND split_type = %s AND as_of_date <= %s",
+            (model_id, span_days, split_type, as_of),
+        )
+        return rows[0]["as_of_date"] if rows else None
+
+    def record_checkpoint(self, as_of: date, model_id: int, span_days: int, split_type: str) -> None:
+        if self.dry_run:
+            return
+        self.execute_query(
+            f"INSERT IGNORE INTO {self.CHECKPOINTS_TABLE} (model_id, span_days, split_type, as_of_date) VALUES (%s, %s, %s, %s)",
+            (model_id, span_days, split_type, as_of),
+        )
+
+    def get_player_hashes(self, totals_df: pd.DataFrame, components_df: pd.DataFrame) -> pd.Series:
+        """One hash per player_pk over their quantized totals and components, independent of row order"""
+        if totals_df.empty:
+            return pd.Series(dtype="uint64")
+        totals = pd.DataFrame({
+            "player_pk": totals_df["player_pk"].astype(int).to_numpy(),
+            "mlb_player_id": self.quantize(totals_df["mlb_player_id"], 0),
+            "position": totals_df["position"].astype(str).to_numpy(),
+            "total_value": self.quantize(totals_df["total_value"]),
+            "tier": self.quantize(totals_df["tier"], 0),
+            "reliability_score": self.quantize(totals_df["reliability_score"], 0),
+            "risk_score": self.quantize(totals_df["risk_score"], 0),
+        })
+        hashes = pd.Series(pd.util.hash_pandas_object(totals, index=False).to_numpy(), index=totals["player_pk"])
+        if not components_df.empty:
+            components = pd.DataFrame({
+                "player_pk": components_df["player_pk"].astype(int).to_numpy(),
+                "category_code": components_df["category_code"].astype(str).to_numpy(),
+                "projection_value": self.quantize(components_df["projection_value"]),
+                "zscore": self.quantize(components_df["zscore"]),
+                "weighted_value": self.quantize(components_df["weighted_value"]),
+                "tier": self.quantize(components_df["tier"], 0),
+            })
+            component_hashes = pd.Series(pd.util.hash_pandas_object(components, index=False).to_numpy(), index=components["player_pk"])
+            # Summing (mod 2^64) keeps the combined hash independent of category order
+            combined = component_hashes.groupby(level=0).sum().reindex(hashes.index, fill_value=0).astype("uint64")
+            hashes = pd.Series(hashes.to_numpy() + combined.to_numpy(), index=hashes.index)
+        return hashes
+
+    def quantize(self, series: pd.Series, decimals: int = VALUE_DECIMALS) -> pd.arrays.IntegerArray:
+        values = pd.to_numeric(series, errors="coerce").astype(float).to_numpy()
+        return pd.array(np.round(values * 10 ** decimals), dtype="Int64")
@@ -9,6 +9,7 @@ from models.game_logs.logs_inserter import LogsInserter
 from models.game_logs.probable_pitcher import ProbablePitcher
 from models.game_logs.projected_pitcher import ProjectedPitcher
 from models.team_pitching_rotations import TeamPitchingRotations
+from models.player_lookups import PlayerLookups
 
 class ProbablePitchers(DB_Recorder):
     MAX_DAYS_AHEAD = 10
@@ -17,11 +18,12 @@ class ProbablePitchers(DB_Recorder):
     MAX_ROTATION_GAMES_BEHIND = 10
     PROBABLE_PITCHERS_TABLE = "probable_pitchers"
     
-    def __init__(self, conn, espn_api: EspnApi, mlb_api: MlbApi, team_pitching_rotations: TeamPitchingRotations):
+    def __init__(self, conn, espn_api: EspnApi, mlb_api: MlbApi, team_pitching_rotations: TeamPitchingRotations, player_lookups: PlayerLookups | None = None):
         self.probable_pitchers_table = self.PROBABLE_PITCHERS_TABLE
         self.espn_api = espn_api
         self.mlb_api = mlb_api
         self.team_pitching_rotations = team_pitching_rotations
+        self.player_lookups = player_lookups
         super().__init__(conn)
 
     def purge_old_probable_pitchers(self):
@@ -179,10 +181,37 @@ class ProbablePitchers(DB_Recorder):
             return
         
         logger.info(f"Upserting {probable_pitchers.get_row_count()} probable pitchers")
+        self.key_probable_pitchers(probable_pitchers)
         insert_query = f"""
             INSERT INTO {self.probable_pitchers_table} ({probable_pitchers.get_insert_keys()})
             VALUES ({probable_pitchers.get_placeholders()})
             ON DUPLICATE KEY UPDATE
                 {probable_pitchers.get_duplicate_update_keys()}
         """
-        self.batch_upsert(insert_query, probable_pitchers.get_rows())
\ No newline at end of file
+        self.batch_upsert(insert_query, probable_pitchers.get_rows())
+
+    def key_probable_pitchers(self, probable_pitchers: LogsInserter):
+        """
+        Fill player_id and normalised_name on each pitcher row from player_lookup before it is written,
+        matching by espn id then (normalised_name, team). ESPN ids learned here are saved to the lookup.
+        """
+        if self.player_lookups is None:
+            return
+        resolver = self.player_lookups.identity_resolver
+        keys = probable_pitchers.keys
+        player_index, espn_index, name_index, team_index = (
+            keys.index(key) for key in ('player_id', 'espn_pitcher_id', 'normalised_name', 'team')
+        )
+        for row in probable_pitchers.get_rows():
+            # ESPN sends ids as strings; player_lookup stores them as integers
+            espn_player_id = int(row[espn_index]) if row[espn_index] else None
+            if row[player_index] is not None:
+                lookup = resolver.get_by_id('player_id', row[player_index], 'P')
+            else:
+                lookup = resolver.resolve('P', {'espn_player_id': espn_player_id}, row[name_index], row[team_index])
+            if lookup is None:
+                continue
+            row[player_index] = lookup['player_id']
+            row[name_index] = row[name_index] or lookup['normalised_name']
+            resolver.backfill_lookup_id(lookup, 'espn_player_id', espn_player_id)
+        resolver.flush_lookup_updates()
@@ -3,12 +3,91 @@ from models.score_calculator import ScoreCalculator
 from utils.logger import logger
 
 class QSScoreCalculator(ScoreCalculator):
+    QS_WEIGHTS = {
+        'comp_qs_rate': 0.40,
+        'comp_ip_per_start': 0.15,
+        'comp_fip_minus_inv': 0.10,
+        'comp_bb_pct_inv': 0.05,
+        'comp_k_pct': 0.05,
+        'comp_hr9_inv': 0.05,
+        'comp_opp_runs_inv': 0.10,
+        'comp_opp_ops_inv': 0.07,
+        'comp_opp_so': 0.03,
+    }
+
     def __init__(self, conn):
         super().__init__(conn)
 
-    def update_probables_qs_scores(self, season_year=None):
+    def update_probables_qs_scores(self, season_year=None, vectorized=True):
         start_date, end_date = self.get_window_dates()
-        self.update_qs_likelihood_scores(start_date, end_date, season_year)
+        if vectorized:
+            self.score_qs_likelihood(start_date, end_date, season_year)
+        else:
+            self.update_qs_likelihood_scores(start_date, end_date, season_year)
+
+    def score_qs_likelihood(self, start_date, end_date, season_year=None):
+        """Vectorized equivalent of update_qs_likelihood_scores: look up the matchup features, score in NumPy, write back in bulk"""
+        if season_year is None:
+            season_year = datetime.now().year
+        logger.info(f"Scoring QS likelihood for probable pitchers from {start_date} to {end_date} (season {season_year})")
+        probables = self.get_probable_pitchers(start_date, end_date)
+        if not probables:
+            logger.info("No probable pitchers to score")
+            return
+        features = self.get_qs_features(probables, season_year)
+        scores = self.compute_qs_scores(features)
+        self.bulk_update_scores('qs_likelihood_score', [row['pp_id'] for row in probables], scores)
+
+    def get_qs_features(self, probables, season_year):
+        """Raw inputs for compute_qs_scores, one array entry per probable pitcher"""
+        hands = self.get_pitcher_hands()
+        pitcher_features = self.load_pitcher_features(['ip', 'games', 'qs', 'fip_minus_pct', 'k_pct_pct', 'bb_pct_pct', 'hr_per_9_pct'], season_year)
+        team_features = self.load_team_features(['avg_runs_scored_pct', 'vs_hand_ops_pct', 'vs_hand_so_rate_pct'], season_year)
+
+        pitcher = self.lookup_features(pitcher_features, [(row['player_id'],) for row in probables])
+        # The opponent's runs come from their split for this venue: away when our pitcher is at home
+        opp_venue = self.lookup_features(team_features, [(row['opp_team'], 'away' if row['home'] else 'home') for row in probables])
+        opp_vs_hand = self.lookup_features(team_features, [(row['opp_team'], self.hand_split(hands.get(row['player_id']))) for row in probables])
+        return {
+            'roll_ip': pitcher['ip'],
+            'roll_g': pitcher['games'],
+            'qs': pitcher['qs'],
+            'qs_games': pitcher['games'],
+            'fip_minus_pct': pitcher['fip_minus_pct'],
+            'k_pct_pct': pitcher['k_pct_pct'],
+            'bb_pct_pct': pitcher['bb_pct_pct'],
+            'hr_per_9_pct': pitcher['hr_per_9_pct'],
+            'opp_runs_split_pct': opp_venue['avg_runs_scored_pct'],
+            'opp_ops_vs_hand_pct': opp_vs_hand['vs_hand_ops_pct'],
+            'opp_so_vs_hand_pct': opp_vs_hand['vs_hand_so_rate_pct'],
+        }
+
+    @classmethod
+    def compute_qs_components(cls, features):
+        """0-100 components from the raw feature arrays (NaN where the source row is missing)"""
+        return {
+            # QS rate over last N days; soften <3 starts
+            'comp_qs_rate': cls.soften_rate(features['qs'], features['qs_games'], 0.80),
+            # IP per start; cap at 7.0; soften <3 starts
+            'comp_ip_per_start': cls.soften_rate(features['roll_ip'], features['roll_g'], 0.90, cap=7.0, scale=1.0) / 6.0 * 100,
+            'comp_fip_minus_inv': cls.inverse_percentile(features['fip_minus_pct']),
+            'comp_bb_pct_inv': cls.inverse_percentile(features['bb_pct_pct']),
+            'comp_k_pct': cls.percentile_or_zero(features['k_pct_pct']),
+            'comp_hr9_inv': cls.inverse_percentile(features['hr_per_9_pct']),
+            # Opponent recent scoring (lower better) using home/away split
+            'comp_opp_runs_inv': cls.inverse_percentile(features['opp_runs_split_pct']),
+            # Opponent OPS vs our hand (lower better)
+            'comp_opp_ops_inv': cls.inverse_percentile(features['opp_ops_vs_hand_pct']),
+            # Opponent SO% vs our hand (higher better)
+            'comp_opp_so': cls.percentile_or_zero(features['opp_so_vs_hand_pct']),
+        }
+
+    @classmethod
+    def compute_qs_scores(cls, features):
+        """Weighted QS likelihood (0-100, one decimal) for each entry of the feature arrays. Pure NumPy; no database access."""
+        components = cls.compute_qs_components(features)
+        scores = sum(components[name] * weight for name, weight in cls.QS_WEIGHTS.items())
+        return cls.round_scores(scores)
 
     def update_qs_likelihood_scores(self, start_date, end_date, season_year=None):
         if season_year is None:
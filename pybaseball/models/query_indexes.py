@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta
+from models.db_recorder import DB_Recorder
+from models.player_game_logs import PlayerGameLogs
+from models.team_game_logs import TeamGameLogs
+from models.game_pitchers import GamePitchers
+from models.player_lookups import PlayerLookups
+from models.probable_pitchers import ProbablePitchers
+from models.season_stats import SeasonStats
+from models.league_statistics import LeagueStatistics
+from utils.constants import MAX_AGE_DAYS, CURRENT_SEASON
+from utils.logger import logger
+
+class QueryIndexes(DB_Recorder):
+    """Declares the indexes each hot query family relies on and checks them against the live schema."""
+    # An existing index satisfies a requirement when its leading columns match the declared columns
+    REQUIRED_INDEXES = {
+        'game_logs': [
+            (PlayerGameLogs.GAME_LOGS_TABLE, 'idx_pgl_season_date_position', ['season_year', 'game_date', 'position']),
+            (PlayerGameLogs.GAME_LOGS_TABLE, 'idx_pgl_game_id', ['game_id']),
+            (PlayerGameLogs.GAME_LOGS_TABLE, 'idx_pgl_team_game', ['team', 'game_id']),
+            (PlayerGameLogs.GAME_LOGS_TABLE, 'idx_pgl_player_position', ['player_id', 'position']),
+            (TeamGameLogs.GAME_LOGS_TABLE, 'idx_tgl_season_date', ['season_year', 'game_date']),
+            (TeamGameLogs.GAME_LOGS_TABLE, 'idx_tgl_team_game', ['team', 'game_id']),
+            (GamePitchers.GAME_PITCHERS_TABLE, 'idx_gp_game_id', ['game_id']),
+        ],
+        'lookups': [
+            (PlayerLookups.LOOKUP_TABLE, 'idx_player_id_position', ['player_id', 'position']),
+            (PlayerLookups.LOOKUP_TABLE, 'idx_normalised_name', ['normalised_name']),
+        ],
+        'rolling_stats': [
+            (PlayerGameLogs.BASIC_ROLLING_STATS_TABLE, 'idx_prs_season_span_split', ['season_year', 'span_days', 'split_type']),
+            (PlayerGameLogs.ADVANCED_ROLLING_STATS_TABLE, 'idx_pars_season_span_split', ['season_year', 'span_days', 'split_type']),
+            (TeamGameLogs.ROLLING_STATS_TABLE, 'idx_trs_season_span_split', ['season_year', 'span_days', 'split_type']),
+            (LeagueStatistics.ADVANCED_ROLLING_STATS_TABLE, 'unique_league_rolling', ['span_days', 'split_type', 'season_year']),
+        ],
+        'splits': [
+            (TeamGameLogs.TEAM_VS_BATTER_SPLITS_TABLE, 'idx_tvb_season_span', ['season_year', 'span_days']),
+            (TeamGameLogs.TEAM_VS_PITCHER_SPLITS_TABLE, 'idx_tvp_season_span', ['season_year', 'span_days']),
+        ],
+        'percentiles': [
+            (PlayerGameLogs.BASIC_ROLLING_STATS_TABLE + '_percentiles', 'idx_prsp_season_span_split', ['season_year', 'span_days', 'split_type']),
+            (PlayerGameLogs.ADVANCED_ROLLING_STATS_TABLE + '_percentiles', 'idx_parsp_season_span_split', ['season_year', 'span_days', 'split_type']),
+            (TeamGameLogs.ROLLING_STATS_TABLE + '_percentiles', 'idx_trsp_season_span_split', ['season_year', 'span_days', 'split_type']),
+            (TeamGameLogs.TEAM_VS_BATTER_SPLITS_TABLE + '_percentiles', 'idx_tvbp_season_span', ['season_year', 'span_days']),
+            (TeamGameLogs.TEAM_VS_PITCHER_SPLITS_TABLE + '_percentiles', 'idx_tvpp_season_span', ['season_year', 'span_days']),
+            (SeasonStats.PLAYER_STATS_TABLE + '_percentiles', 'idx_pssp_player_position', ['player_id', 'position']),
+        ],
+        'scores': [
+            (ProbablePitchers.PROBABLE_PITCHERS_TABLE, 'idx_pp_game_date', ['game_date']),
+            (ProbablePitchers.PROBABLE_PITCHERS_TABLE, 'idx_player_id', ['player_id']),
+        ],
+    }
+    # Tables with fewer estimated rows than this are allowed to be fully scanned
+    FULL_SCAN_ROW_THRESHOLD = 10000
+
+    def __init__(self, conn):
+        super().__init__(conn)
+
+    def verify_indexes(self, create_missing=False):
+        """Report (and optionally create) every declared index missing from the schema. Returns the missing list."""
+        missing = []
+        existing_indexes = self.get_existing_indexes()
+        for query_family, indexes in self.REQUIRED_INDEXES.items():
+            for table_name, index_name, columns in indexes:
+                table_indexes = existing_indexes.get(table_name)
+                if table_indexes is None:
+                    logger.warning(f"Table {table_name} required by {query_family} queries does not exist")
+                    continue
+                if any(index_columns[:len(columns)] == columns for index_columns in table_indexes.values()):
+                    continue
+                missing.append((table_name, index_name, columns))
+                logger.warning(f"Missing index for {query_family} queries: {table_name} ({', '.join(columns)})")
+
+        if create_missing:
+            for table_name, index_name, columns in missing:
+                logger.info(f"Creating index {index_name} on {table_name} ({', '.join(columns)})")
+                self.execute_query(f"ALTER TABLE {table_name} ADD INDEX {index_name} ({', '.join(columns)})")
+
+        logger.info(f"Index verification complete: {len(missing)} missing{' (created)' if create_missing and missing else ''}")
+        return missing
+
+    def get_existing_indexes(self):
+        """Return {table_name: {index_name: [columns in order]}} for the current schema."""
+        rows = self.get_query("""
+            SELECT TABLE_NAME AS table_name, INDEX_NAME AS index_name, COLUMN_NAME AS column_name
+            FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE()
+            ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+        """)
+        existing_indexes = {}
+        for row in rows:
+            existing_indexes.setdefault(row['table_name'], {}).setdefault(row['index_name'], []).append(row['column_name'])
+        return existing_indexes
+
+    def get_explain_probes(self, season_year=None):
+        """Representative shapes of the largest rolling, split and score queries."""
+        if season_year is None:
+            season_year = CURRENT_SEASON
+        today = datetime.today().date()
+        window_start = today - timedelta(days=MAX_AGE_DAYS)
+        return {
+            'player rolling window': (
+                f"SELECT player_id, COUNT(*) FROM {PlayerGameLogs.GAME_LOGS_TABLE} "
+                "WHERE season_year = %s AND game_date >= %s AND position = 'B' GROUP BY player_id",
+                (season_year, window_start),
+            ),
+            'team vs pitcher splits': (
+                f"SELECT pgl.team, COUNT(*) FROM {PlayerGameLogs.GAME_LOGS_TABLE} pgl "
+                f"JOIN {GamePitchers.GAME_PITCHERS_TABLE} gp ON pgl.game_id = gp.game_id "
+                f"JOIN {PlayerLookups.LOOKUP_TABLE} pl ON pl.player_id = gp.home_pitcher_id AND pl.position = 'P' "
+                "WHERE pgl.season_year = %s AND pgl.game_date >= %s AND pgl.position = 'B' GROUP BY pgl.team",
+                (season_year, window_start),
+            ),
+            'rolling percentiles': (
+                f"SELECT player_id FROM {PlayerGameLogs.ADVANCED_ROLLING_STATS_TABLE} "
+                "WHERE season_year = %s AND span_days = %s AND split_type = %s",
+                (season_year, 30, 'overall'),
+            ),
+            'probable pitcher scores': (
+                f"SELECT pp.id FROM {ProbablePitchers.PROBABLE_PITCHERS_TABLE} pp "
+                f"JOIN {PlayerGameLogs.BASIC_ROLLING_STATS_TABLE} prs ON prs.player_id = pp.player_id AND prs.position = 'P' "
+                "WHERE pp.game_date BETWEEN %s AND %s AND prs.season_year = %s AND prs.span_days = 30 AND prs.split_type = 'overall'",
+                (today, today + timedelta(days=ProbablePitchers.MAX_PROJECTED_DAYS_AHEAD), season_year),
+            ),
+        }
+
+    def check_query_plans(self, season_year=None):
+        """EXPLAIN the probe queries and warn about full scans of large tables. Returns the offending plan rows."""
+        full_scans = []
+        for probe_name, (query, params) in self.get_explain_probes(season_year).items():
+            try:
+                plan = self.get_query(f"EXPLAIN {query}", params)
+            except Exception as e:
+                logger.warning(f"Could not EXPLAIN {probe_name} query: {e}")
+                continue
+            for step in plan:
+                if step.get('type') == 'ALL' and (step.get('rows') or 0) >= self.FULL_SCAN_ROW_THRESHOLD:
+                    full_scans.append((probe_name, step.get('table'), step.get('rows')))
+                    logger.warning(f"Full scan in {probe_name} query: {step.get('table')} (~{step.get('rows')} rows)")
+        return full_scans
@@ -1,14 +1,13 @@
 from models.rolling_stats.player_rolling_stats import PlayerRollingStats
 from models.player_game_logs import PlayerGameLogs
+from models.league_statistics import LeagueStatistics
 from utils.constants import FIP_CONSTANT, WOBASCALE
 from utils.logger import logger
 
 class PlayerAdvancedRollingStats(PlayerRollingStats):
-    LEAGUE_AVERAGE_KEYS = {
-        'batting': ['obp', 'slg', 'ops', 'woba'],
-        'pitching': ['fip']
-    }
-    LEAGUE_AVERAGE_TABLE = 'league_advanced_rolling_stats'
+    LEAGUE_AVERAGE_TABLE = LeagueStatistics.ADVANCED_ROLLING_STATS_TABLE
+    # Plate appearances are stored so league rates can be re-pooled from the player rows
+    ADVANCED_EXTRA_KEYS = ['pa']
     STATS_KEYS = {
         'batting': ['obp', 'slg', 'ops', 'bb_rate', 'k_rate', 'babip', 'iso', 'contact_pct', 'gb_fb_ratio', 'lob_batting_pct', 'woba'],
         'pitching': ['inherited_runners', 'inherited_runners_scored', 'irs_pct', 'fip', 'k_per_9', 'bb_per_9', 'hr_per_9', 'k_bb_ratio', 'lob_pitching_pct']
@@ -18,14 +17,17 @@ class PlayerAdvancedRollingStats(PlayerRollingStats):
         'pitching': ['fip_minus', 'era_minus']
     }
 
-    def __init__(self, conn, rolling_stats_percentiles):
+    def __init__(self, conn, rolling_stats_percentiles, league_statistics=None):
         super().__init__(conn, rolling_stats_percentiles)
+        self.league_statistics = league_statistics if league_statistics is not None else LeagueStatistics(conn)
         self.rolling_stats_table = PlayerGameLogs.ADVANCED_ROLLING_STATS_TABLE
         self.basic_rolling_stats_table = PlayerGameLogs.BASIC_ROLLING_STATS_TABLE
         self.game_logs_table = PlayerGameLogs.GAME_LOGS_TABLE
 
     def get_formulas(self, game_logs_table=None, season_year=None):
         return super().get_formulas(game_logs_table, season_year) | {
+            'pa': """-- PA = AB + BB + HBP + SF
+                        SUM(COALESCE(gl.ab, 0)) + SUM(COALESCE(gl.bb, 0)) + SUM(COALESCE(gl.hit_by_pitch, 0)) + SUM(COALESCE(gl.sac_flies, 0)) AS pa""",
             'obp': """-- OBP = (H + BB + HBP) / (AB + BB + HBP + SF)
                         ROUND(
                             (SUM(COALESCE(gl.h, 0)) + SUM(COALESCE(gl.bb, 0)) + SUM(COALESCE(gl.hit_by_pitch, 0))) /
@@ -193,13 +195,12 @@ class PlayerAdvancedRollingStats(PlayerRollingStats):
         self.begin_transaction()
 
         try:
-            self.compute_league_averages(season_year)
             # Clear existing rolling stats for this season before computing new ones
             logger.info(f"Clearing existing advanced player rolling stats for {season_year}")
             self.purge_season_records_in_transaction(self.rolling_stats_table, season_year)
 
             for key, stats_list in self.STATS_KEYS.items():
-                insert_keys = self.SPLIT_WINDOW_KEYS + self.ID_KEYS + self.EXTRA_KEYS + self.DATE_KEYS + stats_list
+                insert_keys = self.SPLIT_WINDOW_KEYS + self.ID_KEYS + self.EXTRA_KEYS + self.ADVANCED_EXTRA_KEYS + self.DATE_KEYS + stats_list
                 all_formulas = self.get_formulas(self.game_logs_table, season_year)
                 select_formulas = [all_formulas[key] for key in insert_keys]
                 join_conditions = super().get_join_conditions()
@@ -210,6 +211,7 @@ class PlayerAdvancedRollingStats(PlayerRollingStats):
 
                 super().compute_rolling_stats(self.rolling_stats_table, self.game_logs_table, insert_keys, select_formulas, join_conditions, 'GROUP BY gl.player_id', position, season_year)
 
+            self.compute_league_averages(season_year)
             self.update_advanced_rolling_stats(season_year)
             self.compute_percentiles(season_year)
 
@@ -241,26 +243,8 @@ class PlayerAdvancedRollingStats(PlayerRollingStats):
         self.execute_query_in_transaction(update_query)
 
     def compute_league_averages(self, season_year=None):
-        from datetime import datetime
-        if season_year is None:
-            season_year = datetime.now().year
-        # Clear existing league averages for this season before computing new ones
-        logger.info(f"Clearing existing league averages for {season_year}")
-        self.purge_season_records_in_transaction(self.LEAGUE_AVERAGE_TABLE, season_year)
-
-        # Compute league averages separately for batters and pitchers
-        for key, stats_list in self.LEAGUE_AVERAGE_KEYS.items():
-            # Only include stats that are relevant for this position
-            position = 'B' if key == 'batting' else 'P'
-
-            insert_keys = self.SPLIT_WINDOW_KEYS + self.DATE_KEYS + stats_list
-            all_formulas = self.get_formulas(self.game_logs_table, season_year)
-            select_formulas = [all_formulas[key] for key in insert_keys]
-            logger.info(f"Computing league averages for {key} stats: {stats_list}")
-            join_conditions = super().get_join_conditions()
-
-            # Pass the position parameter to properly filter the data
-            super().compute_rolling_stats(self.LEAGUE_AVERAGE_TABLE, self.game_logs_table, insert_keys, select_formulas, join_conditions, '', position, season_year)
+        """League averages are pooled from the player rows just written rather than re-scanning the game logs"""
+        self.league_statistics.compute_advanced_league_averages(season_year)
 
     def compute_percentiles(self, season_year=None):
         from datetime import datetime
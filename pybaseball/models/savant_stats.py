@@ -4,54 +4,67 @@ from models.game_logs.savant_batter_stat_log import SavantBatterStatLog
 from models.game_logs.savant_advanced_batter_stat_log import SavantAdvancedBatterStatLog
 from models.game_logs.savant_pitcher_stat_log import SavantPitcherStatLog
 from models.game_logs.logs_inserter import LogsInserter
+from models.player_lookups import PlayerLookups
 from utils.logger import logger
 from datetime import datetime
 
 
 class SavantStats(SeasonStats):
-    def __init__(self, conn, savant_api: SavantApi):
+    def __init__(self, conn, savant_api: SavantApi, player_lookups: PlayerLookups | None = None):
         super().__init__(conn)
         self.api = savant_api
+        self.player_lookups = player_lookups
+
+    # source -> (label, stat log)
+    LEADERBOARDS = {
+        'batter': ('batter', SavantBatterStatLog),
+        'advanced_batter': ('advanced batter', SavantAdvancedBatterStatLog),
+        'pitcher': ('pitcher', SavantPitcherStatLog),
+    }
+
+    def get_source_downloads(self):
+        """Independent Savant leaderboard downloads, so they can be fetched concurrently"""
+        return {
+            'batter': self.api.get_batting_stats,
+            'advanced_batter': self.api.get_advanced_batting_stats,
+            'pitcher': self.api.get_pitching_stats,
+        }
 
     def update_all_statcast_player_stats(self, season_year=None):
         if season_year is None:
             season_year = datetime.now().year
         logger.info(f"Updating all statcast player stats from Baseball Savant for {season_year}")
+        for source, download in self.get_source_downloads().items():
+            self.upsert_source(source, download(), season_year)
+
+    def upsert_source(self, source, stats_data, season_year=None):
+        if season_year is None:
+            season_year = datetime.now().year
+        label, stat_log = self.LEADERBOARDS[source]
+        all_stats = LogsInserter(stat_log.KEYS, stat_log.ID_KEYS, stat_log.COALESCE_KEYS)
+
+        if stats_data is None:
+            logger.error(f"No {label} stats data found from Savant")
+            return
+
+        logger.info(f"Found {len(stats_data)} rows of {label} stats")
+        all_stats.add_rows(self.name_player_rows(stat_log.KEYS, stat_log.get_rows(stats_data, season_year)))
+
+        logger.info(f"Inserting {all_stats.get_row_count()} rows of {label} stats")
+        self.upsert_stats(self.PLAYER_STATS_TABLE, all_stats)
 
-        all_batter_stats = LogsInserter(SavantBatterStatLog.KEYS, SavantBatterStatLog.ID_KEYS)
-        all_advanced_batter_stats = LogsInserter(SavantAdvancedBatterStatLog.KEYS, SavantAdvancedBatterStatLog.ID_KEYS)
-        all_pitcher_stats = LogsInserter(SavantPitcherStatLog.KEYS, SavantPitcherStatLog.ID_KEYS)
-
-        batter_stats_data = self.api.get_batting_stats()
-        advanced_batter_stats_data = self.api.get_advanced_batting_stats()
-        pitcher_stats_data = self.api.get_pitching_stats()
-
-        if batter_stats_data is None:
-            logger.error("No batter stats data found from Savant")
-        else:
-            logger.info(f"Found {len(batter_stats_data)} rows of batter stats")
-            for _, player_data in batter_stats_data.iterrows():
-                all_batter_stats.add_row(SavantBatterStatLog(player_data.to_dict(), season_year))
-
-            logger.info(f"Inserting {all_batter_stats.get_row_count()} rows of batter stats")
-            self.upsert_stats(self.PLAYER_STATS_TABLE, all_batter_stats)
-
-        if advanced_batter_stats_data is None:
-            logger.error("No advanced batter stats data found from Savant")
-        else:
-            logger.info(f"Found {len(advanced_batter_stats_data)} rows of advanced batter stats")
-            for _, player_data in advanced_batter_stats_data.iterrows():
-                all_advanced_batter_stats.add_row(SavantAdvancedBatterStatLog(player_data.to_dict(), season_year))
-
-            logger.info(f"Inserting {all_advanced_batter_stats.get_row_count()} rows of advanced batter stats")
-            self.upsert_stats(self.PLAYER_STATS_TABLE, all_advanced_batter_stats)
-
-        if pitcher_stats_data is None:
-            logger.error("No pitcher stats data found from Savant")
-        else:
-            logger.info(f"Found {len(pitcher_stats_data)} rows of pitcher stats")
-            for _, player_data in pitcher_stats_data.iterrows():
-                all_pitcher_stats.add_row(SavantPitcherStatLog(player_data.to_dict(), season_year))
-
-            logger.info(f"Inserting {all_pitcher_stats.get_row_count()} rows of pitcher stats")
-            self.upsert_stats(self.PLAYER_STATS_TABLE, all_pitcher_stats)
\ No newline at end of file
+    def name_player_rows(self, keys, rows):
+        """Set normalised_name from player_lookup by (player_id, position), so Savant-only rows are written named"""
+        if self.player_lookups is None:
+            return rows
+        resolver = self.player_lookups.identity_resolver
+        player_index, name_index, position_index = (keys.index(key) for key in ('player_id', 'normalised_name', 'position'))
+        named_rows = []
+        for row in rows:
+            lookup = resolver.get_by_id('player_id', row[player_index], row[position_index])
+            if lookup is not None:
+                row = list(row)
+                row[name_index] = lookup['normalised_name']
+                row = tuple(row)
+            named_rows.append(row)
+        return named_rows
@@ -1,15 +1,20 @@
+import numpy as np
 from datetime import datetime, timedelta
 from models.db_recorder import DB_Recorder
 from models.game_pitchers import GamePitchers
+from models.matchup_features import MatchupFeatures
 from models.probable_pitchers import ProbablePitchers
 from models.player_lookups import PlayerLookups
 from models.player_game_logs import PlayerGameLogs
 from models.season_stats import SeasonStats
 from models.team_game_logs import TeamGameLogs
+from utils.logger import logger
 
 class ScoreCalculator(DB_Recorder):
     PITCHER_SPAN_DAYS = 30
     TEAM_SPAN_DAYS = 14
+    # Rates over fewer starts than this are softened
+    FULL_SAMPLE_GAMES = 3
 
     def __init__(self, conn):
         super().__init__(conn)
@@ -25,6 +30,8 @@ class ScoreCalculator(DB_Recorder):
         self.player_advanced_rolling_stats_percentiles_table = self.player_advanced_rolling_stats_table + "_percentiles"
         self.team_rolling_stats_percentiles_table = self.team_rolling_stats_table + "_percentiles"
         self.team_vs_pitcher_splits_percentiles_table = self.team_vs_pitcher_splits_table + "_percentiles"
+        self.pitcher_features_table = MatchupFeatures.PITCHER_FEATURES_TABLE
+        self.team_features_table = MatchupFeatures.TEAM_FEATURES_TABLE
         self.max_days_ahead = ProbablePitchers.MAX_PROJECTED_DAYS_AHEAD
 
     def get_window_dates(self):
@@ -32,4 +39,102 @@ class ScoreCalculator(DB_Recorder):
         end_date = start_date + timedelta(days=self.max_days_ahead)
         return start_date, end_date
 
+    def get_probable_pitchers(self, start_date, end_date):
+        """Probable pitchers in the window with their opponent's starter attached when the game is known"""
+        return self.get_query(f"""
+            SELECT
+                pp.id AS pp_id,
+                pp.player_id,
+                pp.team AS pitcher_team,
+                pp.opponent AS opp_team,
+                pp.home,
+                CASE
+                    WHEN pp.game_id IS NOT NULL AND pp.team = gp.home_team THEN gp.away_pitcher_id
+                    WHEN pp.game_id IS NOT NULL AND pp.team = gp.away_team THEN gp.home_pitcher_id
+                    ELSE NULL
+                END AS opp_pitcher_id
+            FROM {self.probable_pitchers_table} pp
+            LEFT JOIN {self.game_pitchers_table} gp ON gp.game_id = pp.game_id
+            WHERE pp.game_date BETWEEN %s AND %s
+                AND pp.player_id IS NOT NULL
+        """, (start_date, end_date))
 
+    def get_pitcher_hands(self):
+        rows = self.get_query(f"SELECT player_id, throws FROM {self.player_lookup_table} WHERE position = 'P'")
+        return {row['player_id']: row['throws'] for row in rows}
+
+    def load_pitcher_features(self, fields, season_year):
+        """Overall pitcher form over PITCHER_SPAN_DAYS from the materialized features, keyed by (player_id,)"""
+        return self.load_keyed_features(f"""
+            SELECT player_id, {', '.join(fields)} FROM {self.pitcher_features_table}
+            WHERE season_year = %s AND split_type = 'overall' AND span_days = %s
+        """, (season_year, self.PITCHER_SPAN_DAYS), ['player_id'], fields)
+
+    def load_team_features(self, fields, season_year):
+        """Team percentiles over TEAM_SPAN_DAYS from the materialized features, keyed by (team, split_type)"""
+        return self.load_keyed_features(f"""
+            SELECT team, split_type, {', '.join(fields)} FROM {self.team_features_table}
+            WHERE season_year = %s AND span_days = %s
+        """, (season_year, self.TEAM_SPAN_DAYS), ['team', 'split_type'], fields)
+
+    @staticmethod
+    def hand_split(throws):
+        return MatchupFeatures.HAND_SPLITS.get(throws)
+
+    def load_keyed_features(self, query, params, key_fields, value_fields):
+        """Load rows as ({key tuple: row position}, {value field: float array}); later rows win on duplicate keys, NULL becomes NaN"""
+        rows = self.get_query(query, params)
+        index = {}
+        values = {field: np.full(len(rows), np.nan) for field in value_fields}
+        for position, row in enumerate(rows):
+            index[tuple(row[key] for key in key_fields)] = position
+            for field in value_fields:
+                if row[field] is not None:
+                    values[field][position] = float(row[field])
+        return index, values
+
+    @staticmethod
+    def lookup_features(features, keys):
+        """Gather keyed feature arrays for each key in keys; keys with no row get NaN"""
+        index, values = features
+        positions = np.array([index.get(key, -1) for key in keys], dtype=int)
+        found = positions >= 0
+        gathered = {}
+        for field, array in values.items():
+            column = np.full(len(keys), np.nan)
+            column[found] = array[positions[found]]
+            gathered[field] = column
+        return gathered
+
+    @classmethod
+    def soften_rate(cls, count, games, soften_factor, empty_value=0.0, cap=100.0, scale=100.0):
+        """min(count / games * scale, cap), scaled by soften_factor below FULL_SAMPLE_GAMES and empty_value with no games.
+        A missing count propagates as NaN, as NULL does in SQL."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rate = np.minimum(count * scale / games, cap)
+        return np.where(games >= cls.FULL_SAMPLE_GAMES, rate, np.where(games > 0, rate * soften_factor, empty_value))
+
+    @staticmethod
+    def inverse_percentile(percentile):
+        """100 - percentile for lower-is-better stats; 0 when missing"""
+        return np.where(np.isnan(percentile), 0.0, 100.0 - percentile)
+
+    @staticmethod
+    def percentile_or_zero(percentile):
+        return np.nan_to_num(percentile, nan=0.0)
+
+    @staticmethod
+    def round_scores(scores):
+        """ROUND(score, 1) half away from zero, clamped to 0-100; NaN stays NaN"""
+        rounded = np.sign(scores) * np.floor(np.abs(scores) * 10 + 0.5) / 10
+        return np.clip(rounded, 0, 100)
+
+    def bulk_update_scores(self, score_column, pp_ids, scores):
+        """Write every score in one transaction via a temp table joined back onto probable_pitchers"""
+        rows = [(int(pp_id), None if np.isnan(score) else float(score)) for pp_id, score in zip(pp_ids, scores)]
+        try:
+            self.bulk_update(self.probable_pitchers_table, 'id', 'INT', {score_column: 'DECIMAL(5,1)'}, rows)
+            logger.info(f"Updated {score_column} for {len(rows)} probable pitchers")
+        except Exception as e:
+            logger.exception(f"Error updating {score_column}: {e}")
+            raise e
@@ -0,0 +1,81 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from models.db import get_db_connection
+from models.api.mlb_api import MlbApi
+from models.player_game_logs import PlayerGameLogs
+from models.team_game_logs import TeamGameLogs
+from models.game_pitchers import GamePitchers
+from models.league_game_logs import LeagueGameLogs
+from utils.constants import SEASON_BACKFILL_CHUNK_DAYS, SEASON_BACKFILL_WORKERS
+from utils.logger import logger
+
+
+def backfill_date_range(start_date, end_date):
+    """Worker entry point: fetch and upsert all game logs between start_date and end_date into the archive tables.
+
+    Runs in its own process, so it opens its own API session and DB connection.
+    Returns the game ids written; team advanced statistics are left to the parent once every chunk has landed.
+    """
+    conn = None
+    try:
+        conn = get_db_connection()
+        league_game_logs = LeagueGameLogs(MlbApi(), PlayerGameLogs(conn, archive=True), TeamGameLogs(conn, archive=True), GamePitchers(conn, archive=True))
+        games = league_game_logs.fetch_game_logs(start_date=start_date, end_date=end_date)
+        league_game_logs.upsert_game_logs(games, update_advanced_statistics=False)
+        return {game['game_pk'] for game in games}
+    finally:
+        if conn:
+            conn.close()
+
+
+class SeasonGameLogsBackfill():
+    SEASON_START_MONTH_DAY = (3, 1)
+    SEASON_END_MONTH_DAY = (11, 1)
+
+    def __init__(self, season_year, chunk_days=SEASON_BACKFILL_CHUNK_DAYS, max_workers=SEASON_BACKFILL_WORKERS):
+        self.season_year = season_year
+        self.chunk_days = chunk_days
+        self.max_workers = max_workers
+
+    def get_season_chunks(self):
+        """Split the season (capped at today) into inclusive (start, end) YYYY-MM-DD ranges."""
+        season_start = date(self.season_year, *self.SEASON_START_MONTH_DAY)
+        season_end = min(date(self.season_year, *self.SEASON_END_MONTH_DAY), datetime.today().date())
+
+        chunks = []
+        chunk_start = season_start
+        while chunk_start <= season_end:
+            chunk_end = min(chunk_start + timedelta(days=self.chunk_days - 1), season_end)
+            chunks.append((chunk_start.strftime('%Y-%m-%d'), chunk_end.strftime('%Y-%m-%d')))
+            chunk_start = chunk_end + timedelta(days=1)
+        return chunks
+
+    def run(self):
+        """Backfill every chunk of the season into the archive tables in parallel worker processes.
+
+        Returns the set of game ids written. Raises if any chunk failed, after the rest have been written.
+        """
+        chunks = self.get_season_chunks()
+        if not chunks:
+            logger.info(f"No dates to backfill for season {self.season_year}")
+            return set()
+
+        logger.info(f"Backfilling season {self.season_year} in {len(chunks)} chunks of {self.chunk_days} days using {self.max_workers} workers")
+        game_ids = set()
+        failed_chunks = []
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(backfill_date_range, start, end): (start, end) for start, end in chunks}
+            for future in as_completed(futures):
+                start, end = futures[future]
+                try:
+                    chunk_game_ids = future.result()
+                    game_ids |= chunk_game_ids
+                    logger.info(f"Backfilled {len(chunk_game_ids)} games from {start} to {end}")
+                except Exception as e:
+                    failed_chunks.append((start, end))
+                    logger.error(f"Failed to backfill games from {start} to {end}: {e}")
+
+        logger.info(f"Backfilled {len(game_ids)} games for season {self.season_year}")
+        if failed_chunks:
+            raise RuntimeError(f"{len(failed_chunks)} of {len(chunks)} chunks failed to backfill for season {self.season_year}: {sorted(failed_chunks)}")
+        return game_ids
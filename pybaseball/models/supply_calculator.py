@@ -144,18 +144,7 @@ def compute_supply_for_model(
     return replacement_df, supply_df, tier_supply_df
 
 
-def upsert_supply_tables_for_draft(
-    rec,
-    *,
-    draft_id: int,
-    model_id: int,
-    replacement_df: pd.DataFrame,
-    supply_df: pd.DataFrame,
-    tier_supply_df: pd.DataFrame,
-    dry_run: bool = False
-) -> None:
-    # 1) replacement
-    repl_sql = """
+REPLACEMENT_UPSERT_SQL = """
     INSERT INTO draft_position_replacement
       (draft_id, model_id, slot_code, replacement_value, replacement_price, updated_at)
     VALUES
@@ -165,13 +154,8 @@ def upsert_supply_tables_for_draft(
       replacement_price = VALUES(replacement_price),
       updated_at = NOW()
     """
-    repl_rows = [
-        (draft_id, model_id, r["slot_code"], float(r["replacement_value"]), float(r["replacement_price"]))
-        for _, r in replacement_df.iterrows()
-    ]
 
-    # 2) supply
-    supply_sql = """
+SUPPLY_UPSERT_SQL = """
     INSERT INTO draft_position_supply
       (draft_id, model_id, slot_code, remaining_above_replacement, slots_remaining_league, scarcity_index, updated_at)
     VALUES
@@ -182,6 +166,37 @@ def upsert_supply_tables_for_draft(
       scarcity_index = VALUES(scarcity_index),
       updated_at = NOW()
     """
+
+TIER_UPSERT_SQL = """
+    INSERT INTO draft_tier_supply
+      (draft_id, model_id, slot_code, tier, remaining_count, updated_at)
+    VALUES
+      (%s, %s, %s, %s, %s, NOW())
+    ON DUPLICATE KEY UPDATE
+      remaining_count = VALUES(remaining_count),
+      updated_at = NOW()
+    """
+
+TIER_DELETE_SQL = "DELETE FROM draft_tier_supply WHERE draft_id=%s AND model_id=%s AND slot_code=%s AND tier=%s"
+
+
+def upsert_supply_tables_for_draft(
+    rec,
+    *,
+    draft_id: int,
+    model_id: int,
+    replacement_df: pd.DataFrame,
+    supply_df: pd.DataFrame,
+    tier_supply_df: pd.DataFrame,
+    dry_run: bool = False
+) -> None:
+    # 1) replacement
+    repl_rows = [
+        (draft_id, model_id, r["slot_code"], float(r["replacement_value"]), float(r["replacement_price"]))
+        for _, r in replacement_df.iterrows()
+    ]
+
+    # 2) supply
     supply_rows = [
         (
             draft_id, model_id, r["slot_code"],
@@ -193,15 +208,6 @@ def upsert_supply_tables_for_draft(
     ]
 
     # 3) tier supply
-    tier_sql = """
-    INSERT INTO draft_tier_supply
-      (draft_id, model_id, slot_code, tier, remaining_count, updated_at)
-    VALUES
-      (%s, %s, %s, %s, %s, NOW())
-    ON DUPLICATE KEY UPDATE
-      remaining_count = VALUES(remaining_count),
-      updated_at = NOW()
-    """
     tier_rows = [
         (draft_id, model_id, r["slot_code"], int(r["tier"]), int(r["remaining_count"]))
         for _, r in tier_supply_df.iterrows()
@@ -217,6 +223,238 @@ def upsert_supply_tables_for_draft(
         (draft_id, model_id)
     )
 
-    rec.batch_upsert(repl_sql, repl_rows)
-    rec.batch_upsert(supply_sql, supply_rows)
-    rec.batch_upsert(tier_sql, tier_rows)
\ No newline at end of file
+    rec.batch_upsert(REPLACEMENT_UPSERT_SQL, repl_rows)
+    rec.batch_upsert(SUPPLY_UPSERT_SQL, supply_rows)
+    rec.batch_upsert(TIER_UPSERT_SQL, tier_rows)
+
+
+def load_taken_player_pks(rec, draft_id: int) -> set:
+    """Players already off the board for a draft: keepers and purchases."""
+    rows = rec.get_query(
+        """
+        SELECT player_pk FROM draft_keepers WHERE draft_id = %s
+        UNION
+        SELECT player_pk FROM draft_purchases WHERE draft_id = %s
+        """,
+        (draft_id, draft_id),
+    )
+    return {int(r["player_pk"]) for r in rows}
+
+
+class RemainingIndex:
+    """
+    Fenwick tree of remaining flags over a fixed (value-sorted) order.
+    Removing/restoring a position and finding the k-th remaining one are both O(log n).
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.tree = [0] * (size + 1)
+        # All positions start remaining: tree[i] covers (i - lowbit(i), i]
+        for i in range(1, size + 1):
+            self.tree[i] = i & -i
+        self.count = size
+
+    def add(self, position: int, delta: int) -> None:
+        self.count += delta
+        i = position + 1
+        while i <= self.size:
+            self.tree[i] += delta
+            i += i & -i
+
+    def find_kth(self, k: int) -> int:
+        """0-based position of the k-th (1-indexed) remaining entry; k must be in 1..count."""
+        position = 0
+        step = 1 << self.size.bit_length()
+        while step:
+            nxt = position + step
+            if nxt <= self.size and self.tree[nxt] < k:
+                position = nxt
+                k -= self.tree[nxt]
+            step >>= 1
+        return position
+
+
+class SlotSupply:
+    """Remaining eligible players for one slot, in descending value order, with running supply counts."""
+
+    def __init__(self, slot_code: str, demand: int, elig: pd.DataFrame):
+        self.slot_code = slot_code
+        self.demand = demand
+        order = elig.sort_values("total_value", ascending=False, kind="stable")
+        self.player_pks = order["player_pk"].astype(int).tolist()
+        self.values = order["total_value"].astype(float).tolist()
+        self.prices = order["est_auction_value"].astype(float).tolist()
+        self.tiers = [None if pd.isna(t) else int(t) for t in order["tier"]]
+        self.positions = {pk: i for i, pk in enumerate(self.player_pks)}
+        self.remaining = [True] * len(self.player_pks)
+        self.index = RemainingIndex(len(self.player_pks))
+
+        self.priced_remaining = sum(1 for price in self.prices if price >= 1.0)
+        self.tier_counts: Dict[int, int] = {}
+        for tier in self.tiers:
+            if tier is not None:
+                self.tier_counts[tier] = self.tier_counts.get(tier, 0) + 1
+        self.replacement = self.compute_replacement()
+
+    def set_remaining(self, player_pk: int, remaining: bool) -> Tuple[bool, int]:
+        """Flip one player's remaining flag. Returns (changed, tier delta applied to)."""
+        position = self.positions[player_pk]
+        if self.remaining[position] == remaining:
+            return False, None
+        delta = 1 if remaining else -1
+        self.remaining[position] = remaining
+        self.index.add(position, delta)
+        if self.prices[position] >= 1.0:
+            self.priced_remaining += delta
+        tier = self.tiers[position]
+        if tier is not None:
+            self.tier_counts[tier] = self.tier_counts.get(tier, 0) + delta
+        return True, tier
+
+    def compute_replacement(self) -> Tuple[float, float]:
+        """(value, price) at rank demand among remaining players, or the last remaining one (see replacement_at_rank)."""
+        if self.index.count == 0 or self.demand <= 0:
+            return 0.0, 0.0
+        position = self.index.find_kth(min(self.demand, self.index.count))
+        return self.values[position], self.prices[position]
+
+    def supply_row(self) -> Dict:
+        return {
+            "slot_code": self.slot_code,
+            "remaining_above_replacement": self.priced_remaining,
+            "slots_remaining_league": self.demand,
+            "scarcity_index": float(self.priced_remaining / self.demand) if self.demand > 0 else 0.0,
+        }
+
+    def replacement_row(self) -> Dict:
+        value, price = self.replacement
+        return {"slot_code": self.slot_code, "replacement_value": value, "replacement_price": price}
+
+
+class DraftSupplyEngine:
+    """
+    In-memory supply state for a live draft. Built once from the model's player values, then each pick
+    (or undone pick) is applied to every slot the player is eligible for in O(log n), updating replacement
+    values, remaining_above_replacement, scarcity_index and tier counts. Only rows that changed since the
+    last flush are written.
+    """
+
+    def __init__(
+        self,
+        *,
+        draft_id: int,
+        model_id: int,
+        team_count: int,
+        roster_slots_df: pd.DataFrame,
+        player_values_df: pd.DataFrame,
+        taken_player_pks=(),
+    ):
+        self.draft_id = draft_id
+        self.model_id = model_id
+        demand = position_demand(roster_slots_df, team_count)
+        self.slots: Dict[str, SlotSupply] = {}
+        self.player_slots: Dict[int, list] = {}
+        for slot in CORE_SLOTS:
+            slot_demand = int(demand.get(slot, 0))
+            if slot_demand <= 0:
+                continue
+            supply = SlotSupply(slot, slot_demand, player_values_df[eligible_mask(player_values_df, slot)])
+            self.slots[slot] = supply
+            for player_pk in supply.player_pks:
+                self.player_slots.setdefault(player_pk, []).append(supply)
+
+        self.taken = set()
+        self.clear_changes()
+        for player_pk in taken_player_pks:
+            self.remove_player(player_pk)
+        self.clear_changes()
+
+    def remove_player(self, player_pk: int) -> None:
+        """A player was kept or purchased."""
+        self.set_remaining(player_pk, False)
+
+    def restore_player(self, player_pk: int) -> None:
+        """A purchase or keeper was undone."""
+        self.set_remaining(player_pk, True)
+
+    def sync_taken(self, taken_player_pks: set) -> None:
+        """Apply the difference between the current taken set and a freshly loaded one."""
+        for player_pk in taken_player_pks - self.taken:
+            self.remove_player(player_pk)
+        for player_pk in self.taken - taken_player_pks:
+            self.restore_player(player_pk)
+
+    def set_remaining(self, player_pk: int, remaining: bool) -> None:
+        player_pk = int(player_pk)
+        if remaining:
+            self.taken.discard(player_pk)
+        else:
+            self.taken.add(player_pk)
+        for supply in self.player_slots.get(player_pk, []):
+            changed, tier = supply.set_remaining(player_pk, remaining)
+            if not changed:
+                continue
+            self.changed_supply.add(supply.slot_code)
+            if tier is not None:
+                self.changed_tiers.add((supply.slot_code, tier))
+            replacement = supply.compute_replacement()
+            if replacement != supply.replacement:
+                supply.replacement = replacement
+                self.changed_replacements.add(supply.slot_code)
+
+    def clear_changes(self) -> None:
+        self.changed_supply = set()
+        self.changed_replacements = set()
+        self.changed_tiers = set()
+
+    def has_changes(self) -> bool:
+        return bool(self.changed_supply or self.changed_replacements or self.changed_tiers)
+
+    def to_frames(self) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """Full state in the shape of compute_supply_for_model, for upsert_supply_tables_for_draft."""
+        replacement_df = pd.DataFrame([supply.replacement_row() for supply in self.slots.values()])
+        supply_df = pd.DataFrame([supply.supply_row() for supply in self.slots.values()])
+        tier_supply_df = pd.DataFrame([
+            {"slot_code": slot, "tier": tier, "remaining_count": count}
+            for slot, supply in self.slots.items()
+            for tier, count in sorted(supply.tier_counts.items())
+            if count > 0
+        ])
+        return replacement_df, supply_df, tier_supply_df
+
+    def flush_changes(self, rec, dry_run: bool = False) -> None:
+        """Write only the replacement, supply and tier rows changed since the last flush."""
+        repl_rows = [
+            (self.draft_id, self.model_id, slot, *self.slots[slot].replacement)
+            for slot in sorted(self.changed_replacements)
+        ]
+        supply_rows = []
+        for slot in sorted(self.changed_supply):
+            row = self.slots[slot].supply_row()
+            supply_rows.append((
+                self.draft_id, self.model_id, slot,
+                row["remaining_above_replacement"], row["slots_remaining_league"], row["scarcity_index"],
+            ))
+        tier_rows = []
+        tier_deletes = []
+        for slot, tier in sorted(self.changed_tiers):
+            count = self.slots[slot].tier_counts.get(tier, 0)
+            if count > 0:
+                tier_rows.append((self.draft_id, self.model_id, slot, tier, count))
+            else:
+                # Full recomputes only write non-empty tiers
+                tier_deletes.append((self.draft_id, self.model_id, slot, tier))
+
+        if dry_run:
+            print(f"[dry-run] draft_id={self.draft_id} model_id={self.model_id} repl={len(repl_rows)} supply={len(supply_rows)} tier={len(tier_rows)} tier_deleted={len(tier_deletes)}")
+        else:
+            if repl_rows:
+                rec.batch_upsert(REPLACEMENT_UPSERT_SQL, repl_rows)
+            if supply_rows:
+                rec.batch_upsert(SUPPLY_UPSERT_SQL, supply_rows)
+            if tier_rows:
+                rec.batch_upsert(TIER_UPSERT_SQL, tier_rows)
+            if tier_deletes:
+                rec.batch_upsert(TIER_DELETE_SQL, tier_deletes)
+        self.clear_changes()
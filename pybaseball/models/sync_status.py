@@ -27,3 +27,9 @@ class SyncStatus:
                 last_run = VALUES(last_run)
             """, (sync_name, status, message, datetime.now(timezone.utc)))
         self.conn.commit()
+
+    def get_last_message(self, sync_name: str):
+        with self.conn.cursor() as cursor:
+            cursor.execute(f"SELECT message FROM {self.SYNC_STATUS_TABLE} WHERE sync_name = %s AND status = 'success'", (sync_name,))
+            row = cursor.fetchone()
+        return row[0] if row else None
@@ -1,3 +1,6 @@
+import numpy as np
+import pandas as pd
+from datetime import timedelta
 from models.game_logs_db import GameLogsDB
 from utils.logger import logger
 from utils.constants import ROLLING_WINDOWS
@@ -8,14 +11,21 @@ from models.game_logs.logs_inserter import LogsInserter
 
 class TeamGameLogs(GameLogsDB):
     GAME_LOGS_TABLE = "team_game_logs"
+    ARCHIVE_TABLE = "team_game_logs_archive"
     ROLLING_STATS_TABLE = "team_rolling_stats"
     TEAM_VS_BATTER_SPLITS_TABLE = "team_vs_batter_splits"
     TEAM_VS_PITCHER_SPLITS_TABLE = "team_vs_pitcher_splits"
+    UPDATED_GAME_IDS_TABLE = "tmp_updated_game_ids"
+    TEAM_VS_SPLITS_SUM_KEYS = ['ab', 'hits', 'doubles', 'triples', 'hr', 'rbi', 'runs', 'sb', 'bb', 'k', 'sac_flies', 'hbp', 'ground_into_dp']
+    TEAM_VS_SPLITS_RATE_KEYS = ['avg', 'obp', 'slg', 'ops', 'so_rate', 'bb_rate']
+    TEAM_VS_SPLITS_KEYS = ['season_year', 'span_days', 'start_date', 'end_date', 'games_played'] + TEAM_VS_SPLITS_SUM_KEYS + TEAM_VS_SPLITS_RATE_KEYS
 
-    def __init__(self, conn, team_rolling_stats=None):
+    def __init__(self, conn, team_rolling_stats=None, archive=False):
         self.conn = conn
         self.team_rolling_stats = team_rolling_stats
-        super().__init__(conn, self.GAME_LOGS_TABLE)
+        # Archive team logs are aggregated from the archive player logs
+        self.player_game_logs_table = PlayerGameLogs.ARCHIVE_TABLE if archive else PlayerGameLogs.GAME_LOGS_TABLE
+        super().__init__(conn, self.ARCHIVE_TABLE if archive else self.GAME_LOGS_TABLE)
 
     def upsert_game_logs(self, team_game_logs: LogsInserter):
         """Upsert team game logs to database"""
@@ -26,11 +36,22 @@ class TeamGameLogs(GameLogsDB):
         logger.info(f"Upserting {team_game_logs.get_row_count()} team game logs")        
         super().upsert_game_logs(team_game_logs)
 
-    def update_advanced_statistics(self):
-        """Update advanced statistics for team game logs"""
-        logger.info("Updating advanced statistics for team game logs")
+    def update_advanced_statistics(self, game_ids=None):
+        """Update advanced statistics for team game logs, restricted to game_ids when given"""
+        if game_ids is not None and not game_ids:
+            logger.info("No games to update advanced statistics for")
+            return
+
+        game_ids_filter = ''
+        if game_ids is not None:
+            logger.info(f"Updating advanced statistics for {len(game_ids)} team game logs")
+            self.create_updated_game_ids_table(game_ids)
+            game_ids_filter = f"AND pgl.game_id IN (SELECT game_id FROM {self.UPDATED_GAME_IDS_TABLE})"
+        else:
+            logger.info("Updating advanced statistics for team game logs")
+
         batting_update_query = f"""
-            UPDATE {self.GAME_LOGS_TABLE} AS tgl
+            UPDATE {self.game_logs_table} AS tgl
             JOIN (
                 SELECT
                     team,
@@ -42,8 +63,9 @@ class TeamGameLogs(GameLogsDB):
                     SUM(ground_into_dp) AS ground_into_dp,
                     SUM(k) AS strikeouts,
                     SUM(bb) AS walks
-                FROM {PlayerGameLogs.GAME_LOGS_TABLE}
+                FROM {self.player_game_logs_table} AS pgl
                 WHERE position = 'B'
+                    {game_ids_filter}
                 GROUP BY team, game_id
             ) AS agg
             ON tgl.team = agg.team AND tgl.game_id = agg.game_id
@@ -58,7 +80,7 @@ class TeamGameLogs(GameLogsDB):
         """
         self.execute_query(batting_update_query)
         pitching_update_query = f"""
-            UPDATE {self.GAME_LOGS_TABLE} AS tgl
+            UPDATE {self.game_logs_table} AS tgl
             JOIN (
                 SELECT
                     team,
@@ -76,8 +98,9 @@ class TeamGameLogs(GameLogsDB):
                     SUM(home_runs_allowed) AS home_runs_allowed,
                     SUM(inherited_runners) AS inherited_runners,
                     SUM(inherited_runners_scored) AS inherited_runners_scored
-                FROM {PlayerGameLogs.GAME_LOGS_TABLE}
+                FROM {self.player_game_logs_table} AS pgl
                 WHERE position != 'B'
+                    {game_ids_filter}
                 GROUP BY team, game_id
             ) AS agg
             ON tgl.team = agg.team AND tgl.game_id = agg.game_id
@@ -98,148 +121,133 @@ class TeamGameLogs(GameLogsDB):
         """
         self.execute_query(pitching_update_query)
 
+        if game_ids is not None:
+            self.execute_query(f"DROP TEMPORARY TABLE IF EXISTS {self.UPDATED_GAME_IDS_TABLE}")
+
+    def create_updated_game_ids_table(self, game_ids):
+        """Load the touched game_ids into a session-scoped temp table for the aggregation joins"""
+        self.execute_query(f"DROP TEMPORARY TABLE IF EXISTS {self.UPDATED_GAME_IDS_TABLE}")
+        self.execute_query(f"""
+            CREATE TEMPORARY TABLE {self.UPDATED_GAME_IDS_TABLE} (
+                game_id VARCHAR(20) PRIMARY KEY
+            ) ENGINE=MEMORY
+        """)
+        self.batch_upsert(
+            f"INSERT IGNORE INTO {self.UPDATED_GAME_IDS_TABLE} (game_id) VALUES (%s)",
+            [(str(game_id),) for game_id in game_ids]
+        )
+
     def compute_rolling_stats(self, season_year=None):
         from datetime import datetime
         if season_year is None:
             season_year = datetime.now().year
         self.team_rolling_stats.compute_rolling_stats(season_year)
-        self.compute_team_vs_batter_splits(season_year)
-        self.compute_team_vs_pitcher_splits(season_year)
+        self.compute_team_vs_splits(season_year)
         self.team_rolling_stats.compute_team_vs_splits_percentiles(season_year)
 
-    def compute_team_vs_batter_splits(self, season_year=None):
+    def compute_team_vs_splits(self, season_year=None):
+        """Compute team vs batter and team vs pitcher splits for every rolling window from one scan of the game logs"""
         from datetime import datetime
         if season_year is None:
             season_year = datetime.now().year
-        # Clear existing team vs batter splits for this season before computing new ones
-        logger.info(f"Clearing existing team vs batter splits for {season_year}")
-        self.purge_records_with_conditions(self.TEAM_VS_BATTER_SPLITS_TABLE, [f'season_year = {season_year}'])
+        logger.info(f"Computing team vs batter and team vs pitcher splits for {season_year}")
+        game_logs = pd.DataFrame(self.get_team_vs_splits_game_logs(season_year, max(ROLLING_WINDOWS)))
+        end_date = self.get_query("SELECT CURDATE() AS today")[0]['today']
 
+        batter_splits = []
+        pitcher_splits = []
         for window in ROLLING_WINDOWS:
-            logger.info(f"Computing team vs batter splits for {window} days")
-
-            insert_query = f"""
-                INSERT INTO {self.TEAM_VS_BATTER_SPLITS_TABLE} (
-                    team, bats, season_year, span_days, start_date, end_date, games_played,
-                    ab, hits, doubles, triples, hr, rbi, runs, sb, bb, k,
-                    sac_flies, hbp, ground_into_dp,
-                    avg, obp, slg, ops, so_rate, bb_rate
-                    )
-                SELECT
-                    pgl.opponent AS team,
-                    pl.bats,
-                    {season_year} AS season_year,
-                    %s AS span_days,
-                    DATE_SUB(CURDATE(), INTERVAL %s DAY) AS start_date,
-                    CURDATE() AS end_date,
-                    COUNT(*) AS games_played,
-
-                    SUM(COALESCE(pgl.ab, 0)) AS ab,
-                    SUM(COALESCE(pgl.h, 0)) AS hits,
-                    SUM(COALESCE(pgl.doubles, 0)) AS doubles,
-                    SUM(COALESCE(pgl.triples, 0)) AS triples,
-                    SUM(COALESCE(pgl.hr, 0)) AS hr,
-                    SUM(COALESCE(pgl.rbi, 0)) AS rbi,
-                    SUM(COALESCE(pgl.r, 0)) AS runs,
-                    SUM(COALESCE(pgl.sb, 0)) AS sb,
-                    SUM(COALESCE(pgl.bb, 0)) AS bb,
-                    SUM(COALESCE(pgl.k, 0)) AS k,
-
-                    SUM(COALESCE(pgl.sac_flies, 0)) AS sac_flies,
-                    SUM(COALESCE(pgl.hit_by_pitch, 0)) AS hbp,
-                    SUM(COALESCE(pgl.ground_into_dp, 0)) AS ground_into_dp,
-
-                    ROUND(SUM(COALESCE(pgl.h, 0)) / NULLIF(SUM(COALESCE(pgl.ab, 0)), 0), 3) AS avg,
-                    ROUND((SUM(pgl.h) + SUM(pgl.bb) + SUM(pgl.hit_by_pitch)) / NULLIF(SUM(pgl.ab) + SUM(pgl.bb) + SUM(pgl.hit_by_pitch) + SUM(pgl.sac_flies), 0), 3) AS obp,
-                    ROUND(SUM(pgl.total_bases) / NULLIF(SUM(pgl.ab), 0), 3) AS slg,
-                    ROUND(
-                        (SUM(pgl.h) + SUM(pgl.bb) + SUM(pgl.hit_by_pitch)) / NULLIF(SUM(pgl.ab) + SUM(pgl.bb) + SUM(pgl.hit_by_pitch) + SUM(pgl.sac_flies), 0) +
-                        (SUM(pgl.total_bases) / NULLIF(SUM(pgl.ab), 0)), 3
-                    ) AS ops,
-                    ROUND(SUM(pgl.k) / NULLIF(SUM(pgl.ab + pgl.bb + pgl.hit_by_pitch + pgl.sac_flies), 0), 3) AS so_rate,
-                    ROUND(SUM(pgl.bb) / NULLIF(SUM(pgl.ab + pgl.bb + pgl.hit_by_pitch + pgl.sac_flies), 0), 3) AS bb_rate
-
-                FROM {PlayerGameLogs.GAME_LOGS_TABLE} AS pgl
-                JOIN {PlayerLookups.LOOKUP_TABLE} AS pl ON pgl.player_id = pl.player_id AND (pgl.position <=> pl.position)
-
-                WHERE pgl.game_date >= DATE_SUB(CURDATE(), INTERVAL %s DAY)
-                    AND pgl.season_year = {season_year}
-                    AND pgl.position = 'B'
-                    AND pl.bats IN ('L', 'R')
-
-                GROUP BY pgl.opponent, pl.bats;
-            """
-
-            params = (window, window, window)
-            self.execute_query(insert_query, params)
-
-    def compute_team_vs_pitcher_splits(self, season_year=None):
-        from datetime import datetime
-        if season_year is None:
-            season_year = datetime.now().year
-        # Clear existing team vs pitcher splits for this season before computing new ones
-        logger.info(f"Clearing existing team vs pitcher splits for {season_year}")
+            logger.info(f"Aggregating team vs splits for {window} days")
+            if game_logs.empty:
+                break
+            window_logs = game_logs[game_logs['days_ago'] <= window]
+            start_date = end_date - timedelta(days=window)
+            batter_splits += self.aggregate_team_vs_splits(window_logs, 'opponent', 'bats', season_year, window, start_date, end_date)
+            pitcher_splits += self.aggregate_team_vs_splits(window_logs, 'team', 'throws', season_year, window, start_date, end_date)
+
+        # Clear existing splits for this season before writing the new ones
+        logger.info(f"Clearing existing team vs batter and team vs pitcher splits for {season_year}")
+        self.purge_records_with_conditions(self.TEAM_VS_BATTER_SPLITS_TABLE, [f'season_year = {season_year}'])
         self.purge_records_with_conditions(self.TEAM_VS_PITCHER_SPLITS_TABLE, [f'season_year = {season_year}'])
 
-        for window in ROLLING_WINDOWS:
-            logger.info(f"Computing team vs pitcher splits for {window} days")
-
+        for table_name, hand_key, rows in [
+            (self.TEAM_VS_BATTER_SPLITS_TABLE, 'bats', batter_splits),
+            (self.TEAM_VS_PITCHER_SPLITS_TABLE, 'throws', pitcher_splits),
+        ]:
+            insert_keys = ['team', hand_key] + self.TEAM_VS_SPLITS_KEYS
             insert_query = f"""
-                INSERT INTO {self.TEAM_VS_PITCHER_SPLITS_TABLE} (
-                    team, throws, season_year, span_days, start_date, end_date, games_played,
-                    ab, hits, doubles, triples, hr, rbi, runs, sb, bb, k,
-                    sac_flies, hbp, ground_into_dp,
-                    avg, obp, slg, ops, so_rate, bb_rate
-                )
-                SELECT
-                    pgl.team,
-                    opp_pl.throws,
-                    {season_year} AS season_year,
-                    %s AS span_days,
-                    DATE_SUB(CURDATE(), INTERVAL %s DAY) AS start_date,
-                    CURDATE() AS end_date,
-                    COUNT(*) AS games_played,
-
-                    SUM(COALESCE(pgl.ab, 0)) AS ab,
-                    SUM(COALESCE(pgl.h, 0)) AS hits,
-                    SUM(COALESCE(pgl.doubles, 0)) AS doubles,
-                    SUM(COALESCE(pgl.triples, 0)) AS triples,
-                    SUM(COALESCE(pgl.hr, 0)) AS hr,
-                    SUM(COALESCE(pgl.rbi, 0)) AS rbi,
-                    SUM(COALESCE(pgl.r, 0)) AS runs,
-                    SUM(COALESCE(pgl.sb, 0)) AS sb,
-                    SUM(COALESCE(pgl.bb, 0)) AS bb,
-                    SUM(COALESCE(pgl.k, 0)) AS k,
-                    SUM(COALESCE(pgl.sac_flies, 0)) AS sac_flies,
-                    SUM(COALESCE(pgl.hit_by_pitch, 0)) AS hbp,
-                    SUM(COALESCE(pgl.ground_into_dp, 0)) AS ground_into_dp,
-
-                    ROUND(SUM(pgl.h) / NULLIF(SUM(pgl.ab), 0), 3) AS avg,
-                    ROUND((SUM(pgl.h) + SUM(pgl.bb) + SUM(pgl.hit_by_pitch)) / NULLIF(SUM(pgl.ab) + SUM(pgl.bb) + SUM(pgl.hit_by_pitch) + SUM(pgl.sac_flies), 0), 3) AS obp,
-                    ROUND(SUM(pgl.total_bases) / NULLIF(SUM(pgl.ab), 0), 3) AS slg,
-                    ROUND(
-                        (SUM(pgl.h) + SUM(pgl.bb) + SUM(pgl.hit_by_pitch)) / NULLIF(SUM(pgl.ab) + SUM(pgl.bb) + SUM(pgl.hit_by_pitch) + SUM(pgl.sac_flies), 0)
-                        + (SUM(pgl.total_bases) / NULLIF(SUM(pgl.ab), 0)),
-                        3
-                    ) AS ops,
-                    ROUND(SUM(pgl.k) / NULLIF(SUM(pgl.ab + pgl.bb + pgl.hit_by_pitch + pgl.sac_flies), 0), 3) AS so_rate,
-                    ROUND(SUM(pgl.bb) / NULLIF(SUM(pgl.ab + pgl.bb + pgl.hit_by_pitch + pgl.sac_flies), 0), 3) AS bb_rate
-
-                FROM {PlayerGameLogs.GAME_LOGS_TABLE} AS pgl
-                LEFT JOIN {GamePitchers.GAME_PITCHERS_TABLE} AS gp ON pgl.game_id = gp.game_id
-                LEFT JOIN {PlayerLookups.LOOKUP_TABLE} AS opp_pl ON (
-                    (pgl.is_home = 1 AND opp_pl.player_id = gp.away_pitcher_id AND opp_pl.position = 'P')
-                    OR
-                    (pgl.is_home = 0 AND opp_pl.player_id = gp.home_pitcher_id AND opp_pl.position = 'P')
-                )
-                WHERE pgl.game_date >= DATE_SUB(CURDATE(), INTERVAL %s DAY)
-                    AND pgl.season_year = {season_year}
-                    AND pgl.position = 'B'
-                    AND opp_pl.throws IN ('L', 'R')
-                GROUP BY pgl.team, opp_pl.throws;
+                INSERT INTO {table_name} ({', '.join(insert_keys)})
+                VALUES ({', '.join(['%s'] * len(insert_keys))})
             """
-            params = (window, window, window)
-            self.execute_query(insert_query, params)
-
-
-
+            logger.info(f"Inserting {len(rows)} rows into {table_name}")
+            self.batch_upsert(insert_query, rows)
+
+    def get_team_vs_splits_game_logs(self, season_year, max_window):
+        """Batter game logs for the largest window, tagged with the batter's and the opposing starter's hand"""
+        query = f"""
+            SELECT
+                DATEDIFF(CURDATE(), pgl.game_date) AS days_ago,
+                pgl.team,
+                pgl.opponent,
+                bat_pl.bats,
+                opp_pl.throws,
+                COALESCE(pgl.ab, 0) AS ab,
+                COALESCE(pgl.h, 0) AS hits,
+                COALESCE(pgl.doubles, 0) AS doubles,
+                COALESCE(pgl.triples, 0) AS triples,
+                COALESCE(pgl.hr, 0) AS hr,
+                COALESCE(pgl.rbi, 0) AS rbi,
+                COALESCE(pgl.r, 0) AS runs,
+                COALESCE(pgl.sb, 0) AS sb,
+                COALESCE(pgl.bb, 0) AS bb,
+                COALESCE(pgl.k, 0) AS k,
+                COALESCE(pgl.sac_flies, 0) AS sac_flies,
+                COALESCE(pgl.hit_by_pitch, 0) AS hbp,
+                COALESCE(pgl.ground_into_dp, 0) AS ground_into_dp,
+                COALESCE(pgl.total_bases, 0) AS total_bases
+            FROM {PlayerGameLogs.GAME_LOGS_TABLE} AS pgl
+            LEFT JOIN {PlayerLookups.LOOKUP_TABLE} AS bat_pl ON pgl.player_id = bat_pl.player_id AND (pgl.position <=> bat_pl.position)
+            LEFT JOIN {GamePitchers.GAME_PITCHERS_TABLE} AS gp ON pgl.game_id = gp.game_id
+            LEFT JOIN {PlayerLookups.LOOKUP_TABLE} AS opp_pl ON opp_pl.position = 'P' AND opp_pl.player_id = (
+                CASE WHEN pgl.is_home = 1 THEN gp.away_pitcher_id WHEN pgl.is_home = 0 THEN gp.home_pitcher_id END
+            )
+            WHERE pgl.game_date >= DATE_SUB(CURDATE(), INTERVAL %s DAY)
+                AND pgl.season_year = %s
+                AND pgl.position = 'B'
+        """
+        return self.get_query(query, (max_window, season_year))
+
+    def aggregate_team_vs_splits(self, game_logs, team_key, hand_key, season_year, window, start_date, end_date):
+        """Group one window of batter logs by (team, hand) and return insert rows ordered as TEAM_VS_SPLITS_KEYS"""
+        hand_logs = game_logs[game_logs[hand_key].isin(['L', 'R'])]
+        if hand_logs.empty:
+            return []
+        grouped = hand_logs.groupby([team_key, hand_key])
+        totals = grouped[self.TEAM_VS_SPLITS_SUM_KEYS + ['total_bases']].sum()
+        totals['games_played'] = grouped.size()
+        totals = totals.join(self.compute_split_rates(totals))
+
+        rows = []
+        for (team, hand), split in totals.iterrows():
+            rows.append((
+                team, hand, season_year, window, start_date, end_date, int(split['games_played']),
+                *[int(split[key]) for key in self.TEAM_VS_SPLITS_SUM_KEYS],
+                *[None if pd.isna(split[key]) else float(split[key]) for key in self.TEAM_VS_SPLITS_RATE_KEYS],
+            ))
+        return rows
+
+    @staticmethod
+    def compute_split_rates(totals):
+        """avg/obp/slg/ops/so_rate/bb_rate from summed counting stats; None where the denominator is zero"""
+        ab = totals['ab'].replace(0, np.nan)
+        pa = (totals['ab'] + totals['bb'] + totals['hbp'] + totals['sac_flies']).replace(0, np.nan)
+        obp = (totals['hits'] + totals['bb'] + totals['hbp']) / pa
+        slg = totals['total_bases'] / ab
+        return pd.DataFrame({
+            'avg': (totals['hits'] / ab).round(3),
+            'obp': obp.round(3),
+            'slg': slg.round(3),
+            'ops': (obp + slg).round(3),
+            'so_rate': (totals['k'] / pa).round(3),
+            'bb_rate': (totals['bb'] / pa).round(3),
+        }, index=totals.index)
@@ -1,6 +1,6 @@
 from models.db_recorder import DB_Recorder
 from utils.logger import logger
-from collections import defaultdict
+from collections import defaultdict, deque
 from datetime import datetime
 
 class TeamPitchingRotations(DB_Recorder):
@@ -13,27 +13,24 @@ class TeamPitchingRotations(DB_Recorder):
         self.probable_pitchers_table = probable_pitchers_table_name
         self.player_lookups_table = player_lookups_table_name
         self.game_pitchers_table = game_pitchers_table_name
+        # team -> deque of (player_id, espn_pitcher_id, normalised_name), rotated so the next projected starter is first
         self.team_rotations_full = None
-        self.team_rotations_names = None
-        self.projected_pitcher_count = None
+        # team -> {normalised_name: slot in rotation order}
+        self.team_rotation_slots = None
         self.new_probable_pitchers = None
 
     def rotations_exist_for_team(self, team: str) -> bool:
         return team in self.team_rotations_full
 
     def infer_next_pitcher_in_rotation(self, team):
-        rotation = self.team_rotations_full.get(team, [])
+        rotation = self.team_rotations_full.get(team)
         if not rotation:
             return None
 
-        index = self.projected_pitcher_count[team] % len(rotation)
-        pitcher = rotation[index]
-        self.increment_projected_pitcher_count(team)
+        pitcher = rotation[0]
+        rotation.rotate(-1)
         return pitcher
 
-    def increment_projected_pitcher_count(self, team: str):
-        self.projected_pitcher_count[team] += 1
-
     def get_new_probable_pitchers(self):
         return {(game['game_date'], game['team']) for game in self.new_probable_pitchers}
 
@@ -46,43 +43,34 @@ class TeamPitchingRotations(DB_Recorder):
         # Merge historical games with confirmed future games to build complete rotation picture
         merged_games = self.merge_game_lists(self.new_probable_pitchers, recent_games)
         
-        self.team_rotations_full, self.team_rotations_names = self.get_team_rotations_from_recent_games(merged_games)
-        self.initialise_projected_pitcher_count()
+        self.team_rotations_full, self.team_rotation_slots = self.get_team_rotations_from_recent_games(merged_games)
+        self.initialise_projected_pitchers()
         logger.info(f"Built rotations for {len(self.team_rotations_full)} teams")
 
-    def initialise_projected_pitcher_count(self):
-        logger.info("Initialising projected pitcher count")
-        projected_pitcher_count = defaultdict(int)
-        teams_with_rotations = set(self.team_rotations_full.keys())
+    def initialise_projected_pitchers(self):
+        """Rotate each team's rotation so the pitcher after its last confirmed starter comes up next"""
+        logger.info("Initialising projected pitchers")
+        last_confirmed_pitchers = self.get_last_confirmed_pitchers()
 
-        # For each team, find the last confirmed pitcher and determine next position in rotation
-        for team in teams_with_rotations:
-            rotation = self.team_rotations_names[team]
-            if not rotation:
-                continue
-                
-            # Get the most recent confirmed game for this team (data already sorted by date DESC)
-            team_confirmed_games = [game for game in self.new_probable_pitchers 
-                                  if game['team'] == team]
-            
-            if team_confirmed_games:
-                # First game is the most recent since data is already sorted DESC
-                last_confirmed_pitcher_name = team_confirmed_games[0]['normalised_name']
-                
-                # Find this pitcher's position in the rotation
-                try:
-                    last_pitcher_index = rotation.index(last_confirmed_pitcher_name)
-                    # Next pitcher should be at the next index in rotation
-                    projected_pitcher_count[team] = (last_pitcher_index + 1) % len(rotation)
-                except ValueError:
-                    # If the last confirmed pitcher isn't in our rotation, start from beginning
-                    logger.warning(f"Last confirmed pitcher {last_confirmed_pitcher_name} for team {team} not found in rotation {rotation}")
-                    projected_pitcher_count[team] = 0
-            else:
+        for team, rotation in self.team_rotations_full.items():
+            last_confirmed_pitcher_name = last_confirmed_pitchers.get(team)
+            if last_confirmed_pitcher_name is None:
                 # No confirmed games, start from beginning of rotation
-                projected_pitcher_count[team] = 0
-        
-        self.projected_pitcher_count = projected_pitcher_count
+                continue
+
+            slot = self.team_rotation_slots[team].get(last_confirmed_pitcher_name)
+            if slot is None:
+                # If the last confirmed pitcher isn't in our rotation, start from beginning
+                logger.warning(f"Last confirmed pitcher {last_confirmed_pitcher_name} for team {team} not found in rotation {list(self.team_rotation_slots[team])}")
+                continue
+            rotation.rotate(-(slot + 1))
+
+    def get_last_confirmed_pitchers(self):
+        """Most recent confirmed starter per team, in one pass (data already sorted by date DESC)"""
+        last_confirmed_pitchers = {}
+        for game in self.new_probable_pitchers:
+            last_confirmed_pitchers.setdefault(game['team'], game['normalised_name'])
+        return last_confirmed_pitchers
 
     def get_probable_pitchers_after_date(self, start_date):
         records = self.get_records_with_conditions(self.probable_pitchers_table, [start_date], ['team', 'player_id', 'espn_pitcher_id', 'normalised_name', 'game_date'], ['game_date >= %s', "accuracy = 'confirmed'"], ['game_date DESC'])
@@ -102,40 +90,36 @@ class TeamPitchingRotations(DB_Recorder):
         return self.get_query(query)[0]['latest_complete_game_date']
 
     def get_team_rotations_from_recent_games(self, recent_games):
-        team_rotations_full = defaultdict(list)
-        team_rotations_names = defaultdict(list)
+        team_rotations_full = defaultdict(deque)
         seen_pitchers = defaultdict(set)
-        completed_teams = set()
         
-        # Group games by team and build rotations
+        # Group games by team in one pass; games arrive most recent first
         for game in recent_games:
             team = game['team']
-            
-            # Skip if we've already completed this team's rotation
-            if team in completed_teams:
+            rotation = team_rotations_full[team]
+            if len(rotation) == self.MAX_PITCHERS_IN_ROTATION:
                 continue
-            
+
             pitcher = (game['player_id'], game['espn_pitcher_id'], game['normalised_name'])
             # Skip if we've already seen this pitcher for this team
             if pitcher[2] in seen_pitchers[team]:
                 continue
-            
-            # Add pitcher to rotation (insert at beginning to reverse chronological order)
-            team_rotations_full[team].insert(0, pitcher)
-            team_rotations_names[team].insert(0, pitcher[2])
+
+            # Prepend so the rotation reads in chronological order
+            rotation.appendleft(pitcher)
             seen_pitchers[team].add(pitcher[2])
 
-            if len(team_rotations_full[team]) == self.MAX_PITCHERS_IN_ROTATION:
-                logger.info(f"Team {team} rotation complete: {team_rotations_names[team]} ({len(team_rotations_full[team])} pitchers)")
-                completed_teams.add(team)
-        
-        # Log teams that didn't complete their rotation
-        for team in team_rotations_full:
-            if team not in completed_teams:
-                logger.warning(f"Team {team} rotation incomplete: {team_rotations_names[team]} ({len(team_rotations_full[team])} pitchers) - may need more recent games")
+        team_rotation_slots = {}
+        for team, rotation in team_rotations_full.items():
+            team_rotation_slots[team] = {pitcher[2]: slot for slot, pitcher in enumerate(rotation)}
+            names = list(team_rotation_slots[team])
+            if len(rotation) == self.MAX_PITCHERS_IN_ROTATION:
+                logger.info(f"Team {team} rotation complete: {names} ({len(rotation)} pitchers)")
+            else:
+                logger.warning(f"Team {team} rotation incomplete: {names} ({len(rotation)} pitchers) - may need more recent games")
         
         logger.info(f"Built rotations for {len(team_rotations_full)} teams")
-        return team_rotations_full, team_rotations_names
+        return dict(team_rotations_full), team_rotation_slots
 
     def get_team_last_pitchers(self):
         logger.info("Gathering recent pitchers for each team")
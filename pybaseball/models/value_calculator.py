@@ -1,15 +1,15 @@
 from abc import ABC, abstractmethod
 import pandas as pd
-from typing import Tuple
+from typing import Dict
 
 class ValueCalculator(ABC):
     @abstractmethod
-    def calculate_player_values(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def calculate_player_values(self) -> Dict[str, object]:
         """
-        Calculates the player values for the given player.
-        Returns a tuple of two DataFrames:
-        - The first DataFrame contains the player values per stat.
-        - The second DataFrame contains the player total values.
+        Calculates the player values for the loaded player stats.
+        Returns a dict with:
+        - "total_values_df": the player total values.
+        - "zscore_values": the per-stat values, whose components_df() returns one row per player and stat.
         """
         pass
 
@@ -68,7 +68,7 @@ class YahooPlayerHydrator(DB_Recorder):
         Flow: (1) consolidate duplicates by Yahoo suffix, (2) sync player_lookup from
         players (source of truth) so yahoo_player_id and team are current, (3) fill
         missing player_id in players from lookup by yahoo_player_id then by
-        normalised_name+mlb_team+position.
+        normalised_name+mlb_team+position, resolved in memory.
         """
         logger.info("Consolidating duplicate players by Yahoo suffix")
         self.consolidate_duplicate_players_by_yahoo_suffix()
@@ -79,17 +79,41 @@ class YahooPlayerHydrator(DB_Recorder):
             team_column_in_players='mlb_team',
         )
 
-        logger.info("Updating player IDs from lookup by yahoo_player_id")
-        self.player_lookups.update_player_ids_from_lookup_by_yahoo(
-            self.PLAYER_TABLE_NAME,
-            yahoo_id_column='yahoo_player_id',
-        )
-        logger.info("Updating player IDs from lookup by normalised_name, mlb_team, position")
-        self.player_lookups.update_player_ids_from_lookup(
-            self.PLAYER_TABLE_NAME,
-            {'mlb_team': 'team', 'position': 'position'},
-            unique_group_columns=['normalised_name', 'mlb_team', 'position'],
+        logger.info("Updating player IDs from lookup by yahoo_player_id, then normalised_name, mlb_team, position")
+        self.key_players_from_lookup()
+
+    def key_players_from_lookup(self):
+        """
+        Set player_id on players rows that lack one. (yahoo_player_id, position) matches first; otherwise
+        (normalised_name, mlb_team, position) when it names exactly one lookup, and only for the oldest
+        unkeyed row of that group. A (player_id, position) already held by another players row is never reused.
+        """
+        self.player_lookups.consolidate_duplicate_players()
+        resolver = self.player_lookups.identity_resolver
+        players = self.get_records_with_conditions(
+            self.PLAYER_TABLE_NAME, None,
+            ['id', 'player_id', 'yahoo_player_id', 'normalised_name', 'mlb_team', 'position'],
+            order_by=['id'],
         )
+        taken = {(player['player_id'], player['position']) for player in players if player['player_id'] is not None}
+        unkeyed = [player for player in players if player['player_id'] is None]
+        first_in_group = {}
+        for player in unkeyed:
+            first_in_group.setdefault((player['normalised_name'], player['mlb_team'], player['position']), player['id'])
+
+        updates = []
+        for player in unkeyed:
+            position = player['position']
+            lookup = resolver.get_by_id('yahoo_player_id', player['yahoo_player_id'], position)
+            if lookup is None and first_in_group[(player['normalised_name'], player['mlb_team'], position)] == player['id']:
+                lookup = resolver.resolve(position, normalised_name=player['normalised_name'], team=player['mlb_team'])
+            if lookup is None or (lookup['player_id'], position) in taken:
+                continue
+            taken.add((lookup['player_id'], position))
+            updates.append((player['id'], lookup['player_id']))
+
+        logger.info(f"Keying {len(updates)} of {len(unkeyed)} players without a player_id")
+        self.bulk_update(self.PLAYER_TABLE_NAME, 'id', 'INT', {'player_id': 'INT'}, updates)
 
     def consolidate_duplicate_players_by_yahoo_suffix(self):
         """
@@ -1,23 +1,51 @@
 from models.db_recorder import DB_Recorder
+import threading
 import time
 from datetime import datetime
 
 class YahooToken(DB_Recorder):
+    """
+    Process-wide Yahoo OAuth token. The stored token is read from the tokens table once per process and kept in
+    memory with its parsed expiry; refreshes are single-flight, so concurrent requesters wait for one refresh
+    instead of each starting their own, and the table is only written when the token actually changed.
+    """
     MIN_REFRESH_SECONDS = 60 * 2 # 2 minutes before expiry
     TABLE_NAME = 'tokens'
 
+    # Shared by every instance in the process
+    cached_token = None
+    cached_expiry_timestamp = 0
+    token_loaded = False
+    cache_lock = threading.Lock()
+    refresh_lock = threading.Lock()
+
     def __init__(self, conn):
         super().__init__(conn)
-        self.stored_token = self.get_stored_token()
+        with self.cache_lock:
+            if not YahooToken.token_loaded:
+                self.cache_token(self.get_stored_token())
+                YahooToken.token_loaded = True
 
-    def get_expiry_timestamp(self):
-        if not self.stored_token:
+    @property
+    def stored_token(self):
+        return YahooToken.cached_token
+
+    @classmethod
+    def cache_token(cls, token):
+        cls.cached_token = token
+        cls.cached_expiry_timestamp = cls.parse_expiry_timestamp(token)
+
+    @staticmethod
+    def parse_expiry_timestamp(token):
+        if not token:
             return 0
-        expiry = self.stored_token.get('yahoo_token_expires_at')
+        expiry = token.get('yahoo_token_expires_at')
         if expiry is None:
             return 0
         try:
-            # Handle both datetime strings and Unix timestamps
+            # Handle datetimes from the connector, datetime strings and Unix timestamps
+            if isinstance(expiry, datetime):
+                return expiry.timestamp()
             if isinstance(expiry, str):
                 # Convert MySQL datetime string to Unix timestamp
                 dt = datetime.strptime(expiry, '%Y-%m-%d %H:%M:%S')
@@ -28,11 +56,13 @@ class YahooToken(DB_Recorder):
         except (ValueError, TypeError):
             return 0
 
+    def get_expiry_timestamp(self):
+        return YahooToken.cached_expiry_timestamp
+
     def has_valid_token(self):
         if not self.stored_token:
             return False
-        expiry_timestamp = self.get_expiry_timestamp()
-        return expiry_timestamp > time.time()
+        return self.get_expiry_timestamp() > time.time()
 
     def should_refresh_token(self):
         if not self.stored_token:
@@ -44,6 +74,19 @@ class YahooToken(DB_Recorder):
     def get_token(self):
         return self.stored_token
 
+    def refresh_once(self, stale_token, request_new_token):
+        """
+        Single-flight refresh. stale_token is the token the caller found expired or rejected; if another thread
+        has already replaced it by the time the lock is held, that token is returned without another refresh.
+        """
+        with self.refresh_lock:
+            current_token = self.stored_token
+            if current_token is not stale_token and current_token is not None and not self.should_refresh_token():
+                return current_token
+            new_token = request_new_token(current_token)
+            self.set_token(new_token)
+            return new_token
+
     def get_stored_token(self):
         token = self.get_one(self.TABLE_NAME, ['id = 1'])
         if not token:
@@ -55,8 +98,11 @@ class YahooToken(DB_Recorder):
         }
 
     def set_token(self, token_data):
-        token = {
-            'id': 1,
-        } | token_data
-        self.upsert_one(self.TABLE_NAME, token, ['id'])
-        self.stored_token = token_data
\ No newline at end of file
+        with self.cache_lock:
+            if token_data == self.stored_token:
+                return
+            token = {
+                'id': 1,
+            } | token_data
+            self.upsert_one(self.TABLE_NAME, token, ['id'])
+            self.cache_token(token_data)
@@ -6,6 +6,58 @@ import numpy as np
 from utils.logger import logger
 
 
+class CategoryValueMatrix:
+    """
+    Per-category z-scores for one player group as (players × categories) arrays.
+    Columns follow the order the group's categories were enabled in; the long-format frame is only built on request.
+    """
+    def __init__(self, player_pks: np.ndarray, category_codes: List[str], projections: np.ndarray, zscores: np.ndarray, weights: np.ndarray):
+        self.player_pks = player_pks
+        self.category_codes = category_codes
+        self.projections = projections
+        self.zscores = zscores
+        self.weighted_values = zscores * weights
+
+    def total_values(self) -> np.ndarray:
+        return self.weighted_values.sum(axis=1)
+
+
+class ZScoreValues:
+    """Result of ZScoreCalculator: a value matrix per player group, with totals and the long-format components"""
+    def __init__(self, matrices: List[CategoryValueMatrix], component_order: List[tuple]):
+        self.matrices = matrices
+        # (matrix index, column index) per enabled category, in scoring category order
+        self.component_order = component_order
+        self._components_df = None
+        self._total_values_df = None
+
+    def total_values_df(self) -> pd.DataFrame:
+        if self._total_values_df is None:
+            matrices = [matrix for matrix in self.matrices if matrix.category_codes]
+            player_pks = np.concatenate([matrix.player_pks for matrix in matrices])
+            total_values = np.concatenate([matrix.total_values() for matrix in matrices])
+            # A player can appear in both groups (or twice in one); totals are summed per player_pk
+            self._total_values_df = (
+                pd.DataFrame({"player_pk": player_pks, "total_value": total_values})
+                .groupby("player_pk", as_index=False)["total_value"]
+                .sum()
+            )
+        return self._total_values_df
+
+    def components_df(self) -> pd.DataFrame:
+        """One row per (player, category): player_pk, category_code, projection_value, zscore, weighted_value"""
+        if self._components_df is None:
+            blocks = [(self.matrices[matrix_index], column) for matrix_index, column in self.component_order]
+            self._components_df = pd.DataFrame({
+                "player_pk": np.concatenate([matrix.player_pks for matrix, _ in blocks]),
+                "category_code": np.concatenate([np.full(len(matrix.player_pks), matrix.category_codes[column], dtype=object) for matrix, column in blocks]),
+                "projection_value": np.concatenate([matrix.projections[:, column] for matrix, column in blocks]),
+                "zscore": np.concatenate([matrix.zscores[:, column] for matrix, column in blocks]),
+                "weighted_value": np.concatenate([matrix.weighted_values[:, column] for matrix, column in blocks]),
+            })
+        return self._components_df
+
+
 class ZScoreCalculator(ValueCalculator):
     DEFAULT_LEAGUE_AVG = 0.250;
     DEFAULT_LEAGUE_ERA = 4.20;
@@ -18,131 +70,93 @@ class ZScoreCalculator(ValueCalculator):
         "SB": ("proj_SB", False),
         # AVG handled separately as impact
     }
-    
+
     CATEGORY_MAP_PITCHER = {
         "K": ("proj_K", False),
         "QS": ("proj_QS", False),
         "SVH": ("proj_SVH", False),
         # ERA/WHIP handled separately as impact
     }
-    
+
+    # Rate categories: z-scored on playing-time weighted impact, shown as the projected rate
+    IMPACT_CATEGORIES_HITTER = {"AVG": "proj_AVG"}
+    IMPACT_CATEGORIES_PITCHER = {"ERA": "proj_ERA", "WHIP": "proj_WHIP"}
+
     def __init__(self, scoring_categories: List[CategoryConfig]):
         self.scoring_categories = scoring_categories
         self.hitters_stats_df = None
         self.pitchers_stats_df = None
 
-    def calculate_player_values(self) -> Dict[str, pd.DataFrame]:
+    def calculate_player_values(self) -> Dict[str, object]:
+        """
+        Returns a dict with:
+            - "total_values_df": player_pk, total_value (sum of weighted z-scores).
+            - "zscore_values": ZScoreValues, whose components_df() builds the per-category rows when they are needed.
+        """
+        hitters = self.hitters_stats_df
+        pitchers = self.pitchers_stats_df
+
         # Baselines for impact metrics
-        league_avg_avg = self.weighted_mean(self.hitters_stats_df["proj_AVG"], self.hitters_stats_df["proj_AB"], self.DEFAULT_LEAGUE_AVG)
-        league_avg_era = self.weighted_mean(self.pitchers_stats_df["proj_ERA"], self.pitchers_stats_df["proj_IP"], self.DEFAULT_LEAGUE_ERA)
-        league_avg_whip = self.weighted_mean(self.pitchers_stats_df["proj_WHIP"], self.pitchers_stats_df["proj_IP"], self.DEFAULT_LEAGUE_WHIP)
-        # logger.info(f"League average AVG: {league_avg_avg}, ERA: {league_avg_era}, WHIP: {league_avg_whip}")
-        
-        weighted_values_per_stat = []
-
-        # Precompute impact series
-        if not self.hitters_stats_df.empty:
-            self.hitters_stats_df = self.hitters_stats_df.copy()
-            self.hitters_stats_df["AVG_IMPACT"] = (self.hitters_stats_df["proj_AVG"].astype(float) - league_avg_avg) * self.hitters_stats_df["proj_AB"].astype(float)
-        if not self.pitchers_stats_df.empty:
-            self.pitchers_stats_df = self.pitchers_stats_df.copy()
-            self.pitchers_stats_df["ERA_IMPACT"] = (league_avg_era - self.pitchers_stats_df["proj_ERA"].astype(float)) * self.pitchers_stats_df["proj_IP"].astype(float)
-            self.pitchers_stats_df["WHIP_IMPACT"] = (league_avg_whip - self.pitchers_stats_df["proj_WHIP"].astype(float)) * self.pitchers_stats_df["proj_IP"].astype(float)
-
-        # Compute z-scores and weighted values for each enabled category
+        league_avg_avg = self.weighted_mean(hitters["proj_AVG"], hitters["proj_AB"], self.DEFAULT_LEAGUE_AVG)
+        league_avg_era = self.weighted_mean(pitchers["proj_ERA"], pitchers["proj_IP"], self.DEFAULT_LEAGUE_ERA)
+        league_avg_whip = self.weighted_mean(pitchers["proj_WHIP"], pitchers["proj_IP"], self.DEFAULT_LEAGUE_WHIP)
+
+        hitter_categories = []
+        pitcher_categories = []
+        component_order = []
         for category in self.scoring_categories:
             code = category.code.upper()
-            weight = float(category.weight)
-
-            if category.group == "hitter":
-                if code == "AVG":
-                    series = self.hitters_stats_df["AVG_IMPACT"].fillna(0.0) if not self.hitters_stats_df.empty else pd.Series(dtype=float)
-                    z = self.zscore(series) if not series.empty else series
-                    tmp = pd.DataFrame({
-                        "player_pk": self.hitters_stats_df["player_pk"],
-                        "category_code": "AVG",
-                        "projection_value": self.hitters_stats_df["proj_AVG"].astype(float),  # show rate in UI
-                        "zscore": z.astype(float),
-                        "weighted_value": (z * weight).astype(float),
-                    })
-                    weighted_values_per_stat.append(tmp)
-
-                elif code in self.CATEGORY_MAP_HITTER:
-                    col, _ = self.CATEGORY_MAP_HITTER[code]
-                    series = self.hitters_stats_df[col].fillna(0.0) if not self.hitters_stats_df.empty else pd.Series(dtype=float)
-                    z = self.zscore(series) if not series.empty else series
-                    tmp = pd.DataFrame({
-                        "player_pk": self.hitters_stats_df["player_pk"],
-                        "category_code": code,
-                        "projection_value": self.hitters_stats_df[col].astype(float),
-                        "zscore": z.astype(float),
-                        "weighted_value": (z * weight).astype(float),
-                    })
-                    weighted_values_per_stat.append(tmp)
-
-            elif category.group == "pitcher":
-                if code == "ERA":
-                    series = self.pitchers_stats_df["ERA_IMPACT"].fillna(0.0) if not self.pitchers_stats_df.empty else pd.Series(dtype=float)
-                    z = self.zscore(series) if not series.empty else series
-                    tmp = pd.DataFrame({
-                        "player_pk": self.pitchers_stats_df["player_pk"],
-                        "category_code": "ERA",
-                        "projection_value": self.pitchers_stats_df["proj_ERA"].astype(float),
-                        "zscore": z.astype(float),
-                        "weighted_value": (z * weight).astype(float),
-                    })
-                    weighted_values_per_stat.append(tmp)
-
-                elif code == "WHIP":
-                    series = self.pitchers_stats_df["WHIP_IMPACT"].fillna(0.0) if not self.pitchers_stats_df.empty else pd.Series(dtype=float)
-                    z = self.zscore(series) if not series.empty else series
-                    tmp = pd.DataFrame({
-                        "player_pk": self.pitchers_stats_df["player_pk"],
-                        "category_code": "WHIP",
-                        "projection_value": self.pitchers_stats_df["proj_WHIP"].astype(float),
-                        "zscore": z.astype(float),
-                        "weighted_value": (z * weight).astype(float),
-                    })
-                    weighted_values_per_stat.append(tmp)
-
-                elif code in self.CATEGORY_MAP_PITCHER:
-                    col, _ = self.CATEGORY_MAP_PITCHER[code]
-                    series = self.pitchers_stats_df[col].fillna(0.0) if not self.pitchers_stats_df.empty else pd.Series(dtype=float)
-                    z = self.zscore(series) if not series.empty else series
-                    tmp = pd.DataFrame({
-                        "player_pk": self.pitchers_stats_df["player_pk"],
-                        "category_code": code,
-                        "projection_value": self.pitchers_stats_df[col].astype(float),
-                        "zscore": z.astype(float),
-                        "weighted_value": (z * weight).astype(float),
-                    })
-                    weighted_values_per_stat.append(tmp)
-
-        if not weighted_values_per_stat:
+            if category.group == "hitter" and (code in self.IMPACT_CATEGORIES_HITTER or code in self.CATEGORY_MAP_HITTER):
+                component_order.append((0, len(hitter_categories)))
+                hitter_categories.append((code, float(category.weight)))
+            elif category.group == "pitcher" and (code in self.IMPACT_CATEGORIES_PITCHER or code in self.CATEGORY_MAP_PITCHER):
+                component_order.append((1, len(pitcher_categories)))
+                pitcher_categories.append((code, float(category.weight)))
+
+        if not component_order:
             raise RuntimeError("No scoring category components produced. Check league_scoring_categories config.")
 
-        weighted_values_per_stat_df = pd.concat(weighted_values_per_stat, ignore_index=True)
-
-        total_values_df = (
-            weighted_values_per_stat_df.groupby("player_pk", as_index=False)["weighted_value"]
-            .sum()
-            .rename(columns={"weighted_value": "total_value"})
-        )
+        hitter_impacts = {
+            "AVG": lambda frame: (self.column(frame, "proj_AVG") - league_avg_avg) * self.column(frame, "proj_AB"),
+        }
+        pitcher_impacts = {
+            "ERA": lambda frame: (league_avg_era - self.column(frame, "proj_ERA")) * self.column(frame, "proj_IP"),
+            "WHIP": lambda frame: (league_avg_whip - self.column(frame, "proj_WHIP")) * self.column(frame, "proj_IP"),
+        }
+        values = ZScoreValues([
+            self.build_matrix(hitters, hitter_categories, self.CATEGORY_MAP_HITTER, self.IMPACT_CATEGORIES_HITTER, hitter_impacts),
+            self.build_matrix(pitchers, pitcher_categories, self.CATEGORY_MAP_PITCHER, self.IMPACT_CATEGORIES_PITCHER, pitcher_impacts),
+        ], component_order)
 
         return {
-            "weighted_values_per_stat_df": weighted_values_per_stat_df,
-            "total_values_df": total_values_df
+            "total_values_df": values.total_values_df(),
+            "zscore_values": values,
         }
 
-    def safe_std(self, series: pd.Series) -> float:
-        std = float(series.std(ddof=0))
-        return std if std > 1e-12 else 1.0
-
-
-    def zscore(self, series: pd.Series) -> pd.Series:
-        mu = float(series.mean())
-        sd = self.safe_std(series)
-        return (series - mu) / sd
+    def build_matrix(self, frame: pd.DataFrame, categories: List[tuple], category_map: dict, impact_categories: dict, impacts: dict) -> CategoryValueMatrix:
+        """Stack the group's category inputs into one float matrix and z-score every column at once"""
+        codes = [code for code, _ in categories]
+        weights = np.array([weight for _, weight in categories], dtype=float)
+        player_count = len(frame)
+        if not codes or player_count == 0:
+            empty = np.empty((player_count, len(codes)), dtype=float)
+            return CategoryValueMatrix(frame["player_pk"].to_numpy(), codes, empty, empty, weights)
+
+        projection_columns = [impact_categories[code] if code in impact_categories else category_map[code][0] for code in codes]
+        projections = np.column_stack([self.column(frame, column) for column in projection_columns])
+        # Counting stats are z-scored as projected; rate stats on their impact
+        inputs = np.column_stack([impacts[code](frame) if code in impacts else projections[:, i] for i, code in enumerate(codes)])
+        inputs = np.where(np.isnan(inputs), 0.0, inputs)
+
+        means = inputs.mean(axis=0)
+        stds = inputs.std(axis=0)
+        stds = np.where(stds > 1e-12, stds, 1.0)
+        zscores = (inputs - means) / stds
+        return CategoryValueMatrix(frame["player_pk"].to_numpy(), codes, projections, zscores, weights)
+
+    @staticmethod
+    def column(frame: pd.DataFrame, column: str) -> np.ndarray:
+        return frame[column].astype(float).to_numpy()
 
     def weighted_mean(self, value: pd.Series, weight: pd.Series, default: float) -> float:
         v = pd.to_numeric(value, errors="coerce")
@@ -150,4 +164,4 @@ class ZScoreCalculator(ValueCalculator):
         mask = v.notna() & (w > 0)
         if mask.sum() == 0:
             return default
-        return float((v[mask] * w[mask]).sum() / w[mask].sum())
\ No newline at end of file
+        return float((v[mask] * w[mask]).sum() / w[mask].sum())
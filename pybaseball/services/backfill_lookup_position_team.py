@@ -15,6 +15,7 @@ from models.api.mlb_api import MlbApi
 from models.player_lookups import PlayerLookups
 from utils.constants import MLB_TEAM_IDS_REVERSE_MAP
 from utils.logger import logger
+from utils.run_metrics import run_metrics
 
 
 def main():
@@ -56,12 +57,11 @@ def main():
             logger.warning("No people data returned from MLB API")
             return
 
-        updated = 0
+        updates = []
         for person in people:
             pid = person.get("id")
             if pid is None or pid not in id_by_player_id:
                 continue
-            lookup_id = id_by_player_id[pid]
 
             primary = person.get("primaryPosition") or {}
             abbr = (primary.get("abbreviation") or "").strip().upper()
@@ -74,27 +74,17 @@ def main():
                 if team_id is not None:
                     team = MLB_TEAM_IDS_REVERSE_MAP.get(team_id)
 
-            cursor = conn.cursor()
-            cursor.execute(
-                f"""
-                UPDATE {lookups.LOOKUP_TABLE}
-                SET position = COALESCE(position, %s), team = COALESCE(team, %s)
-                WHERE id = %s
-                """,
-                (position, team, lookup_id),
-            )
-            if cursor.rowcount:
-                updated += 1
-                logger.debug(
-                    "Updated lookup id=%s player_id=%s -> position=%s team=%s",
-                    lookup_id,
-                    pid,
-                    position,
-                    team,
-                )
-            cursor.close()
-
-        conn.commit()
+            updates.append((id_by_player_id[pid], position, team))
+
+        # Existing position/team values are never overwritten
+        updated = lookups.bulk_update(
+            lookups.LOOKUP_TABLE,
+            "id",
+            "INT",
+            {"position": "VARCHAR(10)", "team": "VARCHAR(10)"},
+            updates,
+            coalesce_columns=("position", "team"),
+        )
         logger.info(
             "Backfill complete: updated %s of %s player_lookup rows (one per player_id)",
             updated,
@@ -106,6 +96,7 @@ def main():
         logger.exception("Error backfilling lookup position/team: %s", e)
         raise
     finally:
+        run_metrics.log_summary("http.")
         if conn:
             conn.close()
             logger.info("Database connection closed.")
@@ -0,0 +1,47 @@
+import argparse
+
+from models.db import get_db_connection
+from models.player_data_loader import PlayerDataLoader
+from models.player_value_snapshots import PlayerValueSnapshots
+from utils.constants import SNAPSHOT_CHECKPOINT_DAYS
+from utils.logger import logger
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Materialize full player value snapshot checkpoints.")
+    parser.add_argument(
+        "--every-days",
+        type=int,
+        default=SNAPSHOT_CHECKPOINT_DAYS,
+        metavar="DAYS",
+        help=f"Checkpoint slices whose latest snapshot is at least this many days past their last checkpoint (default: {SNAPSHOT_CHECKPOINT_DAYS}).",
+    )
+    parser.add_argument("--dry-run", action="store_true", default=False, help="Dry run — do not write to DB.")
+    return parser.parse_args()
+
+
+def main(every_days: int = SNAPSHOT_CHECKPOINT_DAYS, dry_run: bool = False):
+    conn = None
+    try:
+        conn = get_db_connection()
+        loader = PlayerDataLoader(conn, logger, dry_run=dry_run)
+        snapshots = PlayerValueSnapshots(conn, loader)
+
+        due = snapshots.get_slices_due_for_checkpoint(every_days)
+        logger.info(f"{len(due)} snapshot slices due for a checkpoint")
+        for model_id, span_days, split_type, latest_date in due:
+            snapshots.checkpoint(model_id, span_days, split_type, latest_date)
+
+    except Exception as e:
+        logger.exception(f"Error checkpointing player value snapshots: {e}")
+        raise
+    finally:
+        if conn:
+            conn.close()
+            logger.info("Database connection closed.")
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    logger.info(f"Checkpointing player value snapshots every {args.every_days} days with dry_run={args.dry_run}")
+    main(every_days=args.every_days, dry_run=args.dry_run)
@@ -13,6 +13,7 @@ from models.zscore_calculator import ZScoreCalculator
 from models.projections import Projections
 from models.risk_scorer import RiskScorer
 from models.player_value_calculator import PlayerValueCalculator
+from models.player_value_snapshots import PlayerValueSnapshots
 
 
 def parse_args():
@@ -35,6 +36,7 @@ def main(dry_run: bool = False, season_year=None):
     try:
         conn = get_db_connection()
         loader = PlayerDataLoader(conn, logger, dry_run=dry_run)
+        snapshots = PlayerValueSnapshots(conn, loader)
 
         league: LeagueSettings = loader.load_league_settings()
         models: List[ModelConfig] = loader.load_models_for_league(league.league_id)
@@ -95,9 +97,8 @@ def main(dry_run: bool = False, season_year=None):
                     player_value_totals_df = calculated_values["player_value_totals_df"]
                     player_value_components_df = calculated_values["player_value_components_df"]
 
-                    # Persist
-                    loader.upsert_snapshot_totals(as_of, model.model_id, span, split, player_value_totals_df)
-                    loader.upsert_snapshot_components(as_of, model.model_id, span, split, player_value_components_df)
+                    # Persist only the players whose values changed since the previous snapshot
+                    snapshots.write_snapshot(as_of, model.model_id, span, split, player_value_totals_df, player_value_components_df)
 
                     # Pre-aggregate league team totals by category and position
                     category_totals_df = calculated_values["category_totals_df"]
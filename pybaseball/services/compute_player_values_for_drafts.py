@@ -5,6 +5,7 @@ from utils.logger import logger
 from models.player_data_loader import PlayerDataLoader
 from models.zscore_calculator import ZScoreCalculator
 from models.player_value_calculator import PlayerValueCalculator
+from models.auction_simulator import AuctionSimulator
 from models.projections import Projections
 from models.risk_scorer import RiskScorer
 from models.player_data_loader import LeagueSettings, ModelConfig, CategoryConfig
@@ -33,6 +34,7 @@ def main(dry_run: bool = False):
         season_stats: pd.DataFrame = draft_data_loader.load_player_season_stats()
 
         risk_scorer = RiskScorer()
+        auction_simulator = AuctionSimulator()
         calculators = {
             'zscore': ZScoreCalculator(scoring_categories)
         }
@@ -57,7 +59,7 @@ def main(dry_run: bool = False):
             pitcher_projections = projections.get_pitcher_projections(pitcher_rolling_stats, pitcher_advanced_rolling_stats, model.pitcher_span_days)
 
             calculator.set_player_stats(hitter_projections, pitcher_projections)
-            player_value_calculator = PlayerValueCalculator(calculator, league, roster_slots, players, hitter_projections, pitcher_projections)
+            player_value_calculator = PlayerValueCalculator(calculator, league, roster_slots, players, hitter_projections, pitcher_projections, auction_simulator)
             calculated_values = player_value_calculator.get_player_dollar_values()
             player_values_df = calculated_values["player_values_df"]
             player_value_components_df = calculated_values["player_value_components_df"]
@@ -10,12 +10,14 @@ from models.team_game_logs import TeamGameLogs
 from models.league_game_logs import LeagueGameLogs
 from models.game_pitchers import GamePitchers
 from models.league_statistics import LeagueStatistics
+from models.matchup_features import MatchupFeatures
 from models.rolling_stats.player_basic_rolling_stats import PlayerBasicRollingStats
 from models.rolling_stats.player_advanced_rolling_stats import PlayerAdvancedRollingStats
 from models.rolling_stats.team_rolling_stats import TeamRollingStats
 from models.rolling_stats.rolling_stats_percentiles import RollingStatsPercentiles
 from utils.constants import CURRENT_SEASON
 from utils.logger import logger
+from utils.run_metrics import run_metrics
 
 
 def parse_args():
@@ -42,13 +44,13 @@ def main(force=False, season_year=None):
         player_hydrator = PlayerHydrator(conn, mlb_api, sync_status, PlayerLookups(conn))
 
         rolling_stats_percentiles = RollingStatsPercentiles(conn)
+        league_statistics = LeagueStatistics(conn)
         player_basic_rolling_stats = PlayerBasicRollingStats(conn, rolling_stats_percentiles)
-        player_advanced_rolling_stats = PlayerAdvancedRollingStats(conn, rolling_stats_percentiles)
+        player_advanced_rolling_stats = PlayerAdvancedRollingStats(conn, rolling_stats_percentiles, league_statistics)
         team_rolling_stats = TeamRollingStats(conn, rolling_stats_percentiles)
         player_game_log = PlayerGameLogs(conn, player_basic_rolling_stats, player_advanced_rolling_stats)
         team_game_log = TeamGameLogs(conn, team_rolling_stats)
         game_pitchers = GamePitchers(conn)
-        league_statistics = LeagueStatistics(conn)
         league_game_log = LeagueGameLogs(mlb_api, player_game_log, team_game_log, game_pitchers, league_statistics)
 
         logger.info(f"Starting rolling stats computation for season {season_year}...")
@@ -57,9 +59,11 @@ def main(force=False, season_year=None):
         logger.info("Computing rolling stats...")
         league_game_log.compute_rolling_stats(season_year)
         logger.info("Rolling stats computation complete.")
+        MatchupFeatures(conn, sync_status).refresh_features(season_year)
     except Exception as e:
         logger.exception("Error computing rolling stats")
     finally:
+        run_metrics.log_summary("http.")
         if conn:
             conn.close()
             logger.info("Database connection closed.")
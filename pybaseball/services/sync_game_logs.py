@@ -10,14 +10,18 @@ from models.player_game_logs import PlayerGameLogs
 from models.team_game_logs import TeamGameLogs
 from models.league_game_logs import LeagueGameLogs
 from models.game_pitchers import GamePitchers
+from models.season_game_logs_backfill import SeasonGameLogsBackfill
+from models.game_log_partitions import GameLogPartitions
 from utils.constants import MAX_AGE_DAYS, CURRENT_SEASON
 from utils.logger import logger
+from utils.run_metrics import run_metrics
 
 
 def parse_args():
     parser = argparse.ArgumentParser(
         description="Sync game logs from MLB Stats API. By default syncs recent logs (and purges old ones). "
-        "Use --end-date to backfill a 30-day window ending on that date (purges all existing game logs first)."
+        "Use --end-date to backfill a 30-day window ending on that date (purges all existing game logs first). "
+        "Use --season-backfill to rebuild a full season into the archive tables in parallel date chunks."
     )
     parser.add_argument(
         "--end-date",
@@ -26,6 +30,13 @@ def parse_args():
         default=None,
         help="End date for a 30-day backfill window (e.g. last day of last season). When set, purges all existing game logs, then upserts only (end_date - 30 days) through end_date.",
     )
+    parser.add_argument(
+        "--season-backfill",
+        type=int,
+        metavar="YEAR",
+        default=None,
+        help="Backfill every game of the given season into the season archive tables (player_game_logs_archive, team_game_logs_archive, game_pitchers_archive), split into date chunks processed by parallel worker processes. Live game logs and their retention are untouched. Exits non-zero if any chunk fails.",
+    )
     parser.add_argument(
         "--season",
         type=int,
@@ -44,6 +55,15 @@ def main():
         mlb_api = MlbApi()
         player_hydrator = PlayerHydrator(conn, mlb_api, SyncStatus(conn), PlayerLookups(conn))
         league_game_logs = LeagueGameLogs(mlb_api, PlayerGameLogs(conn), TeamGameLogs(conn), GamePitchers(conn))
+        GameLogPartitions(conn).maintain_partitions()
+
+        if args.season_backfill:
+            logger.info("Starting full season game logs backfill for %s...", args.season_backfill)
+            game_ids = SeasonGameLogsBackfill(args.season_backfill).run()
+            TeamGameLogs(conn, archive=True).update_advanced_statistics(game_ids)
+            player_hydrator.update_table_from_lookup(PlayerGameLogs.ARCHIVE_TABLE)
+            logger.info("Season game logs backfill complete.")
+            return
 
         if args.end_date:
             end = datetime.strptime(args.end_date, "%Y-%m-%d").date()
@@ -65,7 +85,11 @@ def main():
         logger.info("Game logs sync complete.")
     except Exception as e:
         logger.exception("Error syncing game logs: %s", e)
+        if args.season_backfill:
+            # A partially written season must not look like a successful rebuild
+            raise
     finally:
+        run_metrics.log_summary("http.")
         if conn:
             conn.close()
             logger.info("Database connection closed.")
@@ -4,38 +4,44 @@ from models.api.espn_api import EspnApi
 from models.api.mlb_api import MlbApi
 from models.probable_pitchers import ProbablePitchers
 from models.game_pitchers import GamePitchers
+from models.game_log_partitions import GameLogPartitions
 from models.player_lookups import PlayerLookups
 from models.player_hydrator import PlayerHydrator
 from models.sync_status import SyncStatus
 from models.team_pitching_rotations import TeamPitchingRotations
 from models.qs_score_calculator import QSScoreCalculator
 from models.nrfi_score_calculator import NRFIScoreCalculator
+from models.matchup_features import MatchupFeatures
 from utils.logger import logger
+from utils.run_metrics import run_metrics
 
 def main(force=False):
     conn = None
     try:
         conn = get_db_connection()
         mlb_api = MlbApi()
-        player_hydrator = PlayerHydrator(conn, mlb_api, SyncStatus(conn), PlayerLookups(conn))
+        sync_status = SyncStatus(conn)
+        player_lookups = PlayerLookups(conn)
+        player_hydrator = PlayerHydrator(conn, mlb_api, sync_status, player_lookups)
         team_pitching_rotations = TeamPitchingRotations(conn, ProbablePitchers.PROBABLE_PITCHERS_TABLE, PlayerLookups.LOOKUP_TABLE, GamePitchers.GAME_PITCHERS_TABLE)
         qs_score_calculator = QSScoreCalculator(conn)
         nrfi_score_calculator = NRFIScoreCalculator(conn)
-        probable_pitchers = ProbablePitchers(conn, EspnApi(), mlb_api, team_pitching_rotations)
+        probable_pitchers = ProbablePitchers(conn, EspnApi(), mlb_api, team_pitching_rotations, player_lookups)
 
         logger.info("Starting probable pitchers sync...")
+        GameLogPartitions(conn).maintain_partitions()
         probable_pitchers.purge_old_probable_pitchers()
         probable_pitchers.purge_all_projected_pitchers()
 
         player_hydrator.hydrate_players(force)
         player_hydrator.update_active_team_rosters(force)
 
+        # Rows are keyed from player_lookup as they are written
         probable_pitchers.upsert_all_probable_pitchers()
-        player_hydrator.update_table_from_lookup(ProbablePitchers.PROBABLE_PITCHERS_TABLE)
-        
         probable_pitchers.infer_projected_probable_pitchers()
-        player_hydrator.update_table_from_lookup(ProbablePitchers.PROBABLE_PITCHERS_TABLE)
 
+        # No-op unless the rolling or percentile tables changed since the last build
+        MatchupFeatures(conn, sync_status).refresh_features()
         qs_score_calculator.update_probables_qs_scores()
         nrfi_score_calculator.update_probables_nrfi_scores()
 
@@ -43,6 +49,7 @@ def main(force=False):
     except Exception as e:
         logger.exception(f"Error syncing probable pitchers: {e}")
     finally:
+        run_metrics.log_summary("http.")
         if conn:
             conn.close()
             logger.info("Database connection closed.")
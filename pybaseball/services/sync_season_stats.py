@@ -1,18 +1,17 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from models.db import get_db_connection
 from models.api.fangraphs_api import FangraphsApi
-from models.api.mlb_api import MlbApi
 from models.fangraphs_stats import FangraphsStats
 from models.api.savant_api import SavantApi
 from models.savant_stats import SavantStats
 from models.player_lookups import PlayerLookups
-from models.player_hydrator import PlayerHydrator
 from models.rolling_stats.player_season_stats_percentiles import PlayerSeasonStatsPercentiles
 from models.rolling_stats.team_season_stats_percentiles import TeamSeasonStatsPercentiles
 from models.season_stats import SeasonStats
-from models.sync_status import SyncStatus
 from utils.constants import CURRENT_SEASON
 from utils.logger import logger
+from utils.run_metrics import run_metrics
 
 
 def parse_args():
@@ -27,29 +26,47 @@ def parse_args():
     return parser.parse_args()
 
 
+def get_download_result(future, source):
+    try:
+        return future.result()
+    except Exception as e:
+        logger.error(f"Error downloading {source}: {e}")
+        return None
+
+
 def main(season_year=None):
     if season_year is None:
         season_year = CURRENT_SEASON
     conn = None
     try:
         conn = get_db_connection()
-        sync_status = SyncStatus(conn)
         player_lookups = PlayerLookups(conn)
-        player_hydrator = PlayerHydrator(conn, MlbApi(), sync_status, player_lookups)
         fangraphs_stats = FangraphsStats(conn, FangraphsApi(), player_lookups)
-        savant_stats = SavantStats(conn, SavantApi())
+        savant_stats = SavantStats(conn, SavantApi(), player_lookups)
 
         logger.info(f"Starting season stats sync for {season_year}...")
-        # Deduplicate: merge (name, position) pairs with exactly two rows and one lookup row
-        for table in (SeasonStats.PLAYER_STATS_TABLE, SeasonStats.PLAYER_STATS_TABLE + "_percentiles"):
-            player_lookups.update_player_names_from_lookup(table, matching_conditions=['position'])
-            player_lookups.consolidate_duplicate_season_stats(table)
-        fangraphs_stats.update_all_player_stats(season_year)
-        fangraphs_stats.update_all_team_stats(season_year)
-        logger.info("Hydrating Fangraphs player stats...")
-        player_hydrator.update_table_from_lookup(SeasonStats.PLAYER_STATS_TABLE)
-        logger.info("Updating statcast player stats...")
-        savant_stats.update_all_statcast_player_stats(season_year)
+        fangraphs_downloads = fangraphs_stats.get_source_downloads()
+        savant_downloads = savant_stats.get_source_downloads()
+        # Every source download starts now; the writes below still happen in dependency order
+        with ThreadPoolExecutor(max_workers=len(fangraphs_downloads) + len(savant_downloads)) as executor:
+            fangraphs_futures = {executor.submit(download): source for source, download in fangraphs_downloads.items()}
+            savant_futures = {executor.submit(download): source for source, download in savant_downloads.items()}
+
+            # Deduplicate: merge (name, position) pairs with exactly two rows and one lookup row
+            for table in (SeasonStats.PLAYER_STATS_TABLE, SeasonStats.PLAYER_STATS_TABLE + "_percentiles"):
+                player_lookups.update_player_names_from_lookup(table, matching_conditions=['position'])
+                player_lookups.consolidate_duplicate_season_stats(table)
+
+            logger.info(f"Updating Fangraphs season stats for {season_year}...")
+            for future in as_completed(fangraphs_futures):
+                source = fangraphs_futures[future]
+                fangraphs_stats.upsert_source(source, get_download_result(future, source), season_year)
+
+            # Savant merges on (player_id, position), so it runs after every Fangraphs row is keyed
+            logger.info("Updating statcast player stats...")
+            for future in as_completed(savant_futures):
+                source = savant_futures[future]
+                savant_stats.upsert_source(source, get_download_result(future, source), season_year)
 
         logger.info("Computing season stats percentiles...")
         player_season_stats_percentiles = PlayerSeasonStatsPercentiles(conn)
@@ -61,6 +78,7 @@ def main(season_year=None):
     except Exception as e:
         logger.exception("Error syncing season stats: %s", e)
     finally:
+        run_metrics.log_summary("http.")
         if conn:
             conn.close()
             logger.info("Database connection closed.")
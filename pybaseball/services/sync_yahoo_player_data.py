@@ -6,6 +6,7 @@ from models.yahoo_player_hydrator import YahooPlayerHydrator
 from models.sync_status import SyncStatus
 from models.player_lookups import PlayerLookups
 from utils.logger import logger
+from utils.run_metrics import run_metrics
 
 def main(force: bool=False):
     conn = None
@@ -24,6 +25,7 @@ def main(force: bool=False):
         logger.exception("Error syncing Yahoo player data: {e}")
         sync_status.set_sync_status(YahooPlayerHydrator.HYDRATE_ALL_YAHOO_PLAYERS_SYNC_NAME, 'error', str(e))
     finally:
+        run_metrics.log_summary("http.")
         if conn:
             conn.close()
             logger.info("Database connection closed.")
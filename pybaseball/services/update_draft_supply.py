@@ -0,0 +1,90 @@
+import argparse
+import time
+from typing import List
+
+import pandas as pd
+
+from models.db import get_db_connection
+from models.db_recorder import DB_Recorder
+from models.player_data_loader import PlayerDataLoader, LeagueSettings, ModelConfig
+from models.supply_calculator import (
+    DraftSupplyEngine,
+    load_player_values,
+    load_taken_player_pks,
+    upsert_supply_tables_for_draft,
+)
+from utils.logger import logger
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Keep draft supply tables current while a draft is live.")
+    parser.add_argument("--draft-id", type=int, required=True, help="Draft to maintain supply for.")
+    parser.add_argument("--follow", action="store_true", default=False, help="Keep polling for picks instead of exiting after the first write.")
+    parser.add_argument("--interval", type=float, default=2.0, metavar="SECONDS", help="Polling interval with --follow (default: 2).")
+    parser.add_argument("--dry-run", action="store_true", default=False, help="Dry run — do not write to DB.")
+    return parser.parse_args()
+
+
+def main(draft_id: int, follow: bool = False, interval: float = 2.0, dry_run: bool = False):
+    conn = None
+    try:
+        conn = get_db_connection()
+        db_recorder = DB_Recorder(conn)
+        draft_data_loader = PlayerDataLoader(conn, logger, dry_run=dry_run)
+
+        league: LeagueSettings = draft_data_loader.load_league_settings()
+        roster_slots: pd.DataFrame = draft_data_loader.load_roster_slots_for_league(league.league_id)
+        models: List[ModelConfig] = draft_data_loader.load_models_for_league(league.league_id)
+
+        taken = load_taken_player_pks(db_recorder, draft_id)
+        engines = []
+        for model in models:
+            if model.split_type != "overall":
+                continue
+            engine = DraftSupplyEngine(
+                draft_id=draft_id,
+                model_id=model.model_id,
+                team_count=league.team_count,
+                roster_slots_df=roster_slots,
+                player_values_df=load_player_values(db_recorder, model.model_id),
+                taken_player_pks=taken,
+            )
+            replacement_df, supply_df, tier_supply_df = engine.to_frames()
+            upsert_supply_tables_for_draft(
+                db_recorder,
+                draft_id=draft_id,
+                model_id=model.model_id,
+                replacement_df=replacement_df,
+                supply_df=supply_df,
+                tier_supply_df=tier_supply_df,
+                dry_run=dry_run,
+            )
+            engines.append(engine)
+            logger.info(f"Wrote supply for draft {draft_id} model {model.name} with {len(taken)} players taken")
+
+        while follow:
+            time.sleep(interval)
+            latest_taken = load_taken_player_pks(db_recorder, draft_id)
+            if latest_taken == taken:
+                continue
+            logger.info(f"Draft {draft_id}: {len(latest_taken - taken)} picks, {len(taken - latest_taken)} undone")
+            for engine in engines:
+                engine.sync_taken(latest_taken)
+                engine.flush_changes(db_recorder, dry_run=dry_run)
+            taken = latest_taken
+
+    except KeyboardInterrupt:
+        logger.info(f"Stopped following draft {draft_id}")
+    except Exception as e:
+        logger.exception(f"Error updating draft supply: {e}")
+        raise
+    finally:
+        if conn:
+            conn.close()
+            logger.info("Database connection closed.")
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    logger.info(f"Updating draft supply for draft {args.draft_id} with follow={args.follow}, dry_run={args.dry_run}")
+    main(draft_id=args.draft_id, follow=args.follow, interval=args.interval, dry_run=args.dry_run)
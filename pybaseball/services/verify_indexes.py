@@ -0,0 +1,40 @@
+import argparse
+from models.db import get_db_connection
+from models.query_indexes import QueryIndexes
+from utils.constants import CURRENT_SEASON
+from utils.logger import logger
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Verify the indexes the rolling, split, percentile and score queries rely on.")
+    parser.add_argument("--create", action="store_true", default=False, help="Create any missing indexes instead of only reporting them.")
+    parser.add_argument(
+        "--season",
+        type=int,
+        metavar="YEAR",
+        default=CURRENT_SEASON,
+        help=f"Season year used for the EXPLAIN probes (default: {CURRENT_SEASON}).",
+    )
+    return parser.parse_args()
+
+
+def main(create=False, season_year=None):
+    conn = None
+    try:
+        conn = get_db_connection()
+        query_indexes = QueryIndexes(conn)
+
+        logger.info("Starting index verification...")
+        query_indexes.verify_indexes(create_missing=create)
+        query_indexes.check_query_plans(season_year)
+        logger.info("Index verification complete.")
+    except Exception as e:
+        logger.exception("Error verifying indexes: %s", e)
+    finally:
+        if conn:
+            conn.close()
+            logger.info("Database connection closed.")
+
+if __name__ == "__main__":
+    args = parse_args()
+    main(create=args.create, season_year=args.season)
@@ -5,6 +5,7 @@ from utils.sync_status import update_sync_status
 from utils.constants import CURRENT_SEASON
 
 SCRIPTS = [
+    "verify_indexes.py",
     "sync_game_logs.py",
     "compute_stats_from_game_logs.py",
     "sync_season_stats.py",
@@ -16,6 +17,7 @@ SCRIPTS = [
 
 # Scripts that accept --season argument
 SEASON_FLAG_SCRIPTS = [
+    "verify_indexes.py",
     "sync_game_logs.py",
     "compute_stats_from_game_logs.py",
     "sync_season_stats.py",
@@ -26,6 +28,12 @@ SEASON_FLAG_SCRIPTS = [
 def parse_args():
     parser = argparse.ArgumentParser(description="Run all sync scripts.")
     parser.add_argument("--force", action="store_true", default=False, help="Force re-hydration of player data.")
+    parser.add_argument(
+        "--create-indexes",
+        action="store_true",
+        default=False,
+        help="Let verify_indexes.py create missing indexes (default: report only).",
+    )
     parser.add_argument(
         "--season",
         type=int,
@@ -53,6 +61,8 @@ def main():
             ]
             if (force_flag and script in force_flag_scripts):
                 cmd.extend(["--force"])
+            if script == "verify_indexes.py" and args.create_indexes:
+                cmd.extend(["--create"])
             if script in SEASON_FLAG_SCRIPTS:
                 cmd.extend(["--season", str(season_year)])
 
@@ -1,7 +1,29 @@
 ROLLING_WINDOWS = [7, 14, 30]
 MAX_AGE_DAYS = 30
+SNAPSHOT_CHECKPOINT_DAYS = 14 # Days of player value snapshot deltas between full checkpoints
 BUFFER_DAYS = 7
 BATCH_SIZE = 500
+SEASON_BACKFILL_CHUNK_DAYS = 14
+SEASON_BACKFILL_WORKERS = 4
+GAME_LOG_PARTITION_DAYS = 7 # 1 for daily partitions, 7 for weekly (Monday-aligned)
+GAME_LOG_FUTURE_PARTITION_DAYS = 28
+MLB_ROSTER_FETCH_WORKERS = 8
+MLB_PLAYER_INFO_WORKERS = 4
+YAHOO_PAGE_WORKERS = 4
+AUCTION_SIMULATIONS = 10000
+AUCTION_SIMULATION_WORKERS = 1 # >1 shards simulations across processes
+# Per-host limits for the shared HTTP transport (models/api/http_client.py)
+HTTP_POOL_MAXSIZE = 10
+HTTP_DEFAULT_HOST_POLICY = {'requests_per_second': 5, 'burst': 2, 'failure_threshold': 5, 'reset_seconds': 60}
+HTTP_HOST_POLICIES = {
+    'statsapi.mlb.com': {'requests_per_second': 10, 'burst': 5},
+    'baseballsavant.mlb.com': {'requests_per_second': 1, 'burst': 1},
+    'www.fangraphs.com': {'requests_per_second': 1, 'burst': 1},
+    'fantasysports.yahooapis.com': {'requests_per_second': 2, 'burst': 2},
+    'api.login.yahoo.com': {'requests_per_second': 1, 'burst': 1},
+    'site.api.espn.com': {'requests_per_second': 2, 'burst': 2},
+}
+MLB_ROSTER_CACHE_TTL_HOURS = 6
 # MLB team IDs for the 30 MLB teams
 MLB_TEAM_IDS = {
     'NYY': 147, 'BOS': 111, 'TOR': 141, 'BAL': 110, 'TB': 139,
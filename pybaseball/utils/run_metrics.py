@@ -0,0 +1,41 @@
+import threading
+from collections import defaultdict
+from utils.logger import logger
+
+class RunMetrics:
+    """Thread-safe counters and timings collected over one sync run."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = defaultdict(int)
+        self.timings = defaultdict(list)
+
+    def increment(self, name: str, value: int = 1):
+        with self.lock:
+            self.counters[name] += value
+
+    def record_timing(self, name: str, seconds: float):
+        with self.lock:
+            self.timings[name].append(seconds)
+
+    def summary(self) -> dict:
+        with self.lock:
+            summary = dict(self.counters)
+            for name, values in self.timings.items():
+                ordered = sorted(values)
+                summary[name] = {
+                    'count': len(ordered),
+                    'total_s': round(sum(ordered), 3),
+                    'mean_s': round(sum(ordered) / len(ordered), 3),
+                    'p95_s': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+                    'max_s': round(ordered[-1], 3),
+                }
+            return summary
+
+    def log_summary(self, prefix: str = ''):
+        """Log the metrics whose name starts with prefix"""
+        for name, value in sorted(self.summary().items()):
+            if name.startswith(prefix):
+                logger.info(f"Run metric {name}: {value}")
+
+run_metrics = RunMetrics()